@@ -28,6 +28,7 @@ class SimulationTime:
         self._current_datetime = start_datetime
         self._ticks_elapsed = 0
         self._rng_seed = rng_seed
+        self._current_iso: Optional[str] = None  # Cached ISO string for the current tick
         
     @property
     def current_datetime(self) -> datetime:
@@ -52,8 +53,27 @@ class SimulationTime:
         """
         self._current_datetime += timedelta(hours=1)
         self._ticks_elapsed += 1
+        self._current_iso = None
         return self._current_datetime
     
+    def isoformat(self, dt: datetime) -> str:
+        """Format a datetime as an ISO string, cached for the current tick.
+        
+        Several systems format the same tick datetime when saving; the string
+        is built once per tick. Other datetimes are formatted directly.
+        
+        Args:
+            dt: Datetime to format
+            
+        Returns:
+            ISO format datetime string
+        """
+        if dt != self._current_datetime:
+            return dt.isoformat()
+        if self._current_iso is None:
+            self._current_iso = dt.isoformat()
+        return self._current_iso
+    
     def get_year(self) -> int:
         """Get the current simulation year."""
         return self._current_datetime.year
@@ -6,7 +6,7 @@ fully reconstructible from SQLite alone.
 
 import random
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 
 from src.core.time import SimulationTime
 from src.models.resource import Resource
@@ -65,6 +65,18 @@ class WorldState:
         
         # Entities: entity_id -> Entity instance
         self._entities: Dict[str, Entity] = {}
+        
+        # Component index: component_type -> {entity_id: component}
+        # (maintained incrementally as entities and components change)
+        self._components_by_type: Dict[str, Dict[str, Component]] = {}
+        
+        # Bumped whenever entities are added/removed or components attached/detached
+        self._entity_version: int = 0
+        
+        # query_entities_by_component() results per component type, valid
+        # while _entity_version is unchanged (shared by systems in a tick)
+        self._entity_query_cache: Dict[str, List[Entity]] = {}
+        self._entity_query_version: int = -1
     
     def register_system(self, system: System) -> None:
         """Register a system with the world state.
@@ -270,6 +282,7 @@ class WorldState:
         if entity.entity_id in self._entities:
             raise ValueError(f"Entity {entity.entity_id} already exists")
         self._entities[entity.entity_id] = entity
+        self._track_entity(entity)
         return entity
     
     def add_entity(self, entity: Entity) -> None:
@@ -284,6 +297,7 @@ class WorldState:
         if entity.entity_id in self._entities:
             raise ValueError(f"Entity {entity.entity_id} already exists")
         self._entities[entity.entity_id] = entity
+        self._track_entity(entity)
     
     def get_entity(self, entity_id: str) -> Optional[Entity]:
         """Get an entity by ID.
@@ -305,7 +319,30 @@ class WorldState:
         Returns:
             Removed Entity instance or None if not found
         """
-        return self._entities.pop(entity_id, None)
+        entity = self._entities.pop(entity_id, None)
+        if entity is not None:
+            self._untrack_entity(entity)
+        return entity
+    
+    def get_entity_count(self) -> int:
+        """Get the number of entities without copying the entity registry.
+        
+        Returns:
+            Number of entities in the world state
+        """
+        return len(self._entities)
+    
+    def get_entity_version(self) -> int:
+        """Get a counter that changes whenever the entity population changes.
+        
+        The counter is bumped when entities are added or removed and when
+        components are attached to or detached from tracked entities. It does
+        not track changes to component fields.
+        
+        Returns:
+            Current entity version
+        """
+        return self._entity_version
     
     def get_all_entities(self) -> Dict[str, Entity]:
         """Get all entities.
@@ -318,16 +355,28 @@ class WorldState:
     def query_entities_by_component(self, component_type: str) -> List[Entity]:
         """Query entities that have a specific component type.
         
+        Results are cached until entities or components change, so systems
+        querying the same component type (e.g. HealthSystem and DeathSystem)
+        share one scan.
+        
         Args:
             component_type: Component type to search for
             
         Returns:
-            List of entities that have the component
+            List of entities that have the component (in entity insertion order)
         """
-        return [
-            entity for entity in self._entities.values()
-            if entity.has_component(component_type)
-        ]
+        if self._entity_query_version != self._entity_version:
+            self._entity_query_cache.clear()
+            self._entity_query_version = self._entity_version
+        
+        entities = self._entity_query_cache.get(component_type)
+        if entities is None:
+            entities = self._entity_query_cache[component_type] = [
+                entity for entity in self._entities.values()
+                if entity.has_component(component_type)
+            ]
+        # Callers get their own list (DeathSystem removes entities after iterating)
+        return entities.copy()
     
     def query_entities_by_components(self, component_types: List[str]) -> List[Entity]:
         """Query entities that have all of the specified component types.
@@ -343,6 +392,102 @@ class WorldState:
             if all(entity.has_component(comp_type) for comp_type in component_types)
         ]
     
+    def get_components_of_type(self, component_type: str) -> List[Component]:
+        """Get all components of a specific type across all entities.
+        
+        Args:
+            component_type: Component type to collect
+        
+        Returns:
+            List of components of the given type (one per entity that has it)
+        """
+        components = self._components_by_type.get(component_type)
+        if components is None:
+            return []
+        return list(components.values())
+    
+    def iter_components(self, component_type: str) -> Iterator[Component]:
+        """Iterate over all components of a specific type without copying.
+        
+        Reads the component index directly, so entities and components must
+        not be added or removed while the iterator is being consumed. Use
+        get_components_of_type() when a stable list is needed.
+        
+        Args:
+            component_type: Component type to iterate
+        
+        Returns:
+            Iterator over components of the given type
+        """
+        components = self._components_by_type.get(component_type)
+        if components is None:
+            return iter(())
+        return iter(components.values())
+    
+    def get_component_type_histogram(self) -> Dict[str, int]:
+        """Count how many entities carry each component type.
+        
+        Counts are maintained incrementally as entities are added/removed
+        and components attached/detached, so this does not scan entities.
+        
+        Returns:
+            Dictionary of component_type -> number of entities with that component
+        """
+        return {
+            component_type: len(components)
+            for component_type, components in self._components_by_type.items()
+        }
+    
+    def _on_component_change(
+        self,
+        entity_id: str,
+        component_type: str,
+        component: Optional[Component]
+    ) -> None:
+        """Update the component index when a tracked entity's components change.
+        
+        Args:
+            entity_id: Entity whose component changed
+            component_type: Component type that was added, replaced or removed
+            component: New component instance, or None when it was removed
+        """
+        self._entity_version += 1
+        by_type = self._components_by_type
+        components = by_type.get(component_type)
+        if component is not None:
+            if components is None:
+                by_type[component_type] = {entity_id: component}
+            else:
+                components[entity_id] = component
+        elif components is not None:
+            components.pop(entity_id, None)
+            if not components:
+                del by_type[component_type]
+    
+    def _track_entity(self, entity: Entity) -> None:
+        """Start tracking an entity's components in the component index.
+        
+        Args:
+            entity: Entity that was added to the world state
+        """
+        entity_id = entity.entity_id
+        for comp_type, component in entity._components.items():
+            self._on_component_change(entity_id, comp_type, component)
+        entity._component_listener = self._on_component_change
+        self._entity_version += 1
+    
+    def _untrack_entity(self, entity: Entity) -> None:
+        """Stop tracking an entity's components in the component index.
+        
+        Args:
+            entity: Entity that was removed from the world state
+        """
+        entity._component_listener = None
+        entity_id = entity.entity_id
+        for comp_type in entity.get_component_types():
+            self._on_component_change(entity_id, comp_type, None)
+        self._entity_version += 1
+    
     def to_dict(self) -> Dict[str, Any]:
         """Serialize world state to dictionary.
         
@@ -395,7 +540,7 @@ class WorldState:
         # Restore entities
         for entity_data in data.get('entities', {}).values():
             entity = Entity.from_dict(entity_data)
-            world_state._entities[entity.entity_id] = entity
+            world_state.add_entity(entity)
         
         # Restore systems (if registry provided)
         if systems_registry:
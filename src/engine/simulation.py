@@ -851,11 +851,12 @@ class Simulation:
             trend_arrow = "↑" if trend == "improving" else "↓" if trend == "declining" else "→"
             logger.info("")
             logger.info(f"  World Health: {health_score:.3f} {trend_arrow} ({trend})")
-            components = world_health.get('components', {})
-            logger.info(f"    Entities: {components.get('entity_health', 0):.3f}")
-            logger.info(f"    Resources: {components.get('resource_health', 0):.3f}")
-            logger.info(f"    Population Trend: {components.get('population_trend', 0):.3f}")
-            logger.info(f"    Needs Fulfillment: {components.get('needs_fulfillment', 0):.3f}")
+            components = world_health.get('components')
+            if components is not None:
+                logger.info(f"    Entities: {components.entity_health:.3f}")
+                logger.info(f"    Resources: {components.resource_health:.3f}")
+                logger.info(f"    Population Trend: {components.population_trend:.3f}")
+                logger.info(f"    Needs Fulfillment: {components.needs_fulfillment:.3f}")
         
         logger.info("=" * 80)
         logger.info("")
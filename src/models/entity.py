@@ -5,7 +5,7 @@ multiple components attached to them.
 """
 
 import uuid
-from typing import Dict, Optional, Type, TypeVar, List, Any
+from typing import Callable, Dict, Optional, Type, TypeVar, List, Any
 
 from src.models.component import Component
 
@@ -33,6 +33,11 @@ class Entity:
             entity_id = str(uuid.uuid4())
         self.entity_id = entity_id
         self._components: Dict[str, Component] = {}
+        # Notified with (entity_id, component_type, component or None on removal)
+        # whenever a component is added, replaced or removed
+        self._component_listener: Optional[
+            Callable[[str, str, Optional[Component]], None]
+        ] = None
     
     def add_component(self, component: Component) -> None:
         """Add a component to the entity.
@@ -50,6 +55,8 @@ class Entity:
                 f"Use replace_component() to overwrite."
             )
         self._components[comp_type] = component
+        if self._component_listener is not None:
+            self._component_listener(self.entity_id, comp_type, component)
     
     def replace_component(self, component: Component) -> None:
         """Replace an existing component or add if it doesn't exist.
@@ -59,6 +66,8 @@ class Entity:
         """
         comp_type = component.__class__.component_type()
         self._components[comp_type] = component
+        if self._component_listener is not None:
+            self._component_listener(self.entity_id, comp_type, component)
     
     def remove_component(self, component_type: str) -> Optional[Component]:
         """Remove a component from the entity.
@@ -69,7 +78,10 @@ class Entity:
         Returns:
             Removed component or None if not found
         """
-        return self._components.pop(component_type, None)
+        component = self._components.pop(component_type, None)
+        if component is not None and self._component_listener is not None:
+            self._component_listener(self.entity_id, component_type, None)
+        return component
     
     def get_component(self, component_type: str) -> Optional[Component]:
         """Get a component by type.
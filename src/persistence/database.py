@@ -2,9 +2,10 @@
 
 import json
 import sqlite3
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Union
 
 from src.core.world_state import WorldState
 from src.core.time import SimulationTime
@@ -16,6 +17,277 @@ from src.systems.generics.status import StatusLevel, get_all_status_levels, calc
 from src.systems.generics.effect_type import EffectType, get_all_effect_types
 from src.systems.generics.repeat_frequency import RepeatFrequency, get_all_repeat_frequencies
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a value to a JSON string for a TEXT column.
+    
+    Uses orjson when it is installed and falls back to the stdlib encoder.
+    Both produce compact output (no whitespace after separators) so
+    history rows stay small.
+    
+    Args:
+        value: JSON-serializable value
+        
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value, separators=(',', ':'))
+
+
+def _json_loads(text: str) -> Any:
+    """Parse a JSON string read from a TEXT column.
+    
+    Args:
+        text: JSON string
+        
+    Returns:
+        Parsed value
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Range filters shared by the history getters, in bitmask order
+_HISTORY_RANGE_FILTERS = (
+    " AND tick >= ?",
+    " AND tick <= ?",
+    " AND timestamp >= ?",
+    " AND timestamp <= ?",
+    " AND tick < ?",
+    " AND (tick, id) < (?, ?)",
+)
+
+# (table, by_resource, filter mask, limited) -> SQL string
+_HISTORY_QUERY_CACHE: Dict[Tuple[str, bool, int, bool], str] = {}
+
+# Defaults for optional entity_history columns (see save_entity_history)
+_ENTITY_HISTORY_DEFAULTS = {
+    'avg_hunger': None,
+    'avg_thirst': None,
+    'avg_rest': None,
+    'avg_pressure_level': None,
+    'entities_with_pressure': 0,
+    'avg_health': None,
+    'entities_at_risk': 0,
+    'avg_age_years': None,
+    'avg_wealth': None,
+    'employed_count': 0,
+    'birth_rate': None,
+    'death_rate': None,
+}
+
+# Shared by save_resource_history and save_resource_history_many so both
+# hit the same cached prepared statement
+_INSERT_RESOURCE_HISTORY_SQL = """
+    INSERT INTO resource_history 
+    (timestamp, tick, resource_id, amount, status_id, utilization_percent)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Unfiltered history queries (the common "load everything" case)
+_FULL_HISTORY_SQL = {
+    'resource_history': "SELECT * FROM resource_history ORDER BY tick ASC, timestamp ASC, resource_id ASC",
+    'entity_history': "SELECT * FROM entity_history ORDER BY tick ASC, timestamp ASC",
+    'job_history': "SELECT * FROM job_history ORDER BY tick ASC, timestamp ASC",
+}
+
+
+def _build_history_query(
+    table: str,
+    start_tick: Optional[int],
+    end_tick: Optional[int],
+    start_datetime: Optional[str],
+    end_datetime: Optional[str],
+    resource_id: Optional[str] = None,
+    limit: Optional[int] = None,
+    before_tick: Optional[int] = None,
+    before_rowid: Optional[int] = None
+) -> Tuple[str, List[Any]]:
+    """Build (or reuse) the SQL and parameters for a history range query.
+    
+    Each combination of supplied filters maps to one SQL string, built on
+    first use and cached. Reusing the identical string also lets sqlite3's
+    statement cache skip re-preparing it.
+    
+    When limit is given the query selects the newest matching rows in
+    descending (tick, id) order (so SQLite can stop early while walking the
+    index); callers reverse the result to restore chronological order.
+    A page is continued from its oldest record with before_tick and
+    before_rowid, which stays exact when a tick has several rows.
+    
+    Args:
+        table: History table name
+        start_tick: Optional start tick (inclusive)
+        end_tick: Optional end tick (inclusive)
+        start_datetime: Optional start datetime ISO string (inclusive)
+        end_datetime: Optional end datetime ISO string (inclusive)
+        resource_id: Optional resource filter (resource_history only)
+        limit: Optional maximum number of (most recent) rows
+        before_tick: Optional page cursor, only rows with tick < before_tick
+        before_rowid: Optional id of the row the page continues from; with
+            before_tick, only rows with (tick, id) < (before_tick, before_rowid)
+        
+    Returns:
+        Tuple of (query, params)
+    
+    Raises:
+        ValueError: If before_rowid is given without before_tick
+    """
+    if before_rowid is not None and before_tick is None:
+        raise ValueError("before_rowid requires before_tick")
+    
+    if (resource_id is None and start_tick is None and end_tick is None
+            and start_datetime is None and end_datetime is None
+            and limit is None and before_tick is None):
+        return _FULL_HISTORY_SQL[table], []
+    
+    by_resource = resource_id is not None
+    limited = limit is not None
+    if before_rowid is None:
+        range_values = (start_tick, end_tick, start_datetime, end_datetime, before_tick, None)
+    else:
+        range_values = (start_tick, end_tick, start_datetime, end_datetime, None, (before_tick, before_rowid))
+    mask = 0
+    params = [resource_id] if by_resource else []
+    for bit, value in enumerate(range_values):
+        if value is not None:
+            mask |= 1 << bit
+            if isinstance(value, tuple):
+                params.extend(value)
+            else:
+                params.append(value)
+    if limited:
+        params.append(limit)
+    
+    key = (table, by_resource, mask, limited)
+    query = _HISTORY_QUERY_CACHE.get(key)
+    if query is None:
+        if by_resource:
+            query = f"SELECT * FROM {table} WHERE resource_id = ?"
+        else:
+            query = f"SELECT * FROM {table} WHERE 1=1"
+        for bit, clause in enumerate(_HISTORY_RANGE_FILTERS):
+            if mask & (1 << bit):
+                query += clause
+        if limited:
+            # Keyset order, matching the (tick, id) page cursor
+            query += " ORDER BY tick DESC, id DESC"
+        else:
+            query += " ORDER BY tick ASC, timestamp ASC"
+            if table == 'resource_history' and not by_resource:
+                query += ", resource_id ASC"
+        if limited:
+            query += " LIMIT ?"
+        _HISTORY_QUERY_CACHE[key] = query
+    
+    return query, params
+
+
+class JobHistoryRecord(Mapping):
+    """Read-only job history record that decodes its JSON columns on access.
+    
+    Plain columns are returned as stored. The JSON columns are parsed the
+    first time they are read, so callers that only inspect a few fields do
+    not pay for decoding the rest. Payment fields (avg_salary_by_job,
+    avg_payment_by_job, total_payment_by_resource) are derived together
+    from the stored payment data. Returned by get_job_history(lazy=True).
+    """
+    
+    _JSON_FIELDS = ('job_distribution', 'job_openings')
+    _PAYMENT_FIELDS = ('avg_salary_by_job', 'avg_payment_by_job', 'total_payment_by_resource')
+    
+    def __init__(self, raw: Dict[str, Any]):
+        """Initialize a record from a raw database row.
+        
+        Args:
+            raw: Row as a dictionary of column -> stored value
+        """
+        self._raw = raw
+        self._parsed: Dict[str, Any] = {}
+        self._keys = list(raw)
+        if isinstance(raw.get('avg_salary_by_job'), str):
+            self._keys.extend(('avg_payment_by_job', 'total_payment_by_resource'))
+    
+    def __getitem__(self, key: str) -> Any:
+        """Get a field, decoding it from JSON on first access."""
+        if key in self._parsed:
+            return self._parsed[key]
+        
+        if key in self._PAYMENT_FIELDS and isinstance(self._raw.get('avg_salary_by_job'), str):
+            self._parse_payment_data()
+            return self._parsed[key]
+        
+        value = self._raw[key]
+        if key in self._JSON_FIELDS and isinstance(value, str):
+            value = _json_loads(value)
+            self._parsed[key] = value
+        return value
+    
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over field names."""
+        return iter(self._keys)
+    
+    def __len__(self) -> int:
+        """Number of fields in the record."""
+        return len(self._keys)
+    
+    def _parse_payment_data(self) -> None:
+        """Decode the stored payment data into the three payment fields."""
+        payment_data = _json_loads(self._raw['avg_salary_by_job'])
+        # Handle both old format (just salary dict) and new format (payment_data dict)
+        if isinstance(payment_data, dict) and 'avg_payment_by_job' in payment_data:
+            # New format
+            avg_payment_by_job = payment_data.get('avg_payment_by_job', {})
+            self._parsed['avg_payment_by_job'] = avg_payment_by_job
+            self._parsed['total_payment_by_resource'] = payment_data.get('total_payment_by_resource', {})
+            # Extract backward compat avg_salary_by_job (money only)
+            self._parsed['avg_salary_by_job'] = {
+                job: payments.get('money', 0.0)
+                for job, payments in avg_payment_by_job.items()
+            }
+        else:
+            # Old format (just salary dict)
+            self._parsed['avg_salary_by_job'] = payment_data
+            self._parsed['avg_payment_by_job'] = {job: {'money': amt} for job, amt in payment_data.items()}
+            self._parsed['total_payment_by_resource'] = {}
+    
+    def materialize_all(self) -> Dict[str, Any]:
+        """Decode every field and return the record as a plain dictionary.
+        
+        Returns:
+            Dictionary with all JSON fields parsed
+        """
+        return {key: self[key] for key in self._keys}
+    
+    def __repr__(self) -> str:
+        """String representation of record."""
+        return f"JobHistoryRecord(tick={self._raw.get('tick')}, timestamp={self._raw.get('timestamp')})"
+
+# Connection modes: mode -> PRAGMAs applied when the connection opens.
+# 'analytics_append' suits append-only history writes: WAL with
+# synchronous=NORMAL is still crash-safe (a power loss can only drop the
+# last commits, and history is derivable), and avoids an fsync per commit.
+_CONNECTION_PRAGMAS = {
+    'default': (),
+    'analytics_append': (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA mmap_size=1073741824",
+        "PRAGMA wal_autocheckpoint=10000",
+    ),
+}
+
 
 class Database:
     """SQLite database for persisting simulation state.
@@ -27,24 +299,35 @@ class Database:
     - System registry
     """
     
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, mode: str = 'default'):
         """Initialize database connection.
         
         Args:
             db_path: Path to SQLite database file
+            mode: Connection mode - 'default' or 'analytics_append'
+                (write-tuned PRAGMAs for history systems)
+            
+        Raises:
+            ValueError: If mode is unknown
         """
+        if mode not in _CONNECTION_PRAGMAS:
+            raise ValueError(f"Unknown database mode '{mode}'")
         self.db_path = db_path
+        self.mode = mode
         self._connection: Optional[sqlite3.Connection] = None
     
     def connect(self) -> None:
         """Open database connection and create schema if needed."""
         self._connection = sqlite3.connect(self.db_path)
         self._connection.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS[self.mode]:
+            self._connection.execute(pragma)
         self._create_schema()
     
     def close(self) -> None:
-        """Close database connection."""
+        """Commit pending writes and close database connection."""
         if self._connection:
+            self._connection.commit()
             self._connection.close()
             self._connection = None
     
@@ -54,9 +337,39 @@ class Database:
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
+        """Context manager exit.
+        
+        Pending writes are committed on close; if the block raised they are
+        rolled back first, so each context is one transaction.
+        """
+        if exc_type is not None:
+            self.rollback()
         self.close()
     
+    def flush(self) -> None:
+        """Commit pending writes.
+        
+        History saves (save_*_history) do not commit individually; they are
+        committed together by flush() or when the connection is closed.
+        """
+        if self._connection:
+            self._connection.commit()
+    
+    def _begin_immediate(self) -> None:
+        """Open a write transaction up front if none is active.
+        
+        BEGIN IMMEDIATE takes the write lock before a batch starts instead of
+        upgrading a deferred transaction mid-batch. The transaction stays
+        open until flush() or close().
+        """
+        if not self._connection.in_transaction:
+            self._connection.execute("BEGIN IMMEDIATE")
+    
+    def rollback(self) -> None:
+        """Discard pending (uncommitted) writes."""
+        if self._connection:
+            self._connection.rollback()
+    
     def _create_schema(self) -> None:
         """Create database schema if it doesn't exist."""
         cursor = self._connection.cursor()
@@ -294,6 +607,16 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_resource_history_resource_id 
             ON resource_history(resource_id)
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_resource_history_rid_tick_ts 
+            ON resource_history(resource_id, tick, timestamp)
+        """)
+        # Per-resource pages order by (tick, id); the rowid implicitly ends
+        # this index, so limited queries walk it without a sort
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_resource_history_rid_tick 
+            ON resource_history(resource_id, tick)
+        """)
         
         # Entity history table (time-series data for entity metrics)
         cursor.execute("""
@@ -335,6 +658,10 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_entity_history_tick 
             ON entity_history(tick)
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_entity_history_tick_ts 
+            ON entity_history(tick, timestamp)
+        """)
         
         # Job history table (time-series data for employment statistics)
         cursor.execute("""
@@ -360,6 +687,10 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_job_history_tick 
             ON job_history(tick)
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_job_history_tick_ts 
+            ON job_history(tick, timestamp)
+        """)
         
         # Entities table
         cursor.execute("""
@@ -420,8 +751,8 @@ class Database:
         # Save resources
         cursor.execute("DELETE FROM resources")
         for resource in world_state.get_all_resources().values():
-            # Get status_id from resource
-            status_id = resource.status_id if hasattr(resource, 'status_id') else 'moderate'
+            # Resource.__init__ always sets status_id
+            status_id = resource.status_id
             cursor.execute("""
                 INSERT INTO resources 
                 (id, name, current_amount, max_capacity, replenishment_rate, finite, replenishment_frequency, status_id)
@@ -647,7 +978,7 @@ class Database:
                     continue
                 entity._components[comp_type] = component
             
-            world_state._entities[entity_id] = entity
+            world_state.add_entity(entity)
         
         # Load systems (if registry provided)
         if systems_registry:
@@ -669,6 +1000,35 @@ class Database:
         cursor.execute("SELECT COUNT(*) FROM world_state WHERE id = 1")
         return cursor.fetchone()[0] > 0
     
+    def _fetch_history_records(
+        self,
+        query: str,
+        params: List[Any],
+        newest_first: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Run a history query and return its rows as dictionaries.
+        
+        Rows are fetched as plain tuples and zipped with the column names
+        once, which is cheaper than converting each sqlite3.Row to a dict.
+        
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+            newest_first: True if the query returns rows newest first
+                (limited queries); they are reversed to chronological order
+            
+        Returns:
+            List of records as dictionaries
+        """
+        cursor = self._connection.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, params)
+        columns = tuple(column[0] for column in cursor.description)
+        rows = cursor.fetchall()
+        if newest_first:
+            rows.reverse()
+        return [dict(zip(columns, row)) for row in rows]
+    
     def save_resource_history(
         self,
         timestamp: str,
@@ -689,12 +1049,24 @@ class Database:
             utilization_percent: Utilization percentage (None if no max_capacity)
         """
         cursor = self._connection.cursor()
-        cursor.execute("""
-            INSERT INTO resource_history 
+        cursor.execute(
+            _INSERT_RESOURCE_HISTORY_SQL,
             (timestamp, tick, resource_id, amount, status_id, utilization_percent)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (timestamp, tick, resource_id, amount, status_id, utilization_percent))
-        self._connection.commit()
+        )
+    
+    def save_resource_history_many(
+        self,
+        rows: List[Tuple[str, int, str, float, str, Optional[float]]]
+    ) -> None:
+        """Save several resource history records in one statement.
+        
+        Args:
+            rows: List of (timestamp, tick, resource_id, amount, status_id,
+                utilization_percent) tuples
+        """
+        self._begin_immediate()
+        cursor = self._connection.cursor()
+        cursor.executemany(_INSERT_RESOURCE_HISTORY_SQL, rows)
     
     def get_resource_history(
         self,
@@ -702,7 +1074,10 @@ class Database:
         start_tick: Optional[int] = None,
         end_tick: Optional[int] = None,
         start_datetime: Optional[str] = None,
-        end_datetime: Optional[str] = None
+        end_datetime: Optional[str] = None,
+        limit: Optional[int] = None,
+        before_tick: Optional[int] = None,
+        before_rowid: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Get resource history for a specific resource.
         
@@ -712,37 +1087,21 @@ class Database:
             end_tick: Optional end tick (inclusive)
             start_datetime: Optional start datetime ISO string (inclusive)
             end_datetime: Optional end datetime ISO string (inclusive)
+            limit: Optional maximum number of records (the most recent ones)
+            before_tick: Optional page cursor, only records with tick < before_tick
+            before_rowid: Optional 'id' of the oldest record of the previous page;
+                with before_tick, continues exactly after it even within a tick
             
         Returns:
             List of history records as dictionaries
         """
-        cursor = self._connection.cursor()
-        
-        query = "SELECT * FROM resource_history WHERE resource_id = ?"
-        params = [resource_id]
-        
-        if start_tick is not None:
-            query += " AND tick >= ?"
-            params.append(start_tick)
-        
-        if end_tick is not None:
-            query += " AND tick <= ?"
-            params.append(end_tick)
-        
-        if start_datetime is not None:
-            query += " AND timestamp >= ?"
-            params.append(start_datetime)
-        
-        if end_datetime is not None:
-            query += " AND timestamp <= ?"
-            params.append(end_datetime)
-        
-        query += " ORDER BY tick ASC, timestamp ASC"
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        query, params = _build_history_query(
+            'resource_history', start_tick, end_tick, start_datetime, end_datetime,
+            resource_id=resource_id, limit=limit,
+            before_tick=before_tick, before_rowid=before_rowid
+        )
         
-        return [dict(row) for row in rows]
+        return self._fetch_history_records(query, params, newest_first=limit is not None)
     
     def save_entity_history(
         self,
@@ -795,14 +1154,36 @@ class Database:
             avg_rest, avg_pressure_level, entities_with_pressure, avg_health,
             entities_at_risk, avg_age_years, avg_wealth, employed_count, birth_rate, death_rate
         ))
-        self._connection.commit()
+    
+    def save_entity_history_many(self, records: List[Dict[str, Any]]) -> None:
+        """Save several entity history records in one statement.
+        
+        Args:
+            records: List of dictionaries with the same keys as the
+                save_entity_history() arguments (optional keys may be omitted)
+        """
+        self._begin_immediate()
+        cursor = self._connection.cursor()
+        cursor.executemany("""
+            INSERT INTO entity_history 
+            (timestamp, tick, total_entities, component_counts, avg_hunger, avg_thirst, 
+             avg_rest, avg_pressure_level, entities_with_pressure, avg_health, 
+             entities_at_risk, avg_age_years, avg_wealth, employed_count, birth_rate, death_rate)
+            VALUES (:timestamp, :tick, :total_entities, :component_counts, :avg_hunger, :avg_thirst,
+                    :avg_rest, :avg_pressure_level, :entities_with_pressure, :avg_health,
+                    :entities_at_risk, :avg_age_years, :avg_wealth, :employed_count,
+                    :birth_rate, :death_rate)
+        """, [{**_ENTITY_HISTORY_DEFAULTS, **record} for record in records])
     
     def get_entity_history(
         self,
         start_tick: Optional[int] = None,
         end_tick: Optional[int] = None,
         start_datetime: Optional[str] = None,
-        end_datetime: Optional[str] = None
+        end_datetime: Optional[str] = None,
+        limit: Optional[int] = None,
+        before_tick: Optional[int] = None,
+        before_rowid: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Get entity history records.
         
@@ -811,37 +1192,20 @@ class Database:
             end_tick: Optional end tick (inclusive)
             start_datetime: Optional start datetime ISO string (inclusive)
             end_datetime: Optional end datetime ISO string (inclusive)
+            limit: Optional maximum number of records (the most recent ones)
+            before_tick: Optional page cursor, only records with tick < before_tick
+            before_rowid: Optional 'id' of the oldest record of the previous page;
+                with before_tick, continues exactly after it even within a tick
             
         Returns:
             List of history records as dictionaries
         """
-        cursor = self._connection.cursor()
-        
-        query = "SELECT * FROM entity_history WHERE 1=1"
-        params = []
-        
-        if start_tick is not None:
-            query += " AND tick >= ?"
-            params.append(start_tick)
-        
-        if end_tick is not None:
-            query += " AND tick <= ?"
-            params.append(end_tick)
-        
-        if start_datetime is not None:
-            query += " AND timestamp >= ?"
-            params.append(start_datetime)
-        
-        if end_datetime is not None:
-            query += " AND timestamp <= ?"
-            params.append(end_datetime)
-        
-        query += " ORDER BY tick ASC, timestamp ASC"
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        query, params = _build_history_query(
+            'entity_history', start_tick, end_tick, start_datetime, end_datetime,
+            limit=limit, before_tick=before_tick, before_rowid=before_rowid
+        )
         
-        return [dict(row) for row in rows]
+        return self._fetch_history_records(query, params, newest_first=limit is not None)
     
     def save_job_history(
         self,
@@ -870,7 +1234,6 @@ class Database:
             avg_payment_by_job: Dictionary mapping job_type -> {resource_id: avg_amount} (new format)
             total_payment_by_resource: Dictionary mapping resource_id -> total (new format)
         """
-        import json
         cursor = self._connection.cursor()
         
         # Store new format in avg_salary_by_job JSON for now (can add new columns later if needed)
@@ -890,20 +1253,23 @@ class Database:
             tick,
             total_employed,
             employment_rate,
-            json.dumps(job_distribution),
-            json.dumps(payment_data),  # Store full payment data in JSON
+            _json_dumps(job_distribution),
+            _json_dumps(payment_data),  # Store full payment data in JSON
             total_salary_paid,
-            json.dumps(job_openings)
+            _json_dumps(job_openings)
         ))
-        self._connection.commit()
     
     def get_job_history(
         self,
         start_tick: Optional[int] = None,
         end_tick: Optional[int] = None,
         start_datetime: Optional[str] = None,
-        end_datetime: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        end_datetime: Optional[str] = None,
+        limit: Optional[int] = None,
+        before_tick: Optional[int] = None,
+        before_rowid: Optional[int] = None,
+        lazy: bool = False
+    ) -> Union[List[Dict[str, Any]], List[JobHistoryRecord]]:
         """Get job history records.
         
         Args:
@@ -911,73 +1277,39 @@ class Database:
             end_tick: Optional end tick (inclusive)
             start_datetime: Optional start datetime ISO string (inclusive)
             end_datetime: Optional end datetime ISO string (inclusive)
+            limit: Optional maximum number of records (the most recent ones)
+            before_tick: Optional page cursor, only records with tick < before_tick
+            before_rowid: Optional 'id' of the oldest record of the previous page;
+                with before_tick, continues exactly after it even within a tick
+            lazy: If True, return read-only JobHistoryRecord mappings that decode
+                their JSON fields on access instead of fully decoded dictionaries
             
         Returns:
-            List of history records as dictionaries
+            List of history records as dictionaries (JobHistoryRecord mappings
+            if lazy)
         """
-        import json
-        cursor = self._connection.cursor()
-        
-        query = "SELECT * FROM job_history WHERE 1=1"
-        params = []
-        
-        if start_tick is not None:
-            query += " AND tick >= ?"
-            params.append(start_tick)
-        
-        if end_tick is not None:
-            query += " AND tick <= ?"
-            params.append(end_tick)
-        
-        if start_datetime is not None:
-            query += " AND timestamp >= ?"
-            params.append(start_datetime)
-        
-        if end_datetime is not None:
-            query += " AND timestamp <= ?"
-            params.append(end_datetime)
-        
-        query += " ORDER BY tick ASC, timestamp ASC"
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        query, params = _build_history_query(
+            'job_history', start_tick, end_tick, start_datetime, end_datetime,
+            limit=limit, before_tick=before_tick, before_rowid=before_rowid
+        )
         
-        # Parse JSON fields
-        result = []
-        for row in rows:
-            record = dict(row)
-            # Parse JSON strings back to dictionaries
-            if 'job_distribution' in record and isinstance(record['job_distribution'], str):
-                record['job_distribution'] = json.loads(record['job_distribution'])
-            if 'avg_salary_by_job' in record and isinstance(record['avg_salary_by_job'], str):
-                payment_data = json.loads(record['avg_salary_by_job'])
-                # Handle both old format (just salary dict) and new format (payment_data dict)
-                if isinstance(payment_data, dict) and 'avg_payment_by_job' in payment_data:
-                    # New format
-                    record['avg_payment_by_job'] = payment_data.get('avg_payment_by_job', {})
-                    record['total_payment_by_resource'] = payment_data.get('total_payment_by_resource', {})
-                    # Extract backward compat avg_salary_by_job (money only)
-                    record['avg_salary_by_job'] = {
-                        job: payments.get('money', 0.0) 
-                        for job, payments in payment_data.get('avg_payment_by_job', {}).items()
-                    }
-                else:
-                    # Old format (just salary dict)
-                    record['avg_salary_by_job'] = payment_data
-                    record['avg_payment_by_job'] = {job: {'money': amt} for job, amt in payment_data.items()}
-                    record['total_payment_by_resource'] = {}
-            if 'job_openings' in record and isinstance(record['job_openings'], str):
-                record['job_openings'] = json.loads(record['job_openings'])
-            result.append(record)
-        
-        return result
+        records = [
+            JobHistoryRecord(record)
+            for record in self._fetch_history_records(query, params, newest_first=limit is not None)
+        ]
+        if lazy:
+            return records  # JSON fields are decoded when accessed
+        return [record.materialize_all() for record in records]
     
     def get_all_resource_history(
         self,
         start_tick: Optional[int] = None,
         end_tick: Optional[int] = None,
         start_datetime: Optional[str] = None,
-        end_datetime: Optional[str] = None
+        end_datetime: Optional[str] = None,
+        limit: Optional[int] = None,
+        before_tick: Optional[int] = None,
+        before_rowid: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Get history for all resources.
         
@@ -986,34 +1318,17 @@ class Database:
             end_tick: Optional end tick (inclusive)
             start_datetime: Optional start datetime ISO string (inclusive)
             end_datetime: Optional end datetime ISO string (inclusive)
+            limit: Optional maximum number of records (the most recent ones)
+            before_tick: Optional page cursor, only records with tick < before_tick
+            before_rowid: Optional 'id' of the oldest record of the previous page;
+                with before_tick, continues exactly after it even within a tick
             
         Returns:
             List of history records as dictionaries
         """
-        cursor = self._connection.cursor()
-        
-        query = "SELECT * FROM resource_history WHERE 1=1"
-        params = []
-        
-        if start_tick is not None:
-            query += " AND tick >= ?"
-            params.append(start_tick)
-        
-        if end_tick is not None:
-            query += " AND tick <= ?"
-            params.append(end_tick)
-        
-        if start_datetime is not None:
-            query += " AND timestamp >= ?"
-            params.append(start_datetime)
-        
-        if end_datetime is not None:
-            query += " AND timestamp <= ?"
-            params.append(end_datetime)
-        
-        query += " ORDER BY tick ASC, timestamp ASC, resource_id ASC"
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        query, params = _build_history_query(
+            'resource_history', start_tick, end_tick, start_datetime, end_datetime,
+            limit=limit, before_tick=before_tick, before_rowid=before_rowid
+        )
         
-        return [dict(row) for row in rows]
+        return self._fetch_history_records(query, params, newest_first=limit is not None)
@@ -0,0 +1,112 @@
+"""Background writer for analytics history rows.
+
+Analytics systems can hand rows to a HistoryWriter instead of writing them
+synchronously, so SQLite inserts and commits happen off the simulation
+thread.
+"""
+
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from src.core.logging import get_logger
+from src.persistence.database import Database
+
+
+logger = get_logger('persistence.history_writer')
+
+# Queue marker telling the writer thread to exit
+_STOP = object()
+
+
+class HistoryWriter:
+    """Writes queued history rows to SQLite on a dedicated thread.
+    
+    The writer thread owns its own Database connection. Each time it wakes
+    up it drains everything currently queued and hands the batch to the
+    save callback, then commits once.
+    """
+    
+    def __init__(
+        self,
+        db_path: Path,
+        save_batch: Callable[[Database, List[Any]], None],
+        name: str = 'HistoryWriter'
+    ):
+        """Initialize the writer (the thread is started by start()).
+        
+        Args:
+            db_path: Path to SQLite database file
+            save_batch: Callable(db, rows) that writes a batch of rows
+            name: Thread name (used in logs)
+        """
+        self.db_path = db_path
+        self.save_batch = save_batch
+        self.name = name
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """Start the writer thread if it is not already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._writer_loop, name=self.name, daemon=True)
+        self._thread.start()
+    
+    def submit(self, row: Any) -> None:
+        """Queue a row to be written.
+        
+        Args:
+            row: Row payload understood by the save callback
+        """
+        self._queue.put(row)
+    
+    def flush(self) -> None:
+        """Block until every row submitted so far has been written."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+    
+    def stop(self) -> None:
+        """Write any remaining rows and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+    
+    def _writer_loop(self) -> None:
+        """Drain the queue in batches until stopped."""
+        with Database(self.db_path, mode='analytics_append') as db:
+            while True:
+                batch = [self._queue.get()]
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                stop = False
+                rows = []
+                for item in batch:
+                    if item is _STOP:
+                        stop = True
+                    else:
+                        rows.append(item)
+                
+                if rows:
+                    try:
+                        self.save_batch(db, rows)
+                        db.flush()
+                    except Exception as e:
+                        db.rollback()
+                        logger.error(
+                            f"{self.name}: error writing {len(rows)} history rows: {e}",
+                            exc_info=True
+                        )
+                
+                for _ in batch:
+                    self._queue.task_done()
+                
+                if stop:
+                    return
@@ -3,15 +3,16 @@
 Tracks entity and component metrics over time for analytics and trend analysis.
 """
 
-import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from statistics import fmean
+from typing import Any, Dict, FrozenSet, List, Optional
 from pathlib import Path
 
 from src.core.system import System
 from src.core.logging import get_logger
-from src.persistence.database import Database
-from src.systems.analytics.history import _should_save_history
+from src.persistence.database import Database, _json_dumps
+from src.persistence.history_writer import HistoryWriter
+from src.systems.analytics.history import _next_history_save_at, _should_save_history
 
 
 logger = get_logger('systems.analytics.entity_history')
@@ -35,9 +36,14 @@ class EntityHistorySystem(System):
         self.frequency: str = 'daily'
         self.rate: int = 1
         self.component_types: List[str] = []  # Empty = track all components
+        self._tracked: Optional[FrozenSet[str]] = None  # None = track all components
         self.last_save: Optional[datetime] = None
+        self._next_save_at: Optional[datetime] = None  # Earliest possible next save
         self.db_path: Optional[Path] = None
+        self._db: Optional[Database] = None  # Cached connection, opened on first save
         self.last_population: Optional[int] = None  # Track previous population for rate calculation
+        self.background_writes: bool = False
+        self._writer: Optional[HistoryWriter] = None
     
     def init(self, world_state: Any, config: Dict[str, Any]) -> None:
         """Initialize the system with configuration.
@@ -49,11 +55,14 @@ class EntityHistorySystem(System):
                 frequency: str - 'hourly', 'daily', 'weekly', 'monthly', 'yearly' (default: 'daily')
                 rate: int - Every N periods (default: 1)
                 component_types: List[str] - Component types to track (empty = all)
+                background_writes: bool - Write history on a background thread (default: false)
         """
         self.enabled = config.get('enabled', True)
         self.frequency = config.get('frequency', 'daily')
         self.rate = config.get('rate', 1)
         self.component_types = config.get('component_types', [])
+        self._tracked = frozenset(self.component_types) if self.component_types else None
+        self.background_writes = config.get('background_writes', False)
         
         # Get database path from config or world state config snapshot
         # Default to _running/simulation.db
@@ -82,6 +91,18 @@ class EntityHistorySystem(System):
             logger.warning(f"Invalid history rate '{self.rate}', defaulting to 1")
             self.rate = 1
         
+        # Drop any writer or connection left from a previous configuration
+        self.shutdown(world_state)
+        
+        # Start background writer (rows are written off the simulation thread)
+        if self.enabled and self.background_writes:
+            self._writer = HistoryWriter(
+                self.db_path,
+                lambda db, rows: db.save_entity_history_many(rows),
+                name='EntityHistoryWriter'
+            )
+            self._writer.start()
+        
         logger.debug(
             f"Initialized {self.system_id}: enabled={self.enabled}, "
             f"frequency={self.frequency}, rate={self.rate}, "
@@ -100,66 +121,70 @@ class EntityHistorySystem(System):
         if not self.enabled:
             return
         
-        # Check if we should save history
-        if not _should_save_history(self.frequency, self.rate, self.last_save, current_datetime):
+        # Skip cheaply until the next save is possible; a tick landing exactly on
+        # it is always a save, later ticks (e.g. after a gap) are checked precisely
+        if self._next_save_at is not None and current_datetime < self._next_save_at:
+            return
+        if current_datetime != self._next_save_at and not _should_save_history(
+            self.frequency, self.rate, self.last_save, current_datetime
+        ):
             return
         
-        # Get all entities
-        all_entities = world_state.get_all_entities()
-        if not all_entities:
+        # Nothing to record (and no connection to open) without entities
+        current_population = world_state.get_entity_count()
+        if not current_population:
             return
         
         # Calculate aggregated metrics
-        current_population = len(all_entities)
-        metrics = self._calculate_metrics(all_entities, current_datetime)
+        metrics = self._calculate_metrics(world_state, current_population, current_datetime)
         
         # Calculate birth and death rates (per 1000 population per period)
         birth_rate = None
         death_rate = None
         
-        if self.last_population is not None:
-            # Calculate change in population
-            population_change = current_population - self.last_population
+        if self.last_population is not None and self.last_save:
+            # Period length in days for rate normalization
+            period_days = (current_datetime - self.last_save).days
+            # Average population during period
+            avg_population = (self.last_population + current_population) / 2.0
             
-            # Calculate period length in days for rate normalization
-            if self.last_save:
-                period_days = (current_datetime - self.last_save).days
-                if period_days > 0:
-                    # Average population during period
-                    avg_population = (self.last_population + current_population) / 2.0
-                    if avg_population > 0:
-                        # Births = positive change (new entities)
-                        births = max(0, population_change)
-                        # Deaths = negative change (removed entities)
-                        deaths = max(0, -population_change)
-                        
-                        # Calculate rates per 1000 population per period
-                        # Then normalize to per year for consistency
-                        days_per_year = 365.25
-                        if period_days > 0:
-                            birth_rate = (births / avg_population) * 1000 * (days_per_year / period_days)
-                            death_rate = (deaths / avg_population) * 1000 * (days_per_year / period_days)
+            if period_days > 0 and avg_population > 0:
+                # Rates per 1000 population, normalized to per year
+                scale = 1000.0 * 365.25 / (period_days * avg_population)
+                population_change = current_population - self.last_population
+                # Births = positive change (new entities), deaths = negative change
+                birth_rate = max(0, population_change) * scale
+                death_rate = max(0, -population_change) * scale
         
         metrics['birth_rate'] = birth_rate
         metrics['death_rate'] = death_rate
         
         # Save history
-        timestamp = current_datetime.isoformat()
+        timestamp = world_state.simulation_time.isoformat(current_datetime)
         tick = world_state.simulation_time.ticks_elapsed
         
         try:
-            with Database(self.db_path) as db:
-                db.save_entity_history(
-                    timestamp=timestamp,
-                    tick=tick,
-                    **metrics
-                )
+            if self._writer is not None:
+                self._writer.submit({'timestamp': timestamp, 'tick': tick, **metrics})
+            else:
+                db = self._get_database()
+                try:
+                    db.save_entity_history(
+                        timestamp=timestamp,
+                        tick=tick,
+                        **metrics
+                    )
+                    db.flush()
+                except Exception:
+                    db.rollback()
+                    raise
             
             self.last_save = current_datetime
+            self._next_save_at = _next_history_save_at(self.frequency, self.rate, current_datetime)
             self.last_population = current_population
             logger.debug(
                 f"Saved entity history for {metrics['total_entities']} entities "
-                f"at {current_datetime.isoformat()}"
+                f"at {timestamp}"
             )
         
         except Exception as e:
@@ -170,97 +195,94 @@ class EntityHistorySystem(System):
     
     def _calculate_metrics(
         self,
-        entities: Dict[str, Any],
+        world_state: Any,
+        total_entities: int,
         current_datetime: datetime
     ) -> Dict[str, Any]:
         """Calculate aggregated entity metrics.
         
+        Metrics are gathered one component type at a time so each loop only
+        touches the components it needs instead of probing every entity for
+        every component. Component types excluded by component_types are
+        skipped entirely.
+        
         Args:
-            entities: Dictionary of entity_id -> Entity
+            world_state: World state instance
+            total_entities: Number of entities in the world
             current_datetime: Current simulation datetime
             
         Returns:
             Dictionary of metrics to save
         """
-        total_entities = len(entities)
+        tracked = self._tracked
+        
+        def is_tracked(component_type: str) -> bool:
+            return tracked is None or component_type in tracked
         
         # Component counts
-        component_counts: Dict[str, int] = {}
+        component_counts = world_state.get_component_type_histogram()
+        if tracked is not None:
+            component_counts = {
+                comp_type: count for comp_type, count in component_counts.items()
+                if comp_type in tracked
+            }
         
         # Needs metrics
-        hunger_values: List[float] = []
-        thirst_values: List[float] = []
-        rest_values: List[float] = []
+        needs_list = world_state.get_components_of_type('Needs') if is_tracked('Needs') else []
+        hunger_values = [needs.hunger for needs in needs_list]
+        thirst_values = [needs.thirst for needs in needs_list]
+        rest_values = [needs.rest for needs in needs_list]
         
         # Pressure metrics
-        pressure_values: List[float] = []
-        entities_with_pressure = 0
+        pressure_values = []
+        if is_tracked('Pressure'):
+            pressure_values = [
+                pressure.pressure_level
+                for pressure in world_state.iter_components('Pressure')
+            ]
+        entities_with_pressure = sum(1 for level in pressure_values if level > 0)
         
         # Health metrics
-        health_values: List[float] = []
-        entities_at_risk = 0
+        health_values = []
+        if is_tracked('Health'):
+            health_values = [
+                health.health
+                for health in world_state.iter_components('Health')
+            ]
+        entities_at_risk = sum(1 for value in health_values if value < 0.5)
         
         # Age metrics
-        age_values: List[float] = []
+        age_values = []
+        if is_tracked('Age'):
+            age_values = [
+                age.get_age_years(current_datetime)
+                for age in world_state.iter_components('Age')
+            ]
         
         # Wealth metrics
         wealth_values: List[float] = []
-        
-        # Employment metrics
-        employed_count = 0
-        
-        # Calculate metrics for each entity
-        for entity in entities.values():
-            # Component counts
-            for comp_type in entity.get_component_types():
-                component_counts[comp_type] = component_counts.get(comp_type, 0) + 1
-            
-            # Needs component
-            needs = entity.get_component('Needs')
-            if needs:
-                hunger_values.append(needs.hunger)
-                thirst_values.append(needs.thirst)
-                rest_values.append(needs.rest)
-            
-            # Pressure component
-            pressure = entity.get_component('Pressure')
-            if pressure:
-                pressure_values.append(pressure.pressure_level)
-                if pressure.pressure_level > 0:
-                    entities_with_pressure += 1
-            
-            # Health component
-            health = entity.get_component('Health')
-            if health:
-                health_values.append(health.health)
-                if health.health < 0.5:
-                    entities_at_risk += 1
-            
-            # Age component
-            age = entity.get_component('Age')
-            if age:
-                age_years = age.get_age_years(current_datetime)
-                age_values.append(age_years)
-            
-            # Wealth component
-            wealth = entity.get_component('Wealth')
-            if wealth:
+        if is_tracked('Wealth'):
+            for wealth in world_state.iter_components('Wealth'):
                 # Sum all resources in wealth (for backward compat, prefer money if available)
                 if 'money' in wealth.resources:
                     wealth_values.append(wealth.resources['money'])
                 elif wealth.resources:
                     # Sum all resources if no money
                     wealth_values.append(sum(wealth.resources.values()))
-            
-            # Employment component
-            employment = entity.get_component('Employment')
-            if employment and employment.is_employed():
-                employed_count += 1
+        
+        # Employment metrics
+        # (inlines EmploymentComponent.is_employed() to skip a call per entity)
+        employed_count = 0
+        if is_tracked('Employment'):
+            employed_count = sum(
+                1 for employment in world_state.iter_components('Employment')
+                if employment.job_type is not None
+            )
         
         # Calculate averages
         metrics = {
             'total_entities': total_entities,
-            'component_counts': json.dumps(component_counts),
+            'component_counts': _json_dumps(component_counts),
             'avg_hunger': self._average(hunger_values),
             'avg_thirst': self._average(thirst_values),
             'avg_rest': self._average(rest_values),
@@ -286,4 +308,32 @@ class EntityHistorySystem(System):
         """
         if not values:
             return None
-        return sum(values) / len(values)
+        return fmean(values)
+    
+    def _get_database(self) -> Database:
+        """Get the cached history connection, opening it on first use.
+        
+        Returns:
+            Connected Database in 'analytics_append' mode
+        """
+        if self._db is None:
+            db = Database(self.db_path, mode='analytics_append')
+            db.connect()
+            self._db = db
+        return self._db
+    
+    def shutdown(self, world_state: Any) -> None:
+        """Shutdown the system, writing any queued history rows.
+        
+        Stops the background writer (if any) and closes the cached history
+        connection.
+        
+        Args:
+            world_state: World state instance
+        """
+        if self._writer is not None:
+            self._writer.stop()
+            self._writer = None
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -3,18 +3,46 @@
 Tracks resource values over time for analytics and trend analysis.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, FrozenSet, List, Optional
 from pathlib import Path
 
 from src.core.system import System
 from src.core.logging import get_logger
 from src.persistence.database import Database
+from src.persistence.history_writer import HistoryWriter
 
 
 logger = get_logger('systems.analytics.history')
 
 
+# Frequency -> (is period start, period index). The index counts whole
+# periods from a fixed epoch, so periods elapsed between two datetimes is a
+# single integer subtraction.
+_FREQUENCY_TABLE = {
+    'hourly': (
+        lambda dt: True,  # Every hour is a period start
+        lambda dt: dt.toordinal() * 24 + dt.hour,
+    ),
+    'daily': (
+        lambda dt: dt.hour == 0,
+        lambda dt: dt.toordinal(),
+    ),
+    'weekly': (
+        lambda dt: dt.weekday() == 0 and dt.hour == 0,
+        lambda dt: (dt.toordinal() - 1) // 7,  # Ordinal 1 (0001-01-01) is a Monday
+    ),
+    'monthly': (
+        lambda dt: dt.day == 1 and dt.hour == 0,
+        lambda dt: dt.year * 12 + dt.month - 1,
+    ),
+    'yearly': (
+        lambda dt: dt.month == 1 and dt.day == 1 and dt.hour == 0,
+        lambda dt: dt.year,
+    ),
+}
+
+
 def _should_save_history(
     frequency: str,
     rate: int,
@@ -32,25 +60,13 @@ def _should_save_history(
     Returns:
         True if history should be saved
     """
-    # Check if we're at the start of a period boundary
-    at_period_start = False
-    
-    if frequency == 'hourly':
-        at_period_start = True  # Every hour is a period start
-    elif frequency == 'daily':
-        at_period_start = current_datetime.hour == 0
-    elif frequency == 'weekly':
-        at_period_start = current_datetime.weekday() == 0 and current_datetime.hour == 0
-    elif frequency == 'monthly':
-        at_period_start = current_datetime.day == 1 and current_datetime.hour == 0
-    elif frequency == 'yearly':
-        at_period_start = (current_datetime.month == 1 and 
-                          current_datetime.day == 1 and 
-                          current_datetime.hour == 0)
-    else:
+    checks = _FREQUENCY_TABLE.get(frequency)
+    if checks is None:
         return False
+    is_period_start, period_index = checks
     
-    if not at_period_start:
+    # Check if we're at the start of a period boundary
+    if not is_period_start(current_datetime):
         return False
     
     if last_save is None:
@@ -58,25 +74,58 @@ def _should_save_history(
         return True
     
     # Calculate periods since last save
+    return period_index(current_datetime) - period_index(last_save) >= rate
+
+def _next_history_save_at(frequency: str, rate: int, last_save: datetime) -> datetime:
+    """Get the earliest datetime at which the next history save can happen.
+    
+    This is a lower bound for _should_save_history(): before the returned
+    datetime it is guaranteed to return False, so systems can skip the
+    check with a single comparison on most ticks. Because saves only happen
+    at period starts, the returned datetime is itself a period start with
+    enough periods elapsed, so _should_save_history() is True exactly at it.
+    
+    The bound is a datetime rather than a tick count: monthly and yearly
+    periods have no fixed length in ticks, and on_tick() is driven by the
+    datetime it is given, which callers may advance independently of
+    ticks_elapsed.
+    
+    Args:
+        frequency: 'hourly', 'daily', 'weekly', 'monthly', or 'yearly'
+        rate: Save every N periods
+        last_save: Time history was last saved
+        
+    Returns:
+        Earliest datetime of the next possible save
+    """
     if frequency == 'hourly':
-        hours_diff = int((current_datetime - last_save).total_seconds() / 3600)
-        return hours_diff >= rate
-    elif frequency == 'daily':
-        days_diff = (current_datetime.date() - last_save.date()).days
-        return days_diff >= rate
+        return last_save + timedelta(hours=rate)
+    
+    midnight = datetime.combine(last_save.date(), datetime.min.time(), tzinfo=last_save.tzinfo)
+    if frequency == 'daily':
+        return midnight + timedelta(days=rate)
     elif frequency == 'weekly':
-        # Calculate weeks difference
-        weeks_diff = (current_datetime.date() - last_save.date()).days / 7
-        return int(weeks_diff) >= rate
+        return midnight + timedelta(days=7 * rate)
     elif frequency == 'monthly':
-        months_diff = (current_datetime.year - last_save.year) * 12 + (current_datetime.month - last_save.month)
-        return months_diff >= rate
+        month_index = last_save.month - 1 + rate
+        return midnight.replace(
+            year=last_save.year + month_index // 12,
+            month=month_index % 12 + 1,
+            day=1
+        )
     elif frequency == 'yearly':
-        years_diff = current_datetime.year - last_save.year
-        return years_diff >= rate
+        return midnight.replace(year=last_save.year + rate, month=1, day=1)
     
-    return False
+    return last_save
 
+def _save_resource_history_batches(db: Database, batches: List[List[tuple]]) -> None:
+    """Write queued per-tick resource history row lists in one executemany.
+    
+    Args:
+        db: Connected Database
+        batches: Row lists submitted by ResourceHistorySystem, one per save
+    """
+    db.save_resource_history_many([row for rows in batches for row in rows])
 
 class ResourceHistorySystem(System):
     """System that tracks resource values over time for analytics.
@@ -96,8 +145,13 @@ class ResourceHistorySystem(System):
         self.frequency: str = 'daily'
         self.rate: int = 1
         self.resources: List[str] = []  # Empty = all resources
+        self._tracked: Optional[FrozenSet[str]] = None  # None = track all resources
         self.last_save: Optional[datetime] = None
+        self._next_save_at: Optional[datetime] = None  # Earliest possible next save
         self.db_path: Optional[Path] = None
+        self._db: Optional[Database] = None  # Cached connection, opened on first save
+        self.background_writes: bool = False
+        self._writer: Optional[HistoryWriter] = None
     
     def init(self, world_state: Any, config: Dict[str, Any]) -> None:
         """Initialize the system with configuration.
@@ -109,11 +163,14 @@ class ResourceHistorySystem(System):
                 frequency: str - 'hourly', 'daily', 'weekly', 'monthly', 'yearly' (default: 'daily')
                 rate: int - Every N periods (default: 1)
                 resources: List[str] - Resource IDs to track (empty = all)
+                background_writes: bool - Write history on a background thread (default: false)
         """
         self.enabled = config.get('enabled', True)
         self.frequency = config.get('frequency', 'daily')
         self.rate = config.get('rate', 1)
         self.resources = config.get('resources', [])
+        self._tracked = frozenset(self.resources) if self.resources else None
+        self.background_writes = config.get('background_writes', False)
         
         # Get database path from config or world state config snapshot
         # Default to _running/simulation.db
@@ -129,6 +186,9 @@ class ResourceHistorySystem(System):
             else:
                 self.db_path = Path("_running/simulation.db")
         
+        # Drop any writer or connection left from a previous configuration
+        self.shutdown(world_state)
+        
         # Validate frequency
         valid_frequencies = ('hourly', 'daily', 'weekly', 'monthly', 'yearly')
         if self.frequency not in valid_frequencies:
@@ -142,6 +202,15 @@ class ResourceHistorySystem(System):
             logger.warning(f"Invalid history rate '{self.rate}', defaulting to 1")
             self.rate = 1
         
+        # Start background writer (rows are written off the simulation thread)
+        if self.enabled and self.background_writes:
+            self._writer = HistoryWriter(
+                self.db_path,
+                _save_resource_history_batches,
+                name='ResourceHistoryWriter'
+            )
+            self._writer.start()
+        
         logger.debug(
             f"Initialized {self.system_id}: enabled={self.enabled}, "
             f"frequency={self.frequency}, rate={self.rate}, "
@@ -160,17 +229,23 @@ class ResourceHistorySystem(System):
         if not self.enabled:
             return
         
-        # Check if we should save history
-        if not _should_save_history(self.frequency, self.rate, self.last_save, current_datetime):
+        # Skip cheaply until the next save is possible; a tick landing exactly on
+        # it is always a save, later ticks (e.g. after a gap) are checked precisely
+        if self._next_save_at is not None and current_datetime < self._next_save_at:
+            return
+        if current_datetime != self._next_save_at and not _should_save_history(
+            self.frequency, self.rate, self.last_save, current_datetime
+        ):
             return
         
         # Get resources to track
         all_resources = world_state.get_all_resources()
-        if self.resources:
-            # Filter to specified resources
+        tracked = self._tracked
+        if tracked is not None:
+            # Filter to specified resources (set membership, not a list scan)
             resources_to_track = {
                 rid: res for rid, res in all_resources.items()
-                if rid in self.resources
+                if rid in tracked
             }
         else:
             # Track all resources
@@ -180,34 +255,37 @@ class ResourceHistorySystem(System):
             return
         
         # Save history for each resource
-        timestamp = current_datetime.isoformat()
+        timestamp = world_state.simulation_time.isoformat(current_datetime)
         tick = world_state.simulation_time.ticks_elapsed
         
+        # Build all rows in one pass; utilization is None without a positive max_capacity
+        rows = [
+            (
+                timestamp, tick, resource_id, resource.current_amount, resource.status_id,
+                (resource.current_amount / resource.max_capacity) * 100
+                if resource.max_capacity is not None and resource.max_capacity > 0 else None
+            )
+            for resource_id, resource in resources_to_track.items()
+        ]
+        
         try:
-            with Database(self.db_path) as db:
-                for resource_id, resource in resources_to_track.items():
-                    # Calculate utilization percentage
-                    utilization_percent = None
-                    if resource.max_capacity is not None and resource.max_capacity > 0:
-                        utilization_percent = (resource.current_amount / resource.max_capacity) * 100
-                    
-                    # Get status_id
-                    status_id = resource.status_id if hasattr(resource, 'status_id') else 'moderate'
-                    
-                    # Save to database
-                    db.save_resource_history(
-                        timestamp=timestamp,
-                        tick=tick,
-                        resource_id=resource_id,
-                        amount=resource.current_amount,
-                        status_id=status_id,
-                        utilization_percent=utilization_percent
-                    )
+            if self._writer is not None:
+                self._writer.submit(rows)
+            else:
+                # Save all rows in one statement and one transaction
+                db = self._get_database()
+                try:
+                    db.save_resource_history_many(rows)
+                    db.flush()
+                except Exception:
+                    db.rollback()
+                    raise
             
             self.last_save = current_datetime
+            self._next_save_at = _next_history_save_at(self.frequency, self.rate, current_datetime)
             logger.debug(
                 f"Saved history for {len(resources_to_track)} resources "
-                f"at {current_datetime.isoformat()}"
+                f"at {timestamp}"
             )
         
         except Exception as e:
@@ -215,3 +293,31 @@ class ResourceHistorySystem(System):
                 f"Error saving resource history: {e}",
                 exc_info=True
             )
+    
+    def _get_database(self) -> Database:
+        """Get the cached history connection, opening it on first use.
+        
+        Returns:
+            Connected Database in 'analytics_append' mode
+        """
+        if self._db is None:
+            db = Database(self.db_path, mode='analytics_append')
+            db.connect()
+            self._db = db
+        return self._db
+    
+    def shutdown(self, world_state: Any) -> None:
+        """Shutdown the system, writing any queued history rows.
+        
+        Stops the background writer (if any) and closes the cached history
+        connection.
+        
+        Args:
+            world_state: World state instance
+        """
+        if self._writer is not None:
+            self._writer.stop()
+            self._writer = None
+        if self._db is not None:
+            self._db.close()
+            self._db = None
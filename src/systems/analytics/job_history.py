@@ -3,19 +3,35 @@
 Tracks employment statistics over time for analytics and trend analysis.
 """
 
-import json
+from collections import Counter
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from src.core.system import System
 from src.core.logging import get_logger
 from src.persistence.database import Database
-from src.systems.analytics.history import _should_save_history
+from src.persistence.history_writer import HistoryWriter
+from src.systems.analytics.history import _next_history_save_at, _should_save_history
 
 
 logger = get_logger('systems.analytics.job_history')
 
+# Counter(map(...)) with a C-level getter avoids a generator frame per employee
+_job_type_of = attrgetter('job_type')
+
+
+def _save_job_history_records(db: Database, records: List[Dict[str, Any]]) -> None:
+    """Write queued job history records (save_job_history keyword arguments).
+    
+    Args:
+        db: Connected Database
+        records: Records submitted by JobHistorySystem, one per save
+    """
+    for record in records:
+        db.save_job_history(**record)
+
 
 class JobHistorySystem(System):
     """System that tracks employment statistics over time for analytics.
@@ -35,7 +51,16 @@ class JobHistorySystem(System):
         self.frequency: str = 'monthly'
         self.rate: int = 1
         self.last_save: Optional[datetime] = None
+        self._next_save_at: Optional[datetime] = None  # Earliest possible next save
         self.db_path: Optional[Path] = None
+        self._db: Optional[Database] = None  # Cached connection, opened on first save
+        self.background_writes: bool = False
+        self._writer: Optional[HistoryWriter] = None
+        # Last employment scan, the (entity_version, employment_version) it was
+        # taken at and the (world_state, job_system) it was taken from
+        self._aggregates: Tuple[int, Dict[str, int], Dict[str, Dict[str, float]], Dict[str, float]] = (0, {}, {}, {})
+        self._aggregates_versions: Optional[Tuple[int, int]] = None
+        self._aggregates_sources: Tuple[Any, Any] = (None, None)
     
     def init(self, world_state: Any, config: Dict[str, Any]) -> None:
         """Initialize the system with configuration.
@@ -46,10 +71,12 @@ class JobHistorySystem(System):
                 enabled: bool (default: true)
                 frequency: str - 'hourly', 'daily', 'weekly', 'monthly', 'yearly' (default: 'monthly')
                 rate: int - Every N periods (default: 1)
+                background_writes: bool - Write history on a background thread (default: false)
         """
         self.enabled = config.get('enabled', True)
         self.frequency = config.get('frequency', 'monthly')
         self.rate = config.get('rate', 1)
+        self.background_writes = config.get('background_writes', False)
         
         # Get database path from config or world state config snapshot
         # Default to _running/simulation.db
@@ -65,6 +92,9 @@ class JobHistorySystem(System):
             else:
                 self.db_path = Path("_running/simulation.db")
         
+        # Drop any writer or connection left from a previous configuration
+        self.shutdown(world_state)
+        
         # Validate frequency
         valid_frequencies = ('hourly', 'daily', 'weekly', 'monthly', 'yearly')
         if self.frequency not in valid_frequencies:
@@ -78,6 +108,15 @@ class JobHistorySystem(System):
             logger.warning(f"Invalid history rate '{self.rate}', defaulting to 1")
             self.rate = 1
         
+        # Start background writer (rows are written off the simulation thread)
+        if self.enabled and self.background_writes:
+            self._writer = HistoryWriter(
+                self.db_path,
+                _save_job_history_records,
+                name='JobHistoryWriter'
+            )
+            self._writer.start()
+        
         logger.debug(
             f"Initialized {self.system_id}: enabled={self.enabled}, "
             f"frequency={self.frequency}, rate={self.rate}"
@@ -95,8 +134,13 @@ class JobHistorySystem(System):
         if not self.enabled:
             return
         
-        # Check if we should save history
-        if not _should_save_history(self.frequency, self.rate, self.last_save, current_datetime):
+        # Skip cheaply until the next save is possible; a tick landing exactly on
+        # it is always a save, later ticks (e.g. after a gap) are checked precisely
+        if self._next_save_at is not None and current_datetime < self._next_save_at:
+            return
+        if current_datetime != self._next_save_at and not _should_save_history(
+            self.frequency, self.rate, self.last_save, current_datetime
+        ):
             return
         
         # Calculate employment statistics
@@ -106,27 +150,38 @@ class JobHistorySystem(System):
             return
         
         # Save to database
-        timestamp = current_datetime.isoformat()
+        timestamp = world_state.simulation_time.isoformat(current_datetime)
         tick = world_state.simulation_time.ticks_elapsed
         
+        record = {
+            'timestamp': timestamp,
+            'tick': tick,
+            'total_employed': stats['total_employed'],
+            'employment_rate': stats['employment_rate'],
+            'job_distribution': stats['job_distribution'],
+            'avg_salary_by_job': stats['avg_salary_by_job'],  # Backward compat format
+            'total_salary_paid': stats['total_salary_paid'],
+            'job_openings': stats['job_openings'],
+            'avg_payment_by_job': stats.get('avg_payment_by_job', {}),  # New format
+            'total_payment_by_resource': stats.get('total_payment_by_resource', {})  # New format
+        }
+        
         try:
-            with Database(self.db_path) as db:
-                db.save_job_history(
-                    timestamp=timestamp,
-                    tick=tick,
-                    total_employed=stats['total_employed'],
-                    employment_rate=stats['employment_rate'],
-                    job_distribution=stats['job_distribution'],
-                    avg_salary_by_job=stats['avg_salary_by_job'],  # Backward compat format
-                    total_salary_paid=stats['total_salary_paid'],
-                    job_openings=stats['job_openings'],
-                    avg_payment_by_job=stats.get('avg_payment_by_job', {}),  # New format
-                    total_payment_by_resource=stats.get('total_payment_by_resource', {})  # New format
-                )
+            if self._writer is not None:
+                self._writer.submit(record)
+            else:
+                db = self._get_database()
+                try:
+                    db.save_job_history(**record)
+                    db.flush()
+                except Exception:
+                    db.rollback()
+                    raise
             
             self.last_save = current_datetime
+            self._next_save_at = _next_history_save_at(self.frequency, self.rate, current_datetime)
             logger.debug(
-                f"Saved job history at {current_datetime.isoformat()}: "
+                f"Saved job history at {timestamp}: "
                 f"{stats['total_employed']} employed ({stats['employment_rate']:.1f}%)"
             )
         
@@ -150,49 +205,17 @@ class JobHistorySystem(System):
         Returns:
             Dictionary with employment statistics or None if no entities
         """
-        all_entities = world_state.get_all_entities()
-        if not all_entities:
+        total_population = world_state.get_entity_count()
+        if not total_population:
             return None
         
-        total_population = len(all_entities)
-        total_employed = 0
-        job_distribution: Dict[str, int] = {}
-        payment_by_job: Dict[str, Dict[str, List[float]]] = {}  # job_type -> {resource_id: [amounts]}
-        total_payment_by_resource: Dict[str, float] = {}  # resource_id -> total
-        
         # Get JobSystem to access job definitions
         job_system = world_state.get_system('JobSystem')
         job_openings: Dict[str, int] = {}
         
-        for entity in all_entities.values():
-            employment = entity.get_component('Employment')
-            if not employment or not employment.is_employed():
-                continue
-            
-            total_employed += 1
-            job_type = employment.job_type
-            
-            # Count by job type
-            job_distribution[job_type] = job_distribution.get(job_type, 0) + 1
-            
-            # Track payments by resource type
-            if employment.payment_resources:
-                if job_type not in payment_by_job:
-                    payment_by_job[job_type] = {}
-                
-                for resource_id, amount in employment.payment_resources.items():
-                    if resource_id not in payment_by_job[job_type]:
-                        payment_by_job[job_type][resource_id] = []
-                    payment_by_job[job_type][resource_id].append(amount)
-                    total_payment_by_resource[resource_id] = total_payment_by_resource.get(resource_id, 0.0) + amount
-        
-        # Calculate average payment per job type and resource
-        avg_payment_by_job: Dict[str, Dict[str, float]] = {}
-        for job_type, payments_by_resource in payment_by_job.items():
-            avg_payment_by_job[job_type] = {}
-            for resource_id, amounts in payments_by_resource.items():
-                if amounts:
-                    avg_payment_by_job[job_type][resource_id] = sum(amounts) / len(amounts)
+        total_employed, job_distribution, avg_payment_by_job, total_payment_by_resource = (
+            self._get_employment_aggregates(world_state, job_system)
+        )
         
         # For backward compatibility, also calculate total_salary_paid (sum of all payments)
         total_salary_paid = sum(total_payment_by_resource.values())
@@ -202,8 +225,7 @@ class JobHistorySystem(System):
             for job_id, job_config in job_system.jobs.items():
                 max_workers = int((total_population * job_config['max_percentage']) / 100.0)
                 current_workers = job_distribution.get(job_id, 0)
-                open_slots = max(0, max_workers - current_workers)
-                job_openings[job_id] = open_slots
+                job_openings[job_id] = max(0, max_workers - current_workers)
         
         # Calculate employment rate
         employment_rate = (total_employed / total_population * 100.0) if total_population > 0 else 0.0
@@ -218,3 +240,108 @@ class JobHistorySystem(System):
             'total_salary_paid': total_salary_paid,  # Backward compat: sum of all payments
             'job_openings': job_openings
         }
+    
+    def _get_employment_aggregates(
+        self,
+        world_state: Any,
+        job_system: Any
+    ) -> Tuple[int, Dict[str, int], Dict[str, Dict[str, float]], Dict[str, float]]:
+        """Get employment counts and payment averages, reusing the last scan when possible.
+        
+        The scan is reused while the world state's entity version and the
+        JobSystem's employment version are unchanged, since JobSystem is the
+        only system that hires, fires or changes payments. Without a JobSystem
+        that reports an employment version, every call rescans.
+        
+        Args:
+            world_state: World state instance
+            job_system: Registered JobSystem (or None)
+        
+        Returns:
+            Tuple of (total_employed, job_distribution, avg_payment_by_job,
+            total_payment_by_resource). The dicts are shared between calls
+            and must not be modified.
+        """
+        employment_version = getattr(job_system, 'employment_version', None)
+        versions = None
+        if isinstance(employment_version, int):
+            versions = (world_state.get_entity_version(), employment_version)
+            if (
+                versions == self._aggregates_versions
+                and world_state is self._aggregates_sources[0]
+                and job_system is self._aggregates_sources[1]
+            ):
+                return self._aggregates
+        
+        # Employed workers, gathered per component type rather than per entity
+        # (inlines EmploymentComponent.is_employed())
+        employments = [
+            employment for employment in world_state.iter_components('Employment')
+            if employment.job_type is not None
+        ]
+        
+        # Count by job type
+        job_distribution: Dict[str, int] = dict(Counter(map(_job_type_of, employments)))
+        
+        payment_by_job: Dict[str, Dict[str, List[float]]] = {}  # job_type -> {resource_id: [total, count]}
+        total_payment_by_resource: Dict[str, float] = {}  # resource_id -> total
+        
+        # Bind the dict methods used per payment once, outside the loop
+        job_payments_for = payment_by_job.setdefault
+        total_for = total_payment_by_resource.get
+        
+        for employment in employments:
+            # Track payments by resource type
+            payment_resources = employment.payment_resources
+            if payment_resources:
+                job_payments = job_payments_for(employment.job_type, {})
+                for resource_id, amount in payment_resources.items():
+                    running = job_payments.get(resource_id)
+                    if running is None:
+                        job_payments[resource_id] = [amount, 1]
+                    else:
+                        running[0] += amount
+                        running[1] += 1
+                    total_payment_by_resource[resource_id] = total_for(resource_id, 0.0) + amount
+        
+        # Calculate average payment per job type and resource
+        avg_payment_by_job: Dict[str, Dict[str, float]] = {
+            job_type: {
+                resource_id: total / count
+                for resource_id, (total, count) in payments_by_resource.items()
+            }
+            for job_type, payments_by_resource in payment_by_job.items()
+        }
+        
+        self._aggregates = (len(employments), job_distribution, avg_payment_by_job, total_payment_by_resource)
+        self._aggregates_versions = versions
+        self._aggregates_sources = (world_state, job_system)
+        return self._aggregates
+    
+    def _get_database(self) -> Database:
+        """Get the cached history connection, opening it on first use.
+        
+        Returns:
+            Connected Database in 'analytics_append' mode
+        """
+        if self._db is None:
+            db = Database(self.db_path, mode='analytics_append')
+            db.connect()
+            self._db = db
+        return self._db
+    
+    def shutdown(self, world_state: Any) -> None:
+        """Shutdown the system, writing any queued history rows.
+        
+        Stops the background writer (if any) and closes the cached history
+        connection.
+        
+        Args:
+            world_state: World state instance
+        """
+        if self._writer is not None:
+            self._writer.stop()
+            self._writer = None
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -1,7 +1,12 @@
 """World Health System - tracks overall simulation health and trends."""
 
-from datetime import datetime
-from typing import Any, Dict, Optional, List
+import logging
+import math
+import operator
+from collections import deque
+from datetime import datetime, timedelta
+from statistics import fmean
+from typing import Any, Deque, Dict, NamedTuple, Optional, Sequence, Tuple
 from enum import Enum
 
 from src.core.system import System
@@ -10,6 +15,136 @@ from src.systems.generics.status import StatusLevel
 
 logger = get_logger('systems.analytics.world_health')
 
+# Frequency -> is the datetime at the start of a period
+_PERIOD_START_CHECKS = {
+    'hourly': lambda dt: True,  # Every hour is a period start
+    'daily': lambda dt: dt.hour == 0,
+    'weekly': lambda dt: dt.weekday() == 0 and dt.hour == 0,
+    'monthly': lambda dt: dt.day == 1 and dt.hour == 0,
+    'yearly': lambda dt: dt.month == 1 and dt.day == 1 and dt.hour == 0,
+}
+
+
+def _hour_ordinal(dt: datetime) -> int:
+    """Whole hours since 0001-01-01 (ticks fall on the hour)."""
+    return dt.toordinal() * 24 + dt.hour
+
+
+# Frequency -> (integer ordinal of a datetime, ordinal units per period).
+# Periods elapsed between two datetimes is the ordinal difference floor-divided
+# by the units per period: hourly/daily/weekly count elapsed hours, while
+# monthly/yearly count calendar months/years.
+_PERIOD_ORDINALS = {
+    'hourly': (_hour_ordinal, 1),
+    'daily': (_hour_ordinal, 24),
+    'weekly': (_hour_ordinal, 24 * 7),
+    'monthly': (lambda dt: dt.year * 12 + dt.month, 1),
+    'yearly': (lambda dt: dt.year, 1),
+}
+
+
+def _next_calculation_at(frequency: str, rate: int, last_calculation: datetime) -> Optional[datetime]:
+    """Get the earliest datetime at which the next health calculation can happen.
+    
+    A lower bound for WorldHealthSystem._should_calculate() on hourly,
+    increasing ticks: the next period start after last_calculation, and at
+    least rate periods later when rate > 1. The first calculation may happen
+    mid-period, so the bound does not assume last_calculation is a period start.
+    
+    Args:
+        frequency: 'hourly', 'daily', 'weekly', 'monthly', or 'yearly'
+        rate: Calculate every N periods
+        last_calculation: Time of the last calculation
+    
+    Returns:
+        Earliest datetime of the next possible calculation, or None for an
+        unknown frequency
+    """
+    periods = max(rate, 1)
+    if frequency == 'hourly':
+        return last_calculation + timedelta(hours=periods)
+    
+    midnight = datetime.combine(
+        last_calculation.date(), datetime.min.time(), tzinfo=last_calculation.tzinfo
+    )
+    if frequency == 'daily':
+        return midnight + timedelta(days=periods)
+    elif frequency == 'weekly':
+        if rate <= 1:
+            # Next Monday (a week later if last_calculation is a Monday)
+            return midnight + timedelta(days=7 - last_calculation.weekday())
+        return midnight + timedelta(days=7 * rate)
+    elif frequency == 'monthly':
+        month_index = last_calculation.month - 1 + periods
+        return midnight.replace(
+            year=last_calculation.year + month_index // 12,
+            month=month_index % 12 + 1,
+            day=1
+        )
+    elif frequency == 'yearly':
+        return midnight.replace(year=last_calculation.year + periods, month=1, day=1)
+    
+    return None
+
+
+def _composite_score(subscores: Sequence[float], weights: Sequence[float]) -> float:
+    """Combine subscores into a weighted world health score.
+    
+    Args:
+        subscores: Subscores (0.0-1.0), e.g. a HealthComponents
+        weights: Weights in the same order as the subscores
+    
+    Returns:
+        Weighted score clamped to 0.0-1.0
+    """
+    score = math.fsum(map(operator.mul, subscores, weights))
+    return max(0.0, min(1.0, score))
+
+
+def _population_trend_score(previous_population: int, current_population: int) -> float:
+    """Map the population change since the last calculation to a score.
+    
+    -10% or worse maps to 0.0, no change to 0.5 and +10% or better to 1.0.
+    
+    Args:
+        previous_population: Population at the previous calculation
+        current_population: Current population
+    
+    Returns:
+        Population trend score (0.0-1.0)
+    """
+    if current_population == 0:
+        return 0.0  # Extinction = worst
+    
+    if previous_population == 0:
+        return 1.0  # Recovery from extinction = best
+    
+    # Calculate growth rate
+    growth_rate = (current_population - previous_population) / previous_population
+    
+    # Map growth rate to score
+    # -0.1 (10% decline) = 0.0, 0.0 (stable) = 0.5, +0.1 (10% growth) = 1.0
+    # Clamping the rate to ±10% keeps the score within 0.0-1.0 without a
+    # second clamp on the score itself
+    if growth_rate <= -0.1:
+        return 0.0
+    if growth_rate >= 0.1:
+        return 1.0
+    return 0.5 + growth_rate * 5.0
+
+
+# Resource health score per StatusLevel.level (DEPLETED=0 ... ABUNDANT=4)
+_STATUS_SCORE_BY_LEVEL = (0.2, 0.4, 0.6, 0.8, 1.0)
+
+# The same scores keyed by Resource.status_id, so scoring a resource does not
+# go through the Resource.status enum lookup
+_STATUS_SCORE_BY_ID = {
+    status.label: _STATUS_SCORE_BY_LEVEL[status.level] for status in StatusLevel
+}
+
+# Resource.status falls back to MODERATE for unknown status ids
+_DEFAULT_STATUS_SCORE = _STATUS_SCORE_BY_LEVEL[StatusLevel.MODERATE.level]
+
 
 class HealthTrend(Enum):
     """Health trend direction."""
@@ -19,6 +154,14 @@ class HealthTrend(Enum):
     UNKNOWN = "unknown"
 
 
+class HealthComponents(NamedTuple):
+    """Subscores that make up the world health score (each 0.0-1.0)."""
+    entity_health: float
+    resource_health: float
+    population_trend: float
+    needs_fulfillment: float
+
+
 class WorldHealthSystem(System):
     """Tracks overall world health based on entity health and resource status.
     
@@ -46,12 +189,23 @@ class WorldHealthSystem(System):
         self.frequency = config.get('frequency', 'daily')  # When to calculate
         self.rate = config.get('rate', 1)  # Every N periods
         
+        # Resolve the frequency once (None = unknown frequency, never recalculate)
+        self._period_check = _PERIOD_START_CHECKS.get(self.frequency)
+        self._period_ordinal, self._ordinals_per_period = _PERIOD_ORDINALS.get(
+            self.frequency, (None, 1)
+        )
+        
         # Historical health values for trend calculation
-        self.health_history: List[float] = []
+        # (ring buffer: appending past max_history drops the oldest value)
         self.max_history = config.get('max_history', 10)  # Keep last N values
+        self.health_history: Deque[float] = deque(maxlen=self.max_history)
         
         # Last calculation time
         self.last_calculation: Optional[datetime] = None
+        self._next_due: Optional[datetime] = None  # Earliest possible next calculation
+        # Period ordinal of last_calculation, recomputed only when it changes
+        self._last_ordinal_source: Optional[datetime] = None
+        self._last_ordinal = 0
         
         # Weights for composite score (sum should be ~1.0)
         self.weights = {
@@ -60,6 +214,10 @@ class WorldHealthSystem(System):
             'population_trend': config.get('weights', {}).get('population_trend', 0.2),
             'needs_fulfillment': config.get('weights', {}).get('needs_fulfillment', 0.1)
         }
+        # Weights in HealthComponents field order, for the composite score
+        self._weight_values: Tuple[float, ...] = tuple(
+            self.weights[field] for field in HealthComponents._fields
+        )
         
         logger.info(
             f"WorldHealthSystem initialized: enabled={self.enabled}, "
@@ -76,7 +234,9 @@ class WorldHealthSystem(System):
         if not self.enabled:
             return
         
-        # Check if we should calculate health
+        # Skip cheaply until the next calculation is possible, then check precisely
+        if self._next_due is not None and current_datetime < self._next_due:
+            return
         if not self._should_calculate(current_datetime):
             return
         
@@ -84,30 +244,31 @@ class WorldHealthSystem(System):
         health_score, components = self._calculate_world_health(world_state, current_datetime)
         
         # Calculate trend
-        trend = self._calculate_trend(health_score)
+        trend_value = self._calculate_trend(health_score).value
         
-        # Store in history
+        # Store in history (the deque evicts the oldest value itself)
         self.health_history.append(health_score)
-        if len(self.health_history) > self.max_history:
-            self.health_history.pop(0)
         
         # Store in world state for logging
         world_state._world_health = {
             'score': health_score,
-            'trend': trend.value,
+            'trend': trend_value,
             'components': components,
             'timestamp': current_datetime
         }
         
         self.last_calculation = current_datetime
-        
-        logger.debug(
-            f"World health: {health_score:.3f} ({trend.value}) - "
-            f"Entities: {components['entity_health']:.3f}, "
-            f"Resources: {components['resource_health']:.3f}, "
-            f"Population: {components['population_trend']:.3f}, "
-            f"Needs: {components['needs_fulfillment']:.3f}"
-        )
+        self._next_due = _next_calculation_at(self.frequency, self.rate, current_datetime)
+        
+        # Skip building the message entirely when debug logging is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"World health: {health_score:.3f} ({trend_value}) - "
+                f"Entities: {components.entity_health:.3f}, "
+                f"Resources: {components.resource_health:.3f}, "
+                f"Population: {components.population_trend:.3f}, "
+                f"Needs: {components.needs_fulfillment:.3f}"
+            )
     
     def _should_calculate(self, current_datetime: datetime) -> bool:
         """Check if we should calculate health at this time.
@@ -123,38 +284,22 @@ class WorldHealthSystem(System):
         
         # Use same logic as simulation logging
         # Check if we're at the start of a period boundary
-        at_period_start = False
-        
-        if self.frequency == 'hourly':
-            at_period_start = True  # Every hour is a period start
-        elif self.frequency == 'daily':
-            at_period_start = current_datetime.hour == 0
-        elif self.frequency == 'weekly':
-            at_period_start = current_datetime.weekday() == 0 and current_datetime.hour == 0
-        elif self.frequency == 'monthly':
-            at_period_start = current_datetime.day == 1 and current_datetime.hour == 0
-        elif self.frequency == 'yearly':
-            at_period_start = (current_datetime.month == 1 and 
-                              current_datetime.day == 1 and 
-                              current_datetime.hour == 0)
-        else:
-            return False
-        
-        if not at_period_start:
+        period_check = self._period_check
+        if period_check is None or not period_check(current_datetime):
             return False
         
         # Check rate (every N periods)
         if self.rate <= 1:
             return True
         
-        # Calculate periods since last calculation
-        periods_elapsed = self._calculate_periods_elapsed(
-            self.last_calculation, 
-            current_datetime, 
-            self.frequency
-        )
-        
-        return periods_elapsed >= self.rate
+        # Calculate periods since last calculation as an integer ordinal difference
+        last_calculation = self.last_calculation
+        period_ordinal = self._period_ordinal
+        if last_calculation is not self._last_ordinal_source:
+            self._last_ordinal_source = last_calculation
+            self._last_ordinal = period_ordinal(last_calculation)
+        elapsed = period_ordinal(current_datetime) - self._last_ordinal
+        return elapsed // self._ordinals_per_period >= self.rate
     
     def _calculate_periods_elapsed(
         self,
@@ -172,24 +317,17 @@ class WorldHealthSystem(System):
         Returns:
             Number of periods elapsed
         """
-        if frequency == 'hourly':
-            return int((end - start).total_seconds() / 3600)
-        elif frequency == 'daily':
-            return (end - start).days
-        elif frequency == 'weekly':
-            return (end - start).days // 7
-        elif frequency == 'monthly':
-            return (end.year - start.year) * 12 + (end.month - start.month)
-        elif frequency == 'yearly':
-            return end.year - start.year
-        else:
+        ordinals = _PERIOD_ORDINALS.get(frequency)
+        if ordinals is None:
             return 0
+        period_ordinal, ordinals_per_period = ordinals
+        return (period_ordinal(end) - period_ordinal(start)) // ordinals_per_period
     
     def _calculate_world_health(
         self,
         world_state: Any,
         current_datetime: datetime
-    ) -> tuple[float, Dict[str, float]]:
+    ) -> tuple[float, HealthComponents]:
         """Calculate composite world health score.
         
         Args:
@@ -197,36 +335,24 @@ class WorldHealthSystem(System):
             current_datetime: Current simulation datetime
             
         Returns:
-            Tuple of (health_score, components_dict)
+            Tuple of (health_score, components)
         """
-        components = {}
-        
         # 1. Entity Health (average health of all entities)
         entity_health = self._calculate_entity_health(world_state)
-        components['entity_health'] = entity_health
         
         # 2. Resource Health (weighted by resource status)
         resource_health = self._calculate_resource_health(world_state)
-        components['resource_health'] = resource_health
         
         # 3. Population Trend (growing = good, declining = bad)
-        population_trend = self._calculate_population_trend(world_state)
-        components['population_trend'] = population_trend
+        population_trend = self._calculate_population_trend(world_state, world_state.get_entity_count())
         
         # 4. Needs Fulfillment (how well needs are being met)
         needs_fulfillment = self._calculate_needs_fulfillment(world_state)
-        components['needs_fulfillment'] = needs_fulfillment
-        
-        # Calculate weighted composite score
-        health_score = (
-            entity_health * self.weights['entity_health'] +
-            resource_health * self.weights['resource_health'] +
-            population_trend * self.weights['population_trend'] +
-            needs_fulfillment * self.weights['needs_fulfillment']
-        )
         
-        # Clamp to 0.0-1.0
-        health_score = max(0.0, min(1.0, health_score))
+        components = HealthComponents(entity_health, resource_health, population_trend, needs_fulfillment)
+        
+        # Calculate weighted composite score (clamped to 0.0-1.0)
+        health_score = _composite_score(components, self._weight_values)
         
         return health_score, components
     
@@ -236,20 +362,13 @@ class WorldHealthSystem(System):
         Returns:
             Average health score (0.0-1.0)
         """
-        entities = world_state.get_all_entities()
-        if not entities:
-            return 0.5  # Neutral if no entities
-        
-        health_values = []
-        for entity in entities.values():
-            health_comp = entity.get_component('Health')
-            if health_comp:
-                health_values.append(health_comp.health)
-        
+        # Gathered per component type (no get_component() call per entity);
+        # entities without a Health component are skipped
+        health_values = [health_comp.health for health_comp in world_state.iter_components('Health')]
         if not health_values:
-            return 0.5  # Neutral if no health components
+            return 0.5  # Neutral if no entities or no health components
         
-        return sum(health_values) / len(health_values)
+        return fmean(health_values)
     
     def _calculate_resource_health(self, world_state: Any) -> float:
         """Calculate resource health based on status levels.
@@ -260,7 +379,6 @@ class WorldHealthSystem(System):
         - MODERATE: 0.6
         - AT_RISK: 0.4
         - DEPLETED: 0.2
-        - CRITICAL: 0.0
         
         Returns:
             Average resource health score (0.0-1.0)
@@ -269,36 +387,31 @@ class WorldHealthSystem(System):
         if not resources:
             return 0.5  # Neutral if no resources
         
-        status_scores = {
-            StatusLevel.ABUNDANT: 1.0,
-            StatusLevel.SUFFICIENT: 0.8,
-            StatusLevel.MODERATE: 0.6,
-            StatusLevel.AT_RISK: 0.4,
-            StatusLevel.DEPLETED: 0.2
-        }
-        
-        resource_scores = []
-        for resource in resources.values():
-            status = resource.status
-            score = status_scores.get(status, 0.5)  # Default to moderate
-            resource_scores.append(score)
-        
-        if not resource_scores:
-            return 0.5
-        
-        return sum(resource_scores) / len(resource_scores)
+        score_for = _STATUS_SCORE_BY_ID.get
+        return fmean([
+            score_for(resource.status_id, _DEFAULT_STATUS_SCORE)
+            for resource in resources.values()
+        ])
     
-    def _calculate_population_trend(self, world_state: Any) -> float:
+    def _calculate_population_trend(
+        self,
+        world_state: Any,
+        current_population: Optional[int] = None
+    ) -> float:
         """Calculate population trend score.
         
         Compares current population to previous value if available.
         Growing population = higher score, declining = lower score.
         
+        Args:
+            world_state: World state instance
+            current_population: Current entity count (counted from world_state if None)
+        
         Returns:
             Population trend score (0.0-1.0)
         """
-        entities = world_state.get_all_entities()
-        current_population = len(entities)
+        if current_population is None:
+            current_population = world_state.get_entity_count()
         
         # Get previous population from world state if available
         # (stored by simulation for birth/death rate calculation)
@@ -309,30 +422,11 @@ class WorldHealthSystem(System):
             world_state._last_population_for_health = current_population
             return 0.5
         
-        # Calculate trend
-        if current_population == 0:
-            return 0.0  # Extinction = worst
-        
-        if previous_population == 0:
-            return 1.0  # Recovery from extinction = best
-        
-        # Calculate growth rate
-        if previous_population > 0:
-            growth_rate = (current_population - previous_population) / previous_population
-        else:
-            growth_rate = 0.0
-        
-        # Map growth rate to score
-        # -0.1 (10% decline) = 0.0, 0.0 (stable) = 0.5, +0.1 (10% growth) = 1.0
-        # Clamp to reasonable bounds
-        growth_rate = max(-0.2, min(0.2, growth_rate))  # Cap at ±20%
-        score = 0.5 + (growth_rate * 5.0)  # Scale to 0.0-1.0
-        score = max(0.0, min(1.0, score))
-        
-        # Update stored population
-        world_state._last_population_for_health = current_population
+        # Update stored population (extinction/recovery leave it unchanged)
+        if current_population and previous_population:
+            world_state._last_population_for_health = current_population
         
-        return score
+        return _population_trend_score(previous_population, current_population)
     
     def _calculate_needs_fulfillment(self, world_state: Any) -> float:
         """Calculate needs fulfillment score.
@@ -342,27 +436,18 @@ class WorldHealthSystem(System):
         Returns:
             Needs fulfillment score (0.0-1.0)
         """
-        entities = world_state.get_all_entities()
-        if not entities:
-            return 0.5  # Neutral if no entities
-        
-        fulfillment_scores = []
-        for entity in entities.values():
-            needs_comp = entity.get_component('Needs')
-            if needs_comp:
-                # Lower needs = better fulfillment
-                # Average of (1 - hunger), (1 - thirst), (1 - rest)
-                hunger_score = 1.0 - needs_comp.hunger
-                thirst_score = 1.0 - needs_comp.thirst
-                rest_score = 1.0 - needs_comp.rest
-                
-                avg_fulfillment = (hunger_score + thirst_score + rest_score) / 3.0
-                fulfillment_scores.append(avg_fulfillment)
-        
-        if not fulfillment_scores:
-            return 0.5
-        
-        return sum(fulfillment_scores) / len(fulfillment_scores)
+        # Lower needs = better fulfillment. The mean over entities of
+        # average(1 - hunger, 1 - thirst, 1 - rest) is 1 - (sum of all three
+        # needs over entities) / (3 * entities), so one running sum is enough.
+        total_needs = 0.0
+        needs_count = 0
+        for needs_comp in world_state.iter_components('Needs'):
+            total_needs += needs_comp.hunger + needs_comp.thirst + needs_comp.rest
+            needs_count += 1
+        if not needs_count:
+            return 0.5  # Neutral if no entities or no needs components
+        
+        return 1.0 - total_needs / (3.0 * needs_count)
     
     def _calculate_trend(self, current_health: float) -> HealthTrend:
         """Calculate health trend based on history.
@@ -377,7 +462,14 @@ class WorldHealthSystem(System):
             return HealthTrend.UNKNOWN
         
         # Compare current to average of last N values
-        recent_avg = sum(self.health_history[-3:]) / min(3, len(self.health_history))
+        # Index the newest entries from the deque's end (O(1) each) instead of
+        # copying a window; summed oldest-first like sum(history[-3:])
+        history = self.health_history
+        count = min(3, len(history))
+        recent_sum = 0.0
+        for index in range(-count, 0):
+            recent_sum += history[index]
+        recent_avg = recent_sum / count
         
         # Threshold for trend detection
         threshold = 0.02  # 2% change
@@ -396,6 +488,7 @@ class WorldHealthSystem(System):
             world_state: World state instance
             
         Returns:
-            Dictionary with health data or None if not calculated yet
+            Dictionary with health data ('score', 'trend', 'components' as
+            HealthComponents, 'timestamp') or None if not calculated yet
         """
         return getattr(world_state, '_world_health', None)
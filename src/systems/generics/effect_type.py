@@ -8,22 +8,29 @@ This enum is generic and may be used for modifiers and other systems.
 """
 
 from enum import Enum
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
+
+
+# Label per effect type level, indexed by the numeric level
+_EFFECT_TYPE_LABELS: Tuple[str, ...] = ("percentage", "direct")
 
 
 class EffectType(Enum):
-    """Effect type enum."""
-    PERCENTAGE = ("percentage", 0)
-    DIRECT = ("direct", 1)
+    """Effect type enum.
+    
+    Each member's value is its numeric level; the label is looked up from
+    the per-level table above.
+    """
+    PERCENTAGE = 0
+    DIRECT = 1
     
-    def __init__(self, label: str, level: int):
+    def __init__(self, level: int):
         """Initialize effect type.
         
         Args:
-            label: Human-readable label (lowercase)
-            level: Numeric level
+            level: Numeric level, also the member's value
         """
-        self.label = label
+        self.label = _EFFECT_TYPE_LABELS[level]
         self.level = level
     
     @property
@@ -37,6 +44,43 @@ class EffectType(Enum):
         return self.name
 
 
+# Lookup tables built once at import: label and lowercase enum name -> member
+_BY_ID: Dict[str, EffectType] = {}
+for _effect_type in EffectType:
+    _BY_ID[_effect_type.label] = _effect_type
+    _BY_ID[_effect_type.name.lower()] = _effect_type
+del _effect_type
+
+# Members ordered by level
+_ALL_BY_LEVEL: Tuple[EffectType, ...] = tuple(sorted(EffectType, key=lambda member: member.level))
+
+
+# Effect direction -> sign applied to the effect value
+# (x + -1.0 * y is exactly x - y, so results match explicit subtraction)
+_DIRECTION_SIGNS: Dict[str, float] = {
+    'increase': 1.0,
+    'decrease': -1.0,
+}
+
+
+def _direction_sign(direction: str) -> float:
+    """Get the sign for an effect direction.
+    
+    Args:
+        direction: 'increase' or 'decrease'
+        
+    Returns:
+        1.0 for 'increase', -1.0 for 'decrease'
+        
+    Raises:
+        ValueError: If direction is not 'increase' or 'decrease'
+    """
+    sign = _DIRECTION_SIGNS.get(direction)
+    if sign is None:
+        raise ValueError(f"Invalid direction: {direction}. Must be 'increase' or 'decrease'")
+    return sign
+
+
 def apply_percentage_effect(base_value: float, effect_value: float, direction: str) -> float:
     """Apply a percentage-based effect to a base value.
     
@@ -48,12 +92,7 @@ def apply_percentage_effect(base_value: float, effect_value: float, direction: s
     Returns:
         Modified value
     """
-    if direction == 'increase':
-        return base_value * (1.0 + effect_value)
-    elif direction == 'decrease':
-        return base_value * (1.0 - effect_value)
-    else:
-        raise ValueError(f"Invalid direction: {direction}. Must be 'increase' or 'decrease'")
+    return base_value * (1.0 + _direction_sign(direction) * effect_value)
 
 
 def apply_direct_effect(base_value: float, effect_value: float, direction: str) -> float:
@@ -67,12 +106,7 @@ def apply_direct_effect(base_value: float, effect_value: float, direction: str)
     Returns:
         Modified value
     """
-    if direction == 'increase':
-        return base_value + effect_value
-    elif direction == 'decrease':
-        return base_value - effect_value
-    else:
-        raise ValueError(f"Invalid direction: {direction}. Must be 'increase' or 'decrease'")
+    return base_value + _direction_sign(direction) * effect_value
 
 
 def apply_effect(
@@ -92,12 +126,17 @@ def apply_effect(
     Returns:
         Modified value
     """
-    if effect_type == EffectType.PERCENTAGE:
-        return apply_percentage_effect(base_value, effect_value, direction)
-    elif effect_type == EffectType.DIRECT:
-        return apply_direct_effect(base_value, effect_value, direction)
-    else:
+    apply = _EFFECT_APPLIERS.get(effect_type)
+    if apply is None:
         raise ValueError(f"Unknown effect type: {effect_type}")
+    return apply(base_value, effect_value, direction)
+
+
+# Effect type -> function applying it
+_EFFECT_APPLIERS: Dict[EffectType, Callable[[float, float, str], float]] = {
+    EffectType.PERCENTAGE: apply_percentage_effect,
+    EffectType.DIRECT: apply_direct_effect,
+}
 
 
 def get_effect_type_by_id(effect_type_id: str) -> Optional[EffectType]:
@@ -109,11 +148,8 @@ def get_effect_type_by_id(effect_type_id: str) -> Optional[EffectType]:
     Returns:
         EffectType enum value or None if not found
     """
-    effect_type_id_lower = effect_type_id.lower()
-    for effect_type in EffectType:
-        if effect_type.label == effect_type_id_lower or effect_type.name.lower() == effect_type_id_lower:
-            return effect_type
-    return None
+    # Keys are already lowercase, so one hashed lookup replaces the enum scan
+    return _BY_ID.get(effect_type_id.lower())
 
 
 def get_all_effect_types() -> list[EffectType]:
@@ -122,4 +158,4 @@ def get_all_effect_types() -> list[EffectType]:
     Returns:
         List of all EffectType enum values ordered by level
     """
-    return sorted(EffectType, key=lambda e: e.level)
+    return list(_ALL_BY_LEVEL)
@@ -12,25 +12,32 @@ This enum is generic and may be used for modifiers and other systems.
 
 from enum import Enum
 from datetime import timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+
+# Label per frequency level, indexed by the numeric level
+_FREQUENCY_LABELS: Tuple[str, ...] = ("hourly", "daily", "weekly", "monthly", "yearly")
 
 
 class RepeatFrequency(Enum):
-    """Repeat frequency enum."""
-    HOURLY = ("hourly", 0)
-    DAILY = ("daily", 1)
-    WEEKLY = ("weekly", 2)
-    MONTHLY = ("monthly", 3)
-    YEARLY = ("yearly", 4)
+    """Repeat frequency enum.
+    
+    Each member's value is its numeric level; the label is looked up from
+    the per-level table above.
+    """
+    HOURLY = 0
+    DAILY = 1
+    WEEKLY = 2
+    MONTHLY = 3
+    YEARLY = 4
     
-    def __init__(self, label: str, level: int):
+    def __init__(self, level: int):
         """Initialize repeat frequency.
         
         Args:
-            label: Human-readable label (lowercase)
-            level: Numeric level
+            level: Numeric level, also the member's value
         """
-        self.label = label
+        self.label = _FREQUENCY_LABELS[level]
         self.level = level
     
     @property
@@ -52,20 +59,27 @@ class RepeatFrequency(Enum):
         Returns:
             Timedelta representing the frequency
         """
-        if self == RepeatFrequency.HOURLY:
-            return timedelta(hours=rate)
-        elif self == RepeatFrequency.DAILY:
-            return timedelta(days=rate)
-        elif self == RepeatFrequency.WEEKLY:
-            return timedelta(weeks=rate)
-        elif self == RepeatFrequency.MONTHLY:
-            # Approximate: 30 days per month
-            return timedelta(days=30 * rate)
-        elif self == RepeatFrequency.YEARLY:
-            # Approximate: 365 days per year
-            return timedelta(days=365 * rate)
-        else:
-            raise ValueError(f"Unknown repeat frequency: {self}")
+        return _PERIOD_TIMEDELTAS[self] * rate
+
+
+# Length of one period of each frequency
+_PERIOD_TIMEDELTAS: Dict[RepeatFrequency, timedelta] = {
+    RepeatFrequency.HOURLY: timedelta(hours=1),
+    RepeatFrequency.DAILY: timedelta(days=1),
+    RepeatFrequency.WEEKLY: timedelta(weeks=1),
+    RepeatFrequency.MONTHLY: timedelta(days=30),  # Approximate: 30 days per month
+    RepeatFrequency.YEARLY: timedelta(days=365),  # Approximate: 365 days per year
+}
+
+# Lookup tables built once at import: label and lowercase enum name -> member
+_BY_ID: Dict[str, RepeatFrequency] = {}
+for _frequency in RepeatFrequency:
+    _BY_ID[_frequency.label] = _frequency
+    _BY_ID[_frequency.name.lower()] = _frequency
+del _frequency
+
+# Members ordered by level
+_ALL_BY_LEVEL: Tuple[RepeatFrequency, ...] = tuple(sorted(RepeatFrequency, key=lambda member: member.level))
 
 
 def get_repeat_frequency_by_id(frequency_id: str) -> Optional[RepeatFrequency]:
@@ -77,11 +91,8 @@ def get_repeat_frequency_by_id(frequency_id: str) -> Optional[RepeatFrequency]:
     Returns:
         RepeatFrequency enum value or None if not found
     """
-    frequency_id_lower = frequency_id.lower()
-    for frequency in RepeatFrequency:
-        if frequency.label == frequency_id_lower or frequency.name.lower() == frequency_id_lower:
-            return frequency
-    return None
+    # Keys are already lowercase, so one hashed lookup replaces the enum scan
+    return _BY_ID.get(frequency_id.lower())
 
 
 def get_all_repeat_frequencies() -> list[RepeatFrequency]:
@@ -90,4 +101,4 @@ def get_all_repeat_frequencies() -> list[RepeatFrequency]:
     Returns:
         List of all RepeatFrequency enum values ordered by level
     """
-    return sorted(RepeatFrequency, key=lambda f: f.level)
+    return list(_ALL_BY_LEVEL)
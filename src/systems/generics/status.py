@@ -8,28 +8,36 @@ This provides a standardized 5-stage status system:
 - ABUNDANT (green): At or near capacity (>= 80%)
 """
 
+from bisect import bisect_right
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+
+# Label and color per status level, indexed by the numeric level (0-4)
+_STATUS_LABELS: Tuple[str, ...] = ("depleted", "at_risk", "moderate", "sufficient", "abundant")
+_STATUS_COLORS: Tuple[str, ...] = ("black", "red", "yellow", "blue", "green")
 
 
 class StatusLevel(Enum):
-    """Status level enum with color coding."""
-    DEPLETED = ("depleted", "black", 0)
-    AT_RISK = ("at_risk", "red", 1)
-    MODERATE = ("moderate", "yellow", 2)
-    SUFFICIENT = ("sufficient", "blue", 3)
-    ABUNDANT = ("abundant", "green", 4)
+    """Status level enum with color coding.
     
-    def __init__(self, label: str, color: str, level: int):
+    Each member's value is its numeric level; label and color are looked up
+    from the per-level tables above.
+    """
+    DEPLETED = 0
+    AT_RISK = 1
+    MODERATE = 2
+    SUFFICIENT = 3
+    ABUNDANT = 4
+    
+    def __init__(self, level: int):
         """Initialize status level.
         
         Args:
-            label: Human-readable label (lowercase with underscores)
-            color: Color identifier for visualization
-            level: Numeric level (0-4)
+            level: Numeric level (0-4), also the member's value
         """
-        self.label = label  # Use 'label' instead of 'name' to avoid conflict with Enum.name
-        self.color = color
+        self.label = _STATUS_LABELS[level]  # Use 'label' instead of 'name' to avoid conflict with Enum.name
+        self.color = _STATUS_COLORS[level]
         self.level = level
     
     @property
@@ -43,6 +51,37 @@ class StatusLevel(Enum):
         return self.name  # Use Enum's built-in name property (e.g., "DEPLETED")
 
 
+# Lookup tables built once at import: label and lowercase enum name -> member
+_BY_ID: Dict[str, StatusLevel] = {}
+for _status in StatusLevel:
+    _BY_ID[_status.label] = _status
+    _BY_ID[_status.name.lower()] = _status
+del _status
+
+# Members ordered by level
+_ALL_BY_LEVEL: Tuple[StatusLevel, ...] = tuple(sorted(StatusLevel, key=lambda member: member.level))
+
+
+# Status thresholds: a value below thresholds[i] (and not below any earlier
+# threshold) maps to levels[i]; values at or above the last threshold map to
+# the last level
+_UTILIZATION_THRESHOLDS: Tuple[float, ...] = (5, 20, 50, 80)  # Percent of max capacity
+_UTILIZATION_LEVELS: Tuple[StatusLevel, ...] = (
+    StatusLevel.DEPLETED,
+    StatusLevel.AT_RISK,
+    StatusLevel.MODERATE,
+    StatusLevel.SUFFICIENT,
+    StatusLevel.ABUNDANT,
+)
+_ABSOLUTE_THRESHOLDS: Tuple[float, ...] = (100, 500, 2000)  # Amounts, for uncapped resources
+_ABSOLUTE_LEVELS: Tuple[StatusLevel, ...] = (
+    StatusLevel.AT_RISK,
+    StatusLevel.MODERATE,
+    StatusLevel.SUFFICIENT,
+    StatusLevel.ABUNDANT,
+)
+
+
 def calculate_resource_status(
     current_amount: float,
     max_capacity: Optional[float] = None
@@ -64,29 +103,13 @@ def calculate_resource_status(
     if max_capacity is None:
         # For unlimited resources, use absolute amounts
         # This is a simple heuristic - may need adjustment based on use cases
-        if current_amount < 100:
-            return StatusLevel.AT_RISK
-        elif current_amount < 500:
-            return StatusLevel.MODERATE
-        elif current_amount < 2000:
-            return StatusLevel.SUFFICIENT
-        else:
-            return StatusLevel.ABUNDANT
+        return _ABSOLUTE_LEVELS[bisect_right(_ABSOLUTE_THRESHOLDS, current_amount)]
     
     # Calculate utilization percentage
     utilization = (current_amount / max_capacity) * 100
     
     # Determine status based on utilization
-    if utilization < 5:
-        return StatusLevel.DEPLETED
-    elif utilization < 20:
-        return StatusLevel.AT_RISK
-    elif utilization < 50:
-        return StatusLevel.MODERATE
-    elif utilization < 80:
-        return StatusLevel.SUFFICIENT
-    else:
-        return StatusLevel.ABUNDANT
+    return _UTILIZATION_LEVELS[bisect_right(_UTILIZATION_THRESHOLDS, utilization)]
 
 
 def get_status_by_id(status_id: str) -> Optional[StatusLevel]:
@@ -98,12 +121,8 @@ def get_status_by_id(status_id: str) -> Optional[StatusLevel]:
     Returns:
         StatusLevel enum value or None if not found
     """
-    status_id_lower = status_id.lower()
-    for status in StatusLevel:
-        # Check both label (lowercase) and name (uppercase enum name)
-        if status.label == status_id_lower or status.name.lower() == status_id_lower:
-            return status
-    return None
+    # Keys are already lowercase, so one hashed lookup replaces the enum scan
+    return _BY_ID.get(status_id.lower())
 
 
 def get_all_status_levels() -> list[StatusLevel]:
@@ -112,4 +131,4 @@ def get_all_status_levels() -> list[StatusLevel]:
     Returns:
         List of all StatusLevel enum values ordered by level (0-4)
     """
-    return sorted(StatusLevel, key=lambda s: s.level)
+    return list(_ALL_BY_LEVEL)
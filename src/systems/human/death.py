@@ -4,18 +4,38 @@ Checks for death from health degradation and age-based mortality.
 Uses probability-based mortality curve allowing rare outliers past 100.
 """
 
-from datetime import datetime
-from typing import Any, Dict, Optional
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.core.system import System
 from src.core.logging import get_logger
-from src.models.components.health import HealthComponent
 from src.models.components.age import AgeComponent
 
 
 logger = get_logger('systems.human.death')
 
 
+def _min_days_for_age(age_years: float) -> int:
+    """Get the fewest whole days lived at which AgeComponent reports age_years.
+    
+    AgeComponent.get_age_years() is days / 365.25 over whole elapsed days,
+    so an entity is at least age_years old exactly when it has lived this
+    many days.
+    
+    Args:
+        age_years: Age threshold in years
+    
+    Returns:
+        Smallest day count d with d / 365.25 >= age_years
+    """
+    days = math.ceil(age_years * 365.25) - 1
+    while days / 365.25 < age_years:
+        days += 1
+    return days
+
+
 class DeathSystem(System):
     """System that handles entity death from health and age-based mortality.
     
@@ -38,6 +58,9 @@ class DeathSystem(System):
         self.peak_mortality_age: float = 85.0
         self.chance_increase_per_year: float = 0.00001
         self.chance_multiplier_per_year: float = 1.1
+        # Age in years -> (addend, factor, cap) of the mortality curve,
+        # filled lazily and reset whenever the curve parameters are loaded
+        self._age_curve: Dict[float, Tuple[float, float, float]] = {}
     
     def init(self, world_state: Any, config: Dict[str, Any]) -> None:
         """Initialize the system with configuration.
@@ -59,6 +82,7 @@ class DeathSystem(System):
         self.peak_mortality_age = age_mortality.get('peak_mortality_age', 85.0)
         self.chance_increase_per_year = age_mortality.get('chance_increase_per_year', 0.00001)
         self.chance_multiplier_per_year = age_mortality.get('chance_multiplier_per_year', 1.1)
+        self._age_curve = {}
         
         logger.debug(
             f"Initialized {self.system_id}: enabled={self.enabled}, "
@@ -86,78 +110,52 @@ class DeathSystem(System):
         # Get all entities with HealthComponent
         entities = world_state.query_entities_by_component('Health')
         
+        # Resolved once per tick: active modifiers do not change while
+        # entities are being checked. rng.uniform(a, b) is
+        # a + (b - a) * rng.random(), so the base chance is drawn through
+        # random() with a precomputed span.
+        random = world_state.rng.random
+        modifiers = world_state.get_modifiers_for_system(self.system_id)
+        # Entities born after this cutoff are younger than old_age_start,
+        # so their age check is a single datetime comparison
+        birth_cutoff = current_datetime - timedelta(days=_min_days_for_age(self.old_age_start))
+        chance_min = self.old_age_death_chance_min
+        chance_span = self.old_age_death_chance_max - chance_min
+        
         entities_to_remove = []
         
         for entity in entities:
-            health = entity.get_component('Health')
+            # Read each component straight from the entity's component store once
+            components = entity._components
+            health = components.get('Health')
             if not health:
                 continue
             
-            # Check health-based death
-            if self._check_health_death(entity, health):
+            # Health-based death (health <= 0)
+            if health.health <= 0.0:
                 entities_to_remove.append((entity, 'health'))
                 continue
             
-            # Check age-based death
-            if self._check_age_death(entity, health, current_datetime, world_state):
+            # Age-based death, only checked from old_age_start on
+            age_component = components.get('Age')
+            if not age_component or age_component.birth_date > birth_cutoff:
+                continue
+            age_years = age_component.get_age_years(current_datetime)
+            
+            # Randomize base death chance at old_age_start, then roll for death
+            # (no roll is needed when modifiers bring the chance down to zero)
+            base_chance = chance_min + chance_span * random()
+            death_chance = self._age_death_chance(age_years, base_chance, modifiers)
+            if death_chance > 0.0 and random() < death_chance:
                 entities_to_remove.append((entity, 'age'))
         
-        # Remove dead entities
+        # Remove dead entities, then hand their resources back to the world
+        # in one update per resource
+        returned_resources: Dict[str, float] = {}
         for entity, reason in entities_to_remove:
-            self._remove_entity(entity, reason, world_state)
-    
-    def _check_health_death(
-        self,
-        entity: Any,
-        health: HealthComponent
-    ) -> bool:
-        """Check if entity dies from health degradation.
-        
-        Args:
-            entity: Entity instance
-            health: HealthComponent instance
-            
-        Returns:
-            True if entity should die (health <= 0)
-        """
-        return health.health <= 0.0
-    
-    def _check_age_death(
-        self,
-        entity: Any,
-        health: HealthComponent,
-        current_datetime: datetime,
-        world_state: Any
-    ) -> bool:
-        """Check if entity dies from age-based mortality.
-        
-        Uses probability curve: linear increase from old_age_start to peak_mortality_age,
-        then exponential increase (allowing rare outliers past 100).
-        
-        Args:
-            entity: Entity instance
-            health: HealthComponent instance
-            current_datetime: Current simulation datetime
-            world_state: World state instance (for RNG)
-            
-        Returns:
-            True if entity should die based on age probability
-        """
-        age_component = entity.get_component('Age')
-        if not age_component:
-            return False
-        
-        age_years = age_component.get_age_years(current_datetime)
-        
-        # Only check if age >= old_age_start
-        if age_years < self.old_age_start:
-            return False
-        
-        # Calculate death probability based on age curve
-        death_chance = self._calculate_age_death_probability(age_years, world_state)
-        
-        # Roll for death
-        return world_state.rng.random() < death_chance
+            self._remove_entity(entity, reason, world_state, returned_resources)
+        if returned_resources:
+            self._return_resources(returned_resources, world_state)
     
     def _calculate_age_death_probability(
         self,
@@ -185,46 +183,82 @@ class DeathSystem(System):
             self.old_age_death_chance_min,
             self.old_age_death_chance_max
         )
+        modifiers = world_state.get_modifiers_for_system(self.system_id)
+        return self._age_death_chance(age_years, base_chance, modifiers)
+    
+    def _age_death_chance(
+        self,
+        age_years: float,
+        base_chance: float,
+        modifiers: List[Any]
+    ) -> float:
+        """Apply the age mortality curve and modifiers to a base death chance.
         
-        if age_years <= self.peak_mortality_age:
-            # Linear increase from old_age_start to peak_mortality_age
-            years_past_start = age_years - self.old_age_start
-            years_to_peak = self.peak_mortality_age - self.old_age_start
-            
-            if years_to_peak > 0:
-                # Linear interpolation
-                progress = years_past_start / years_to_peak
-                peak_chance = base_chance + (self.chance_increase_per_year * years_past_start)
-                death_chance = min(1.0, peak_chance)
-            else:
-                death_chance = base_chance
-        else:
-            # Exponential increase after peak_mortality_age
-            years_past_peak = age_years - self.peak_mortality_age
-            years_to_peak = self.peak_mortality_age - self.old_age_start
-            
-            # Calculate peak chance
-            peak_chance = base_chance + (self.chance_increase_per_year * years_to_peak)
-            
-            # Exponential increase: chance = peak_chance * (multiplier ^ years_past_peak)
-            death_chance = peak_chance * (self.chance_multiplier_per_year ** years_past_peak)
-            
-            # Cap at reasonable maximum (very high but not 1.0 to allow outliers)
-            death_chance = min(0.99, death_chance)
+        Args:
+            age_years: Age in years (at least old_age_start)
+            base_chance: Randomized death chance at old_age_start
+            modifiers: Active modifiers targeting DeathSystem
         
-        # Apply modifiers targeting DeathSystem
-        modifiers = world_state.get_modifiers_for_system(self.system_id)
-        for modifier in modifiers:
-            death_chance = modifier.calculate_effect(death_chance)
+        Returns:
+            Death probability per hour (0.0-0.99)
+        """
+        # The curve terms only depend on the age, and ages only change once
+        # per simulated day, so they are computed once per distinct age
+        curve = self._age_curve.get(age_years)
+        if curve is None:
+            curve = self._age_curve[age_years] = self._age_curve_terms(age_years)
+        addend, factor, cap = curve
+        death_chance = (base_chance + addend) * factor
+        
+        # Apply modifiers targeting DeathSystem to the capped curve value.
+        # Every cap is at least 0.99, so without modifiers the final clamp
+        # below covers it.
+        if modifiers:
+            death_chance = min(cap, death_chance)
+            for modifier in modifiers:
+                death_chance = modifier.calculate_effect(death_chance)
         
         # Ensure valid range
         return max(0.0, min(0.99, death_chance))
     
+    def _age_curve_terms(self, age_years: float) -> Tuple[float, float, float]:
+        """Compute the deterministic part of the age mortality curve.
+        
+        The death chance for a base chance is min(cap, (base_chance + addend) * factor):
+        - Up to peak_mortality_age: linear increase from old_age_start
+          (addend grows per year, factor 1.0, capped at 1.0)
+        - After peak_mortality_age: exponential increase from the peak chance
+          (factor = multiplier ^ years past peak, capped at 0.99 to allow outliers)
+        
+        Args:
+            age_years: Age in years (at least old_age_start)
+        
+        Returns:
+            Tuple of (addend, factor, cap)
+        """
+        years_to_peak = self.peak_mortality_age - self.old_age_start
+        
+        if age_years <= self.peak_mortality_age:
+            if years_to_peak > 0:
+                # Linear interpolation
+                years_past_start = age_years - self.old_age_start
+                return (self.chance_increase_per_year * years_past_start, 1.0, 1.0)
+            return (0.0, 1.0, math.inf)
+        
+        # Exponential increase: chance = peak_chance * (multiplier ^ years_past_peak)
+        years_past_peak = age_years - self.peak_mortality_age
+        return (
+            self.chance_increase_per_year * years_to_peak,
+            self.chance_multiplier_per_year ** years_past_peak,
+            0.99
+        )
+    
     def _remove_entity(
         self,
         entity: Any,
         reason: str,
-        world_state: Any
+        world_state: Any,
+        returned_resources: Optional[Dict[str, float]] = None
     ) -> None:
         """Remove dead entity from world state.
         
@@ -232,11 +266,81 @@ class DeathSystem(System):
             entity: Entity instance to remove
             reason: Death reason ('health' or 'age')
             world_state: World state instance
+            returned_resources: Optional resource_id -> amount totals to add the
+                entity's wealth to; the caller returns them to the world with
+                _return_resources(). If None, they are returned immediately.
+        """
+        components = entity._components
+        
+        # Death details are only gathered when they will actually be logged
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(
+                f"Entity {entity.entity_id} died from {reason}"
+                f"{self._describe_death(components, reason, world_state)}"
+            )
+        
+        # Return all resources to world supply
+        # NOTE: Future phases will add family inheritance, government policies, etc.
+        # For now, all resources return to world supply when humans die
+        wealth = components.get('Wealth')
+        if wealth and wealth.resources:
+            returns = {} if returned_resources is None else returned_resources
+            returned_parts = []
+            for resource_id, amount in wealth.resources.items():
+                if amount > 0:
+                    returns[resource_id] = returns.get(resource_id, 0.0) + amount
+                    if log_info:
+                        returned_parts.append(f"{resource_id}: {amount:.2f}")
+            
+            if returned_parts:
+                resources_str = ", ".join(returned_parts)
+                logger.info(
+                    f"Entity {entity.entity_id} resources returned to world supply: {resources_str}"
+                )
+            if returned_resources is None and returns:
+                self._return_resources(returns, world_state)
+        
+        # Remove from world state
+        world_state.remove_entity(entity.entity_id)
+    
+    def _return_resources(self, amounts: Dict[str, float], world_state: Any) -> None:
+        """Add resources left by dead entities back to the world supply.
+        
+        Args:
+            amounts: resource_id -> total amount to return
+            world_state: World state instance
+        """
+        for resource_id, amount in amounts.items():
+            resource = world_state.get_resource(resource_id)
+            if resource:
+                resource.add(amount)
+            else:
+                logger.warning(
+                    f"Dead entities had {resource_id} ({amount:.2f}) but "
+                    f"resource not found in world state"
+                )
+    
+    def _describe_death(
+        self,
+        components: Dict[str, Any],
+        reason: str,
+        world_state: Any
+    ) -> str:
+        """Build the death cause and age suffix for the death log message.
+        
+        Args:
+            components: Component store of the dead entity
+            reason: Death reason ('health' or 'age')
+            world_state: World state instance
+        
+        Returns:
+            Suffix such as " - unmet needs: hunger(0.80), health(0.00) (age 42.0 years)"
         """
         current_datetime = world_state.simulation_time.current_datetime
         
         # Get age for logging
-        age_component = entity.get_component('Age')
+        age_component = components.get('Age')
         age_info = ""
         if age_component:
             age_years = age_component.get_age_years(current_datetime)
@@ -247,9 +351,9 @@ class DeathSystem(System):
         
         if reason == 'health':
             # Check what caused the health degradation
-            needs = entity.get_component('Needs')
-            pressure = entity.get_component('Pressure')
-            health = entity.get_component('Health')
+            needs = components.get('Needs')
+            pressure = components.get('Pressure')
+            health = components.get('Health')
             
             unmet_needs = []
             if needs:
@@ -276,33 +380,4 @@ class DeathSystem(System):
         else:
             death_cause = " - natural causes (age)"
         
-        logger.info(
-            f"Entity {entity.entity_id} died from {reason}{death_cause}{age_info}"
-        )
-        
-        # Return all resources to world supply
-        # NOTE: Future phases will add family inheritance, government policies, etc.
-        # For now, all resources return to world supply when humans die
-        wealth = entity.get_component('Wealth')
-        if wealth and wealth.resources:
-            returned_resources = []
-            for resource_id, amount in wealth.resources.items():
-                if amount > 0:
-                    resource = world_state.get_resource(resource_id)
-                    if resource:
-                        returned = resource.add(amount)
-                        returned_resources.append(f"{resource_id}: {returned:.2f}")
-                    else:
-                        logger.warning(
-                            f"Entity {entity.entity_id} had {resource_id} ({amount:.2f}) but "
-                            f"resource not found in world state"
-                        )
-            
-            if returned_resources:
-                resources_str = ", ".join(returned_resources)
-                logger.info(
-                    f"Entity {entity.entity_id} resources returned to world supply: {resources_str}"
-                )
-        
-        # Remove from world state
-        world_state.remove_entity(entity.entity_id)
+        return f"{death_cause}{age_info}"
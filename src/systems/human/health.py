@@ -9,9 +9,7 @@ from typing import Any, Dict
 
 from src.core.system import System
 from src.core.logging import get_logger
-from src.models.components.health import HealthComponent
 from src.models.components.pressure import PressureComponent
-from src.models.components.needs import NeedsComponent
 
 
 logger = get_logger('systems.human.health')
@@ -108,117 +106,54 @@ class HealthSystem(System):
         # Get all entities with HealthComponent
         entities = world_state.query_entities_by_component('Health')
         
+        # Bind the RNG draw and the damage/healing ranges once per tick.
+        # rng.uniform(a, b) is a + (b - a) * rng.random(), so drawing through
+        # random() with precomputed spans gives identical values.
+        random = world_state.rng.random
+        pressure_min = self.pressure_damage_min
+        pressure_span = self.pressure_damage_max - pressure_min
+        hunger_min = self.hunger_damage_min
+        hunger_span = self.hunger_damage_max - hunger_min
+        thirst_min = self.thirst_damage_min
+        thirst_span = self.thirst_damage_max - thirst_min
+        rest_min = self.rest_damage_min
+        rest_span = self.rest_damage_max - rest_min
+        healing_min = self.healing_rate_min
+        healing_span = self.healing_rate_max - healing_min
+        
         for entity in entities:
-            health = entity.get_component('Health')
+            # Read each component straight from the entity's component store once
+            components = entity._components
+            health = components.get('Health')
             if not health:
                 continue
             
             # Calculate damage from all sources
-            damage = self._calculate_damage(entity, world_state)
+            damage = 0.0
             
-            if damage > 0:
-                # Apply randomized damage
-                self._apply_damage(health, damage, world_state)
+            # Damage from pressure (scales with pressure level 0.0-1.0)
+            pressure = components.get('Pressure')
+            if pressure and pressure.pressure_level > 0:
+                damage += (pressure_min + pressure_span * random()) * pressure.pressure_level
             
-            # Check if needs are met for healing
-            needs = entity.get_component('Needs')
-            if needs and self._needs_met(needs):
-                # Apply randomized healing
-                self._apply_healing(health, world_state)
-    
-    def _calculate_damage(self, entity: Any, world_state: Any) -> float:
-        """Calculate total damage from all sources.
-        
-        Args:
-            entity: Entity instance
-            world_state: World state instance
+            # Damage from unmet needs (only if a need is significant,
+            # scaled by the need level)
+            needs = components.get('Needs')
+            if needs:
+                hunger = needs.hunger
+                thirst = needs.thirst
+                rest = needs.rest
+                if hunger > 0.5:
+                    damage += (hunger_min + hunger_span * random()) * hunger
+                if thirst > 0.5:
+                    damage += (thirst_min + thirst_span * random()) * thirst
+                if rest > 0.5:
+                    damage += (rest_min + rest_span * random()) * rest
             
-        Returns:
-            Total damage amount (0.0-1.0 scale)
-        """
-        total_damage = 0.0
-        
-        # Damage from pressure
-        pressure = entity.get_component('Pressure')
-        if pressure and pressure.pressure_level > 0:
-            # Damage scales with pressure level (0.0-1.0)
-            pressure_damage_base = world_state.rng.uniform(
-                self.pressure_damage_min,
-                self.pressure_damage_max
-            )
-            total_damage += pressure_damage_base * pressure.pressure_level
-        
-        # Damage from unmet needs
-        needs = entity.get_component('Needs')
-        if needs:
-            # Hunger damage (scales with hunger level)
-            if needs.hunger > 0.5:  # Only damage if hunger is significant
-                hunger_damage = world_state.rng.uniform(
-                    self.hunger_damage_min,
-                    self.hunger_damage_max
-                )
-                total_damage += hunger_damage * needs.hunger
-            
-            # Thirst damage (scales with thirst level)
-            if needs.thirst > 0.5:  # Only damage if thirst is significant
-                thirst_damage = world_state.rng.uniform(
-                    self.thirst_damage_min,
-                    self.thirst_damage_max
-                )
-                total_damage += thirst_damage * needs.thirst
-            
-            # Rest damage (scales with rest level)
-            if needs.rest > 0.5:  # Only damage if rest is significant
-                rest_damage = world_state.rng.uniform(
-                    self.rest_damage_min,
-                    self.rest_damage_max
-                )
-                total_damage += rest_damage * needs.rest
-        
-        return total_damage
-    
-    def _apply_damage(
-        self,
-        health: HealthComponent,
-        damage: float,
-        world_state: Any
-    ) -> None:
-        """Apply randomized damage to health.
-        
-        Args:
-            health: HealthComponent instance
-            damage: Base damage amount
-            world_state: World state instance (for RNG if needed)
-        """
-        health.take_damage(damage)
-    
-    def _apply_healing(
-        self,
-        health: HealthComponent,
-        world_state: Any
-    ) -> None:
-        """Apply randomized healing if health is below max.
-        
-        Args:
-            health: HealthComponent instance
-            world_state: World state instance (for RNG)
-        """
-        if health.health < health.max_health:
-            healing_amount = world_state.rng.uniform(
-                self.healing_rate_min,
-                self.healing_rate_max
-            )
-            health.heal(healing_amount)
-    
-    def _needs_met(self, needs: NeedsComponent) -> bool:
-        """Check if needs are met (low hunger, thirst, rest).
-        
-        Args:
-            needs: NeedsComponent instance
+            if damage > 0:
+                health.take_damage(damage)
             
-        Returns:
-            True if needs are met (all below 0.5 threshold)
-        """
-        return (needs.hunger < 0.5 and 
-                needs.thirst < 0.5 and 
-                needs.rest < 0.5)
+            # Heal slowly if needs are met (all below 0.5) and health is below max
+            if needs and hunger < 0.5 and thirst < 0.5 and rest < 0.5:
+                if health.health < health.max_health:
+                    health.heal(healing_min + healing_span * random())
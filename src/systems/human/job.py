@@ -8,6 +8,7 @@ In Phase 6 (Economy & Markets), money will come from proper economic systems. Fo
 replenishes monthly to prevent running out. If workers are not paid, they will quit their jobs.
 """
 
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -22,34 +23,137 @@ from src.models.components.wealth import WealthComponent
 logger = get_logger('systems.human.job')
 
 
+# Bit per frequency; a tick's active frequencies are OR-ed together
+_HOURLY = 1
+_DAILY = 2
+_WEEKLY = 4
+_MONTHLY = 8
+_YEARLY = 16
+
+_FREQUENCY_BITS = {
+    'hourly': _HOURLY,
+    'daily': _DAILY,
+    'weekly': _WEEKLY,
+    'monthly': _MONTHLY,
+    'yearly': _YEARLY,
+}
+
+
+def _frequency_mask(frequency: str) -> int:
+    """Get the bit for a frequency name.
+    
+    Args:
+        frequency: 'hourly', 'daily', 'weekly', 'monthly', or 'yearly'
+        
+    Returns:
+        Frequency bit, or 0 for unknown frequencies (which never run)
+    """
+    return _FREQUENCY_BITS.get(frequency, 0)
+
+
+def _active_frequencies(current_datetime: datetime) -> int:
+    """Get the frequencies that run on a tick as a bitmask.
+    
+    Daily and longer periods run at hour 0; weeks start on Monday, months
+    on the 1st and years on January 1st.
+    
+    Args:
+        current_datetime: Current simulation datetime
+    
+    Returns:
+        OR of the bits of every frequency that runs this tick
+    """
+    if current_datetime.hour != 0:
+        return _HOURLY
+    
+    active = _HOURLY | _DAILY
+    if current_datetime.weekday() == 0:
+        active |= _WEEKLY
+    if current_datetime.day == 1:
+        active |= _MONTHLY
+        if current_datetime.month == 1:
+            active |= _YEARLY
+    return active
+
+
 def _should_run_on_frequency(frequency: str, current_datetime: datetime) -> bool:
     """Check if system should run based on frequency.
     
     Args:
         frequency: 'hourly', 'daily', 'weekly', 'monthly', or 'yearly'
         current_datetime: Current simulation datetime
-        
+    
     Returns:
         True if system should run this tick
     """
-    if frequency == 'hourly':
-        return True
+    return bool(_active_frequencies(current_datetime) & _frequency_mask(frequency))
+
+
+def _hiring_score(
+    skills: Optional[SkillsComponent],
+    required_skill: str,
+    skill_weight: float,
+    charisma_weight: float
+) -> float:
+    """Calculate the probability of hiring an entity for a job.
+    
+    Args:
+        skills: Entity's skills component, if any
+        required_skill: Job skill the job relies on
+        skill_weight: Weight of the required skill in the score
+        charisma_weight: Weight of charisma in the score
+    
+    Returns:
+        Hiring probability in 0-1 (0.5 without skills or weights)
+    """
+    if not skills:
+        # No skills component - use base probability
+        return 0.5
+    
+    # Normalize to 0-1 range (assuming max possible is skill_weight + charisma_weight)
+    max_possible = skill_weight + charisma_weight
+    if max_possible <= 0:
+        return 0.5
+    
+    skill_value = skills.get_job_skill(required_skill, 0.0)
+    return (skill_value * skill_weight + skills.charisma * charisma_weight) / max_possible
+
+
+def _payment_terms(
+    job_id: str,
+    job_config: Dict[str, Any]
+) -> Tuple[Tuple[str, float, Optional[float], Optional[float]], ...]:
+    """Resolve a job's payment bounds for hiring.
+    
+    Args:
+        job_id: Job identifier
+        job_config: Job configuration with payment, min_payment and max_payment_cap
     
-    if frequency == 'daily':
-        return current_datetime.hour == 0
+    Returns:
+        (resource_id, base_amount, min_amount, max_amount) per payment
+        resource, with None where no bound is configured
+    """
+    # Get base payment from config (payment: {resource_id: amount})
+    base_payment = job_config.get('payment', {})
+    if not isinstance(base_payment, dict):
+        base_payment = {}
     
-    if frequency == 'weekly':
-        return current_datetime.weekday() == 0 and current_datetime.hour == 0
+    min_payment = job_config.get('min_payment', {})
+    if not isinstance(min_payment, dict):
+        min_payment = {}
     
-    if frequency == 'monthly':
-        return current_datetime.day == 1 and current_datetime.hour == 0
+    max_payment_cap = job_config.get('max_payment_cap', {})
+    if not isinstance(max_payment_cap, dict):
+        max_payment_cap = {}
     
-    if frequency == 'yearly':
-        return (current_datetime.month == 1 and 
-                current_datetime.day == 1 and 
-                current_datetime.hour == 0)
+    # If no payment config, default to empty (shouldn't happen, but handle gracefully)
+    if not base_payment:
+        logger.warning(f"Job {job_id} has no payment configuration")
     
-    return False
+    return tuple(
+        (resource_id, base_amount, min_payment.get(resource_id), max_payment_cap.get(resource_id))
+        for resource_id, base_amount in base_payment.items()
+    )
 
 
 class JobSystem(System):
@@ -93,6 +197,16 @@ class JobSystem(System):
         
         # Track last assignment month to avoid duplicate assignments
         self.last_assignment_month: Optional[Tuple[int, int]] = None  # (year, month)
+        
+        # Bumped on every hire, job loss and raise so analytics can tell
+        # when employment state may have changed
+        self.employment_version: int = 0
+        
+        # Workers per job_id, rebuilt from the Employment components when the
+        # world state's entity version moves and updated in place by _set_job
+        self._worker_counts: Dict[str, int] = {}
+        self._worker_counts_source: Any = None
+        self._worker_counts_version: Optional[int] = None
     
     def init(self, world_state: Any, config: Dict[str, Any]) -> None:
         """Initialize the system with configuration.
@@ -186,17 +300,24 @@ class JobSystem(System):
             'job_type': job_config.get('job_type', 'production'),  # production or service
             'prioritize_unemployed': job_config.get('prioritize_unemployed', False),
         }
+        parsed['payment_terms'] = _payment_terms(job_id, parsed)
         
         # Production config (optional - service jobs don't produce)
         if 'production' in job_config:
             prod_config = job_config['production']
+            frequency = prod_config.get('frequency', self.production_frequency)
             parsed['production'] = {
                 'resource_id': prod_config.get('resource_id'),
                 'rate': float(prod_config.get('rate', 0.0)),
-                'frequency': prod_config.get('frequency', self.production_frequency)
+                'frequency': frequency,
+                'frequency_mask': _frequency_mask(frequency)
             }
+            # Production jobs pay when they produce
+            parsed['payment_frequency_mask'] = parsed['production']['frequency_mask']
         else:
             parsed['production'] = None
+            # Service jobs pay monthly
+            parsed['payment_frequency_mask'] = _MONTHLY
         
         return parsed
     
@@ -210,22 +331,45 @@ class JobSystem(System):
         if not self.enabled:
             return
         
+        # Which frequencies run this tick, shared by the steps below
+        active = _active_frequencies(current_datetime)
+        
         # Job assignment (monthly)
-        if _should_run_on_frequency(self.assignment_frequency, current_datetime):
+        if active & _frequency_mask(self.assignment_frequency):
             self._assign_jobs(world_state, current_datetime)
         
+        # Employed workers, collected once for the steps below (each step
+        # re-checks is_employed(), since unpaid workers quit mid-tick)
+        workers = self._get_employed_workers(world_state)
+        
         # Resource production (configurable per job)
-        self._produce_resources(world_state, current_datetime)
+        self._produce_resources(world_state, current_datetime, active)
         
         # Pay salaries (when production happens or monthly for service jobs)
-        self._pay_salaries(world_state, current_datetime)
+        self._pay_salaries(world_state, current_datetime, workers, active)
         
         # Salary reviews (yearly on hire anniversary + rare 6-month)
-        self._review_salaries(world_state, current_datetime)
+        self._review_salaries(world_state, current_datetime, workers)
         
         # Job loss checks (monthly)
-        if _should_run_on_frequency('monthly', current_datetime):
-            self._check_job_loss(world_state, current_datetime)
+        if active & _MONTHLY:
+            self._check_job_loss(world_state, current_datetime, workers)
+    
+    def _get_employed_workers(self, world_state: Any) -> List[Tuple[Any, EmploymentComponent]]:
+        """Collect employed entities with their Employment components.
+        
+        Args:
+            world_state: World state instance
+        
+        Returns:
+            List of (entity, employment) in entity order
+        """
+        workers = []
+        for entity in world_state.query_entities_by_component('Employment'):
+            employment = entity._components['Employment']
+            if employment.is_employed():
+                workers.append((entity, employment))
+        return workers
     
     def _assign_jobs(self, world_state: Any, current_datetime: datetime) -> None:
         """Assign jobs to unemployed humans.
@@ -240,27 +384,24 @@ class JobSystem(System):
             return
         self.last_assignment_month = current_month
         
-        # Get all entities with Age component (to check work eligibility)
-        all_entities = world_state.get_all_entities()
+        # Get all entities with Age component (to check work eligibility),
+        # with their age and skills so each job does not look them up again
         eligible_entities = []
         
-        for entity in all_entities.values():
-            age_comp = entity.get_component('Age')
-            if not age_comp:
-                continue
-            
-            age_years = age_comp.get_age_years(current_datetime)
+        for entity in world_state.query_entities_by_component('Age'):
+            components = entity._components
+            age_years = components['Age'].get_age_years(current_datetime)
             
             # Check global age restrictions
             if age_years < self.min_work_age or age_years > self.max_work_age:
                 continue
             
             # Check if already employed
-            employment = entity.get_component('Employment')
+            employment = components.get('Employment')
             if employment and employment.is_employed():
                 continue
             
-            eligible_entities.append(entity)
+            eligible_entities.append((entity, age_years, components.get('Skills')))
         
         if not eligible_entities:
             return
@@ -275,7 +416,7 @@ class JobSystem(System):
         current_datetime: datetime,
         job_id: str,
         job_config: Dict[str, Any],
-        eligible_entities: List[Any]
+        eligible_entities: List[Tuple[Any, float, Optional[SkillsComponent]]]
     ) -> None:
         """Fill open positions for a specific job type.
         
@@ -284,10 +425,11 @@ class JobSystem(System):
             current_datetime: Current simulation datetime
             job_id: Job identifier
             job_config: Job configuration
-            eligible_entities: List of eligible entities (unemployed, right age)
+            eligible_entities: (entity, age_years, skills) of eligible entities
+                (unemployed, right age)
         """
         # Calculate max workers based on population percentage
-        total_population = len(world_state.get_all_entities())
+        total_population = world_state.get_entity_count()
         max_workers = int((total_population * job_config['max_percentage']) / 100.0)
         
         # Count current workers
@@ -308,39 +450,42 @@ class JobSystem(System):
         # Empty jobs are "needy" (higher chance), full jobs are "picky" (lower chance)
         adjusted_chance = self.base_hiring_chance * (1.0 + (1.0 - fill_percentage) * self.hiring_chance_multiplier)
         adjusted_chance = min(1.0, adjusted_chance)  # Cap at 100%
+        if adjusted_chance <= 0.0:
+            return  # Hiring disabled (e.g. base_hiring_chance of 0)
         
         # Filter entities by job-specific age requirement
         job_min_age = job_config.get('min_age', self.min_work_age)
-        candidates = []
-        
-        for entity in eligible_entities:
-            age_comp = entity.get_component('Age')
-            if not age_comp:
-                continue
-            
-            age_years = age_comp.get_age_years(current_datetime)
-            if age_years < job_min_age:
-                continue
-            
-            candidates.append(entity)
+        candidates = [
+            (entity, skills) for entity, age_years, skills in eligible_entities
+            if age_years >= job_min_age
+        ]
+        if not candidates:
+            return
         
         # Sort candidates by suitability (for now, random - will enhance with skills)
         # Shuffle to avoid always picking the same entities
-        import random
-        random.shuffle(candidates)
+        rng = world_state.rng
+        rng.shuffle(candidates)
+        random = rng.random
+        
+        # Hiring score inputs are the same for every candidate
+        required_skill = job_config['required_skill']
+        skill_weight = job_config['skill_weight']
+        charisma_weight = job_config['charisma_weight']
         
         # Try to hire candidates
         hired_count = 0
-        for entity in candidates:
+        for entity, skills in candidates:
             if hired_count >= open_slots:
                 break
             
             # Check if entity should be hired (probabilistic)
-            if world_state.rng.random() > adjusted_chance:
+            if random() > adjusted_chance:
                 continue
             
             # Calculate hiring probability based on skills and charisma
-            if self._should_hire_entity(world_state, entity, job_config):
+            score = _hiring_score(skills, required_skill, skill_weight, charisma_weight)
+            if random() < score:
                 self._hire_entity(world_state, current_datetime, entity, job_id, job_config)
                 hired_count += 1
         
@@ -351,47 +496,6 @@ class JobSystem(System):
         elif new_workers < max_workers and current_workers >= max_workers:
             logger.info(f"Job '{job_config['name']}' ({job_id}) has OPENINGS ({new_workers}/{max_workers} workers, {max_workers - new_workers} slots open)")
     
-    def _should_hire_entity(
-        self,
-        world_state: Any,
-        entity: Any,
-        job_config: Dict[str, Any]
-    ) -> bool:
-        """Determine if an entity should be hired for a job.
-        
-        Args:
-            world_state: World state instance
-            entity: Entity to evaluate
-            job_config: Job configuration
-            
-        Returns:
-            True if entity should be hired
-        """
-        skills = entity.get_component('Skills')
-        if not skills:
-            # No skills component - use base probability
-            return world_state.rng.random() < 0.5
-        
-        # Get required skill value
-        required_skill = job_config['required_skill']
-        skill_value = skills.get_job_skill(required_skill, 0.0)
-        charisma = skills.charisma
-        
-        # Calculate hiring score
-        skill_score = skill_value * job_config['skill_weight']
-        charisma_score = charisma * job_config['charisma_weight']
-        total_score = skill_score + charisma_score
-        
-        # Normalize to 0-1 range (assuming max possible is skill_weight + charisma_weight)
-        max_possible = job_config['skill_weight'] + job_config['charisma_weight']
-        if max_possible > 0:
-            normalized_score = total_score / max_possible
-        else:
-            normalized_score = 0.5
-        
-        # Use score as probability (higher score = more likely to hire)
-        return world_state.rng.random() < normalized_score
-    
     def _hire_entity(
         self,
         world_state: Any,
@@ -412,26 +516,14 @@ class JobSystem(System):
             job_id: Job identifier
             job_config: Job configuration
         """
-        # Get base payment from config (payment: {resource_id: amount})
-        base_payment = job_config.get('payment', {})
-        if not isinstance(base_payment, dict):
-            base_payment = {}
-        base_payment = base_payment.copy()
-        
-        min_payment = job_config.get('min_payment', {})
-        if not isinstance(min_payment, dict):
-            min_payment = {}
-        min_payment = min_payment.copy()
+        # Payment bounds per resource, resolved once by _parse_job_config
+        payment_terms = job_config.get('payment_terms')
+        if payment_terms is None:
+            payment_terms = _payment_terms(job_id, job_config)
         
         max_payment_cap = job_config.get('max_payment_cap', {})
         if not isinstance(max_payment_cap, dict):
             max_payment_cap = {}
-        max_payment_cap = max_payment_cap.copy()
-        
-        # If no payment config, default to empty (shouldn't happen, but handle gracefully)
-        if not base_payment:
-            logger.warning(f"Job {job_id} has no payment configuration")
-            base_payment = {}
         
         # Calculate payment based on skills and charisma
         skills = entity.get_component('Skills')
@@ -452,30 +544,35 @@ class JobSystem(System):
         
         # Calculate final payment for each resource type
         final_payment = {}
-        for resource_id, base_amount in base_payment.items():
+        for resource_id, base_amount, min_amount, max_amount in payment_terms:
             # Start with base amount, apply multiplier
             calculated_amount = base_amount * payment_multiplier
             
             # Apply min/max constraints if specified
-            if resource_id in min_payment:
-                calculated_amount = max(calculated_amount, min_payment[resource_id])
-            if resource_id in max_payment_cap:
-                calculated_amount = min(calculated_amount, max_payment_cap[resource_id])
+            if min_amount is not None:
+                calculated_amount = max(calculated_amount, min_amount)
+            if max_amount is not None:
+                calculated_amount = min(calculated_amount, max_amount)
             
             final_payment[resource_id] = calculated_amount
         
         # Create or update employment component
         employment = entity.get_component('Employment')
         if not employment:
+            counts_current = self._worker_counts_current(world_state)
             employment = EmploymentComponent()
             entity.add_component(employment)
+            if counts_current:
+                # A new component without a job changes no worker count
+                self._worker_counts_version = world_state.get_entity_version()
         
-        employment.job_type = job_id
         employment.employer_id = None  # Self-employed for now
         employment.payment_resources = final_payment
         employment.hire_date = current_datetime
         employment.last_raise_date = None
+        # Shared with the job config: caps are only ever replaced, never mutated
         employment.max_payment_cap = max_payment_cap
+        self._set_job(world_state, employment, job_id)
         
         # Format payment string for logging
         payment_str = ", ".join([f"{rid}: {amt:.2f}" for rid, amt in final_payment.items()])
@@ -494,28 +591,88 @@ class JobSystem(System):
         Returns:
             Number of workers with this job
         """
-        count = 0
-        for entity in world_state.get_all_entities().values():
-            employment = entity.get_component('Employment')
-            if employment and employment.job_type == job_id:
-                count += 1
-        return count
-    
-    def _produce_resources(self, world_state: Any, current_datetime: datetime) -> None:
+        return self._get_worker_counts(world_state).get(job_id, 0)
+    
+    def _get_worker_counts(self, world_state: Any) -> Dict[str, int]:
+        """Get the number of workers per job, rescanning only when needed.
+        
+        Counts are rebuilt from the Employment components when entities or
+        components changed since the last scan. Job changes made by this
+        system go through _set_job(), which updates the counts in place.
+        
+        Args:
+            world_state: World state instance
+        
+        Returns:
+            Dictionary of job_id -> worker count (shared; do not modify)
+        """
+        if not self._worker_counts_current(world_state):
+            self._worker_counts = dict(Counter(
+                employment.job_type for employment in world_state.iter_components('Employment')
+                if employment.job_type is not None
+            ))
+            self._worker_counts_source = world_state
+            self._worker_counts_version = world_state.get_entity_version()
+        return self._worker_counts
+    
+    def _worker_counts_current(self, world_state: Any) -> bool:
+        """Check whether the cached worker counts match the world state.
+        
+        Args:
+            world_state: World state instance
+        
+        Returns:
+            True if the counts were taken from this world state at its
+            current entity version
+        """
+        return (
+            world_state is self._worker_counts_source
+            and self._worker_counts_version == world_state.get_entity_version()
+        )
+    
+    def _set_job(self, world_state: Any, employment: EmploymentComponent, job_id: Optional[str]) -> None:
+        """Change an employment's job (None = unemployed) and record the change.
+        
+        Bumps employment_version and keeps the cached worker counts current.
+        
+        Args:
+            world_state: World state instance
+            employment: Employment component to update
+            job_id: New job identifier, or None when the job is lost
+        """
+        counts = self._worker_counts if self._worker_counts_current(world_state) else None
+        old_job_id = employment.job_type
+        employment.job_type = job_id
+        self.employment_version += 1
+        
+        if counts is not None:
+            if old_job_id is not None:
+                counts[old_job_id] -= 1
+            if job_id is not None:
+                counts[job_id] = counts.get(job_id, 0) + 1
+    
+    def _produce_resources(
+        self,
+        world_state: Any,
+        current_datetime: datetime,
+        active: Optional[int] = None
+    ) -> None:
         """Produce resources from jobs.
         
         Args:
             world_state: World state instance
             current_datetime: Current simulation datetime
+            active: Bitmask of frequencies running this tick (computed if None)
         """
+        if active is None:
+            active = _active_frequencies(current_datetime)
+        
         for job_id, job_config in self.jobs.items():
             if not job_config.get('production'):
                 continue  # Service jobs don't produce
             
             prod_config = job_config['production']
-            frequency = prod_config.get('frequency', self.production_frequency)
-            
-            if not _should_run_on_frequency(frequency, current_datetime):
+            if not active & prod_config['frequency_mask']:
                 continue
             
             # Count workers for this job
@@ -537,7 +694,13 @@ class JobSystem(System):
                     f"({worker_count} workers × {rate_per_worker:.2f} per worker)"
                 )
     
-    def _pay_salaries(self, world_state: Any, current_datetime: datetime) -> None:
+    def _pay_salaries(
+        self,
+        world_state: Any,
+        current_datetime: datetime,
+        workers: Optional[List[Tuple[Any, EmploymentComponent]]] = None,
+        active: Optional[int] = None
+    ) -> None:
         """Pay workers with their configured payment resources.
         
         Payments can be in any resource type (money, crypto, food, etc.) as configured per job.
@@ -546,99 +709,135 @@ class JobSystem(System):
         Args:
             world_state: World state instance
             current_datetime: Current simulation datetime
+            workers: Employed (entity, employment) pairs for this tick (collected if None)
+            active: Bitmask of frequencies running this tick (computed if None)
         """
-        # Pay salaries for all employed workers
-        total_paid_by_resource: Dict[str, float] = {}  # Track total paid per resource type
-        paid_count = 0
-        unpaid_entities = []  # Track entities who didn't get paid
+        if active is None:
+            active = _active_frequencies(current_datetime)
+        
+        # Jobs that pay this tick: production jobs pay when they produce,
+        # service jobs pay monthly
+        paying_jobs = {
+            job_id for job_id, job_config in self.jobs.items()
+            if active & job_config['payment_frequency_mask']
+        }
+        if not paying_jobs:
+            return
+        
+        if workers is None:
+            workers = self._get_employed_workers(world_state)
         
-        for entity in world_state.get_all_entities().values():
-            employment = entity.get_component('Employment')
-            if not employment or not employment.is_employed():
+        # Workers due a payment this tick, with the total owed per resource
+        due: List[Tuple[Any, EmploymentComponent]] = []
+        total_due: Dict[str, float] = {}
+        
+        for entity, employment in workers:
+            if not employment.is_employed():
                 continue
             
             # Check if this job should pay now
-            job_config = self.jobs.get(employment.job_type)
-            if not job_config:
+            if employment.job_type not in paying_jobs:
                 continue
             
-            # Determine payment frequency
-            if job_config.get('production'):
-                # Production jobs pay when they produce
-                prod_config = job_config['production']
-                frequency = prod_config.get('frequency', self.production_frequency)
-                if not _should_run_on_frequency(frequency, current_datetime):
-                    continue
-            else:
-                # Service jobs pay monthly
-                if not _should_run_on_frequency('monthly', current_datetime):
-                    continue
-            
             # Pay in all configured payment resources
             payment_resources = employment.payment_resources
             if not payment_resources:
                 continue  # No payment configured
             
-            # Check if world has enough of all required payment resources
-            can_pay = True
-            missing_resources = []
-            
+            due.append((entity, employment))
             for resource_id, amount in payment_resources.items():
-                resource = world_state.get_resource(resource_id)
-                if not resource:
-                    can_pay = False
-                    missing_resources.append(f"{resource_id} (not found)")
-                    break
-                if resource.current_amount < amount:
-                    can_pay = False
-                    missing_resources.append(
-                        f"{resource_id} (need {amount:.2f}, have {resource.current_amount:.2f})"
-                    )
-                    break
+                total_due[resource_id] = total_due.get(resource_id, 0.0) + amount
+        
+        if not due:
+            return
+        
+        # Pay salaries for all employed workers
+        total_paid_by_resource: Dict[str, float] = {}  # Track total paid per resource type
+        paid_count = 0
+        unpaid_count = 0  # Workers who weren't paid (and quit)
+        
+        resources = {resource_id: world_state.get_resource(resource_id) for resource_id in total_due}
+        if all(
+            resource and resource.current_amount >= total_due[resource_id]
+            for resource_id, resource in resources.items()
+        ):
+            # Common case: the world covers every payment, so each resource's
+            # total is taken in one consume() before crediting the workers
+            for resource_id, resource in resources.items():
+                resource.consume(total_due[resource_id])
+            
+            for entity, employment in due:
+                wealth = self._get_wealth(entity)
+                for resource_id, amount in employment.payment_resources.items():
+                    wealth.add_resource(resource_id, amount)
             
-            if can_pay:
-                # Pay in all resources
+            total_paid_by_resource = total_due
+            paid_count = len(due)
+        else:
+            # Not enough for everyone: pay workers in order while resources
+            # last, tracking what is left locally and consuming it afterwards
+            budget = {
+                resource_id: resource.current_amount
+                for resource_id, resource in resources.items() if resource
+            }
+            
+            for entity, employment in due:
+                payment_resources = employment.payment_resources
+                
+                # Check if world has enough of all required payment resources
+                can_pay = True
+                missing_resources = []
+                
                 for resource_id, amount in payment_resources.items():
-                    resource = world_state.get_resource(resource_id)
-                    resource.consume(amount)
+                    available = budget.get(resource_id)
+                    if available is None:
+                        can_pay = False
+                        missing_resources.append(f"{resource_id} (not found)")
+                        break
+                    if available < amount:
+                        can_pay = False
+                        missing_resources.append(
+                            f"{resource_id} (need {amount:.2f}, have {available:.2f})"
+                        )
+                        break
+                
+                if can_pay:
+                    # Pay in all resources
+                    wealth = self._get_wealth(entity)
+                    for resource_id, amount in payment_resources.items():
+                        budget[resource_id] -= amount
+                        wealth.add_resource(resource_id, amount)
+                        
+                        # Track totals
+                        total_paid_by_resource[resource_id] = total_paid_by_resource.get(resource_id, 0.0) + amount
                     
-                    # Add to entity's wealth
-                    wealth = entity.get_component('Wealth')
-                    if not wealth:
-                        wealth = WealthComponent()
-                        entity.add_component(wealth)
-                    wealth.add_resource(resource_id, amount)
+                    paid_count += 1
+                else:
+                    # Employee not paid - they will quit
+                    # NOTE: This is a real-world problem that can happen
+                    # In Phase 6, proper economic systems will prevent this
+                    payment_str = ", ".join([f"{rid}: {amt:.2f}" for rid, amt in payment_resources.items()])
+                    missing_str = ", ".join(missing_resources)
+                    logger.warning(
+                        f"Insufficient world resources to pay {payment_str} to entity {entity.entity_id}. "
+                        f"Missing: {missing_str} - Employee will quit"
+                    )
                     
-                    # Track totals
-                    total_paid_by_resource[resource_id] = total_paid_by_resource.get(resource_id, 0.0) + amount
-                
-                paid_count += 1
-            else:
-                # Employee not paid - they will quit
-                # NOTE: This is a real-world problem that can happen
-                # In Phase 6, proper economic systems will prevent this
-                payment_str = ", ".join([f"{rid}: {amt:.2f}" for rid, amt in payment_resources.items()])
-                missing_str = ", ".join(missing_resources)
-                logger.warning(
-                    f"Insufficient world resources to pay {payment_str} to entity {entity.entity_id}. "
-                    f"Missing: {missing_str} - Employee will quit"
-                )
-                unpaid_entities.append((entity, employment, job_config))
-        
-        # Process unpaid workers - they quit
-        for entity, employment, job_config in unpaid_entities:
-            job_id = employment.job_type
-            job_name = job_config.get('name', job_id)
-            
-            # Remove employment (they quit due to not being paid)
-            employment.job_type = None
-            employment.employer_id = None
-            # Keep payment_resources, hire_date, etc. for potential re-hiring reference
+                    # Remove employment (they quit due to not being paid)
+                    job_id = employment.job_type
+                    job_name = self.jobs[job_id].get('name', job_id)
+                    self._set_job(world_state, employment, None)
+                    employment.employer_id = None
+                    # Keep payment_resources, hire_date, etc. for potential re-hiring reference
+                    unpaid_count += 1
+                    
+                    logger.info(
+                        f"Entity {entity.entity_id} quit job '{job_name}' "
+                        f"(reason: not paid - insufficient world resources)"
+                    )
             
-            logger.info(
-                f"Entity {entity.entity_id} quit job '{job_name}' "
-                f"(reason: not paid - insufficient world resources)"
-            )
+            for resource_id, amount in total_paid_by_resource.items():
+                resources[resource_id].consume(amount)
         
         if paid_count > 0:
             payment_summary = ", ".join([
@@ -648,52 +847,79 @@ class JobSystem(System):
                 f"Paid {paid_count} workers: {payment_summary}"
             )
         
-        if unpaid_entities:
+        if unpaid_count > 0:
             logger.warning(
-                f"{len(unpaid_entities)} workers quit due to unpaid salaries. "
+                f"{unpaid_count} workers quit due to unpaid salaries. "
                 f"This should not happen with proper resource generation. "
                 f"Check resource replenishment rates."
             )
     
-    def _review_salaries(self, world_state: Any, current_datetime: datetime) -> None:
+    def _get_wealth(self, entity: Any) -> WealthComponent:
+        """Get an entity's Wealth component, adding one if missing.
+        
+        Args:
+            entity: Entity being paid
+        
+        Returns:
+            Entity's Wealth component
+        """
+        wealth = entity._components.get('Wealth')
+        if not wealth:
+            wealth = WealthComponent()
+            entity.add_component(wealth)
+        return wealth
+    
+    def _review_salaries(
+        self,
+        world_state: Any,
+        current_datetime: datetime,
+        workers: Optional[List[Tuple[Any, EmploymentComponent]]] = None
+    ) -> None:
         """Review and potentially increase salaries.
         
         Args:
             world_state: World state instance
             current_datetime: Current simulation datetime
+            workers: Employed (entity, employment) pairs for this tick (collected if None)
         """
-        for entity in world_state.get_all_entities().values():
-            employment = entity.get_component('Employment')
-            if not employment or not employment.is_employed():
+        if workers is None:
+            workers = self._get_employed_workers(world_state)
+        
+        random = world_state.rng.random
+        
+        # Hire/raise dates on or before these are at least a year old
+        # (days / 365.25 >= 1, i.e. 366 whole days) or six months old
+        # (days / 30 >= 6, i.e. 180 whole days)
+        year_cutoff = current_datetime - timedelta(days=366)
+        six_month_cutoff = current_datetime - timedelta(days=180)
+        
+        for entity, employment in workers:
+            if not employment.is_employed():
                 continue
             
-            if not employment.hire_date:
+            hire_date = employment.hire_date
+            if not hire_date:
                 continue
+            last_raise_date = employment.last_raise_date
             
             # Check for yearly raise
-            years_employed = (current_datetime - employment.hire_date).days / 365.25
-            if years_employed >= 1.0:
+            if hire_date <= year_cutoff:
                 # Check if we've already given a raise this year
-                if employment.last_raise_date:
-                    years_since_raise = (current_datetime - employment.last_raise_date).days / 365.25
-                    if years_since_raise < 1.0:
-                        continue  # Already got raise this year
+                if last_raise_date and last_raise_date > year_cutoff:
+                    continue  # Already got raise this year
                 
                 # Yearly raise chance
-                if world_state.rng.random() < self.yearly_raise_probability:
+                if random() < self.yearly_raise_probability:
                     self._give_raise(world_state, entity, employment, current_datetime)
                     continue
             
             # Check for rare 6-month raise
-            months_employed = (current_datetime - employment.hire_date).days / 30.0
-            if months_employed >= 6.0:
-                if employment.last_raise_date:
-                    months_since_raise = (current_datetime - employment.last_raise_date).days / 30.0
-                    if months_since_raise < 6.0:
-                        continue
+            if hire_date <= six_month_cutoff:
+                if last_raise_date and last_raise_date > six_month_cutoff:
+                    continue
                 
                 # 6-month raise chance (rare)
-                if world_state.rng.random() < self.six_month_raise_probability:
+                if random() < self.six_month_raise_probability:
                     self._give_raise(world_state, entity, employment, current_datetime)
     
     def _give_raise(
@@ -750,27 +976,35 @@ class JobSystem(System):
         if raise_details:
             employment.payment_resources = new_payment
             employment.last_raise_date = current_datetime
+            self.employment_version += 1
             
             raise_str = ", ".join(raise_details)
             logger.info(
                 f"Entity {entity.entity_id} received payment raise: {raise_str}"
             )
     
-    def _check_job_loss(self, world_state: Any, current_datetime: datetime) -> None:
+    def _check_job_loss(
+        self,
+        world_state: Any,
+        current_datetime: datetime,
+        workers: Optional[List[Tuple[Any, EmploymentComponent]]] = None
+    ) -> None:
         """Check for job loss (firing, quitting, layoffs).
         
         Args:
             world_state: World state instance
             current_datetime: Current simulation datetime
+            workers: Employed (entity, employment) pairs for this tick (collected if None)
         """
         # NOTE: Job loss probability is hardcoded for now
         # Future: Make configurable per job type and differentiate between firing/quitting/layoffs
+        if workers is None:
+            workers = self._get_employed_workers(world_state)
         
         entities_to_unemploy = []
         
-        for entity in world_state.get_all_entities().values():
-            employment = entity.get_component('Employment')
-            if not employment or not employment.is_employed():
+        for entity, employment in workers:
+            if not employment.is_employed():
                 continue
             
             # Small random chance of job loss
@@ -784,7 +1018,7 @@ class JobSystem(System):
             job_name = job_config.get('name', job_id)
             
             # Remove employment
-            employment.job_type = None
+            self._set_job(world_state, employment, None)
             employment.employer_id = None
             # Keep salary, hire_date, etc. for potential re-hiring reference
             
@@ -62,3 +62,19 @@ def test_time_helpers():
     assert time.is_new_day() == False
     assert time.is_new_month() == False
     assert time.is_new_year() == False
+
+
+def test_time_isoformat_cached_per_tick():
+    """Test ISO formatting is cached for the current tick only."""
+    start = datetime(2024, 1, 1, 0, 0, 0)
+    time = SimulationTime(start)
+    
+    first = time.isoformat(time.current_datetime)
+    assert first == "2024-01-01T00:00:00"
+    assert time.isoformat(time.current_datetime) is first
+    
+    # Other datetimes are formatted directly
+    assert time.isoformat(datetime(2024, 5, 1, 12, 0, 0)) == "2024-05-01T12:00:00"
+    
+    time.advance_tick()
+    assert time.isoformat(time.current_datetime) == "2024-01-01T01:00:00"
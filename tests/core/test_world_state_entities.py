@@ -112,6 +112,30 @@ class TestWorldStateEntities:
         assert entity3 in entities_with_needs
         assert entity2 not in entities_with_needs
     
+    def test_query_entities_by_component_cache(self):
+        """Test query results are reused until entities or components change."""
+        world_state = WorldState(
+            simulation_time=SimulationTime(datetime(2020, 1, 1)),
+            config_snapshot={}
+        )
+        
+        entity1 = world_state.create_entity(entity_id="test-1")
+        entity1.add_component(NeedsComponent())
+        
+        first = world_state.query_entities_by_component("Needs")
+        first.clear()  # Callers own the returned list
+        assert world_state.query_entities_by_component("Needs") == [entity1]
+        
+        entity2 = world_state.create_entity(entity_id="test-2")
+        entity2.add_component(NeedsComponent())
+        assert world_state.query_entities_by_component("Needs") == [entity1, entity2]
+        
+        entity1.remove_component("Needs")
+        assert world_state.query_entities_by_component("Needs") == [entity2]
+        
+        world_state.remove_entity("test-2")
+        assert world_state.query_entities_by_component("Needs") == []
+    
     def test_query_entities_by_components(self):
         """Test querying entities by multiple component types."""
         world_state = WorldState(
@@ -156,3 +180,126 @@ class TestWorldStateEntities:
         assert restored_entity is not None
         assert restored_entity.has_component("Needs")
         assert restored_entity.get_component("Needs").hunger == 0.5
+    
+    def test_get_components_of_type(self):
+        """Test collecting all components of one type in a single pass."""
+        world_state = WorldState(
+            simulation_time=SimulationTime(datetime(2020, 1, 1)),
+            config_snapshot={}
+        )
+        
+        entity1 = world_state.create_entity(entity_id="test-1")
+        entity1.add_component(NeedsComponent(hunger=0.2))
+        entity1.add_component(HealthComponent())
+        
+        entity2 = world_state.create_entity(entity_id="test-2")
+        entity2.add_component(NeedsComponent(hunger=0.8))
+        
+        needs = world_state.get_components_of_type("Needs")
+        assert sorted(n.hunger for n in needs) == [0.2, 0.8]
+        assert len(world_state.get_components_of_type("Health")) == 1
+        assert world_state.get_components_of_type("Missing") == []
+    
+    def test_iter_components(self):
+        """Test iterating components of one type straight from the index."""
+        world_state = WorldState(
+            simulation_time=SimulationTime(datetime(2020, 1, 1)),
+            config_snapshot={}
+        )
+        
+        assert list(world_state.iter_components("Needs")) == []
+        
+        entity1 = world_state.create_entity(entity_id="test-1")
+        entity1.add_component(NeedsComponent(hunger=0.2))
+        entity2 = world_state.create_entity(entity_id="test-2")
+        entity2.add_component(NeedsComponent(hunger=0.8))
+        
+        assert [n.hunger for n in world_state.iter_components("Needs")] == [0.2, 0.8]
+    
+    def test_components_of_type_follow_replace_and_remove(self):
+        """Test the component index sees replaced and removed components."""
+        world_state = WorldState(
+            simulation_time=SimulationTime(datetime(2020, 1, 1)),
+            config_snapshot={}
+        )
+        
+        entity = world_state.create_entity(entity_id="test-1")
+        entity.add_component(NeedsComponent(hunger=0.2))
+        entity.replace_component(NeedsComponent(hunger=0.7))
+        assert [n.hunger for n in world_state.get_components_of_type("Needs")] == [0.7]
+        
+        entity.remove_component("Needs")
+        assert world_state.get_components_of_type("Needs") == []
+        
+        entity.add_component(HealthComponent())
+        world_state.remove_entity("test-1")
+        assert world_state.get_components_of_type("Health") == []
+        assert world_state.get_component_type_histogram() == {}
+    
+    def test_get_component_type_histogram(self):
+        """Test counting entities per component type."""
+        world_state = WorldState(
+            simulation_time=SimulationTime(datetime(2020, 1, 1)),
+            config_snapshot={}
+        )
+        
+        entity1 = world_state.create_entity(entity_id="test-1")
+        entity1.add_component(NeedsComponent())
+        entity1.add_component(HealthComponent())
+        
+        entity2 = world_state.create_entity(entity_id="test-2")
+        entity2.add_component(NeedsComponent())
+        
+        assert world_state.get_component_type_histogram() == {"Needs": 2, "Health": 1}
+    
+    def test_component_type_histogram_tracks_changes(self):
+        """Test component counts follow component and entity changes."""
+        world_state = WorldState(
+            simulation_time=SimulationTime(datetime(2020, 1, 1)),
+            config_snapshot={}
+        )
+        
+        entity1 = world_state.create_entity(entity_id="test-1")
+        entity1.add_component(NeedsComponent())
+        entity1.replace_component(NeedsComponent(hunger=0.3))
+        entity1.add_component(HealthComponent())
+        
+        entity2 = Entity(entity_id="test-2")
+        entity2.add_component(NeedsComponent())
+        world_state.add_entity(entity2)
+        assert world_state.get_component_type_histogram() == {"Needs": 2, "Health": 1}
+        
+        entity1.remove_component("Health")
+        assert world_state.get_component_type_histogram() == {"Needs": 2}
+        
+        removed = world_state.remove_entity("test-2")
+        assert world_state.get_component_type_histogram() == {"Needs": 1}
+        
+        # Detached entities no longer affect the counts
+        removed.add_component(HealthComponent())
+        assert world_state.get_component_type_histogram() == {"Needs": 1}
+        
+        restored = WorldState.from_dict(world_state.to_dict())
+        assert restored.get_component_type_histogram() == {"Needs": 1}
+    
+    def test_entity_version_changes_with_population(self):
+        """Test entity version is bumped by entity and component changes only."""
+        world_state = WorldState(
+            simulation_time=SimulationTime(datetime(2020, 1, 1)),
+            config_snapshot={}
+        )
+        
+        versions = [world_state.get_entity_version()]
+        entity = world_state.create_entity(entity_id="test-1")
+        versions.append(world_state.get_entity_version())
+        assert versions[1] == versions[0] + 1  # One bump per created entity
+        entity.add_component(NeedsComponent())
+        versions.append(world_state.get_entity_version())
+        world_state.remove_entity("test-1")
+        versions.append(world_state.get_entity_version())
+        assert len(set(versions)) == 4
+        
+        # Component field changes and detached entities do not count
+        entity.get_component("Needs").hunger = 0.9
+        entity.add_component(HealthComponent())
+        assert world_state.get_entity_version() == versions[-1]
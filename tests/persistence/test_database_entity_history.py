@@ -185,6 +185,45 @@ class TestDatabaseEntityHistory:
             if db_path.exists():
                 db_path.unlink()
     
+    def test_get_entity_history_paginated(self):
+        """Test limit returns the latest records and before_tick pages back."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = Path(f.name)
+        
+        try:
+            db = Database(db_path)
+            db.connect()
+            
+            component_counts = json.dumps({"Needs": 1})
+            
+            for i in range(5):
+                db.save_entity_history(
+                    timestamp=f"2024-01-0{i+1}T00:00:00",
+                    tick=i * 24,
+                    total_entities=i + 1,
+                    component_counts=component_counts
+                )
+            
+            # Latest page, still in chronological order
+            page = db.get_entity_history(limit=2)
+            assert [record['tick'] for record in page] == [72, 96]
+            
+            # Previous page via tick cursor
+            page = db.get_entity_history(limit=2, before_tick=page[0]['tick'])
+            assert [record['tick'] for record in page] == [24, 48]
+            
+            page = db.get_entity_history(limit=2, before_tick=page[0]['tick'])
+            assert [record['tick'] for record in page] == [0]
+            
+            # Limit combines with range filters
+            page = db.get_entity_history(end_tick=48, limit=1)
+            assert [record['tick'] for record in page] == [48]
+            
+            db.close()
+        finally:
+            if db_path.exists():
+                db_path.unlink()
+    
     def test_entity_history_table_created(self):
         """Test that entity_history table is created."""
         with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
@@ -213,6 +213,112 @@ def test_get_all_resource_history():
             assert 'water' in resource_ids
 
 
+def test_save_resource_history_many_holds_write_transaction_until_flush():
+    """Test batch saves open an immediate transaction that flush() commits."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        
+        with Database(db_path) as db:
+            timestamp = datetime(2024, 1, 1, 0, 0, 0).isoformat()
+            db.save_resource_history_many([(timestamp, 0, 'food', 1000.0, 'moderate', 20.0)])
+            assert db._connection.in_transaction
+            
+            db.save_resource_history_many([(timestamp, 1, 'food', 990.0, 'moderate', 19.8)])
+            db.flush()
+            assert not db._connection.in_transaction
+            
+            assert [h['tick'] for h in db.get_all_resource_history()] == [0, 1]
+
+
+def test_save_resource_history_many():
+    """Test saving several resource history rows at once."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        
+        with Database(db_path) as db:
+            world_state = WorldState(
+                simulation_time=SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42),
+                config_snapshot={},
+                rng_seed=42
+            )
+            world_state.add_resource(Resource('food', 'Food', 1000.0, max_capacity=5000.0))
+            world_state.add_resource(Resource('water', 'Water', 2000.0))
+            db.save_world_state(world_state)
+            
+            timestamp = datetime(2024, 1, 1, 0, 0, 0).isoformat()
+            db.save_resource_history_many([
+                (timestamp, 0, 'food', 1000.0, 'moderate', 20.0),
+                (timestamp, 0, 'water', 2000.0, 'moderate', None),
+            ])
+            
+            history = db.get_all_resource_history()
+            assert [(h['resource_id'], h['amount'], h['utilization_percent']) for h in history] == [
+                ('food', 1000.0, 20.0),
+                ('water', 2000.0, None),
+            ]
+
+
+def test_get_all_resource_history_paginated_within_tick():
+    """Test paging with the (tick, id) cursor never skips rows of a shared tick."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        
+        with Database(db_path) as db:
+            world_state = WorldState(
+                simulation_time=SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42),
+                config_snapshot={},
+                rng_seed=42
+            )
+            for resource_id in ('food', 'water', 'wood'):
+                world_state.add_resource(Resource(resource_id, resource_id.title(), 100.0))
+            db.save_world_state(world_state)
+            
+            expected = []
+            for tick in range(4):
+                timestamp = datetime(2024, 1, 1, tick, 0, 0).isoformat()
+                for resource_id in ('food', 'water', 'wood'):
+                    db.save_resource_history(timestamp, tick, resource_id, 100.0 - tick, 'moderate')
+                    expected.append((tick, resource_id))
+            
+            # Pages of 2 end partway through ticks with 3 rows each
+            pages = []
+            page = db.get_all_resource_history(limit=2)
+            while page:
+                pages.append(page)
+                page = db.get_all_resource_history(
+                    limit=2, before_tick=page[0]['tick'], before_rowid=page[0]['id']
+                )
+            
+            assert [len(p) for p in pages] == [2, 2, 2, 2, 2, 2]
+            rows = [(h['tick'], h['resource_id']) for p in reversed(pages) for h in p]
+            assert rows == expected
+            
+            # Cursor combines with the resource filter
+            page = db.get_resource_history('water', limit=2)
+            assert [h['tick'] for h in page] == [2, 3]
+            page = db.get_resource_history(
+                'water', limit=2, before_tick=page[0]['tick'], before_rowid=page[0]['id']
+            )
+            assert [h['tick'] for h in page] == [0, 1]
+            
+            with pytest.raises(ValueError, match="before_tick"):
+                db.get_all_resource_history(limit=2, before_rowid=1)
+            
+            # Pages walk an index in (tick, id) order instead of sorting
+            from src.persistence.database import _build_history_query
+            cursor = db._connection.cursor()
+            for resource_id, index_name in (('water', 'idx_resource_history_rid_tick'),
+                                            (None, 'idx_resource_history_tick')):
+                query, params = _build_history_query(
+                    'resource_history', None, None, None, None, resource_id=resource_id,
+                    limit=2, before_tick=2, before_rowid=5
+                )
+                cursor.execute("EXPLAIN QUERY PLAN " + query, params)
+                plan = " ".join(row[3] for row in cursor.fetchall())
+                assert index_name in plan
+                assert 'TEMP B-TREE' not in plan
+
+
 def test_history_table_created():
     """Test history table is created on schema init."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -244,4 +350,141 @@ def test_history_indexes_created():
             
             assert 'idx_resource_history_timestamp_resource' in indexes
             assert 'idx_resource_history_tick' in indexes
+            assert 'idx_resource_history_rid_tick' in indexes
             assert 'idx_resource_history_resource_id' in indexes
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_column_helpers_round_trip(monkeypatch, use_orjson):
+    """Test JSON column helpers round-trip with and without orjson."""
+    import src.persistence.database as database_module
+    
+    if use_orjson and not database_module.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(database_module, 'ORJSON_AVAILABLE', use_orjson)
+    
+    value = {'farmer': 3, 'payments': {'money': 12.5}}
+    text = database_module._json_dumps(value)
+    
+    assert isinstance(text, str)
+    assert database_module._json_loads(text) == value
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_column_helpers_compact(monkeypatch, use_orjson):
+    """Test JSON columns are written without separator whitespace."""
+    import src.persistence.database as database_module
+    
+    if use_orjson and not database_module.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(database_module, 'ORJSON_AVAILABLE', use_orjson)
+    
+    assert database_module._json_dumps({'a': 1, 'b': [1, 2]}) == '{"a":1,"b":[1,2]}'
+
+
+def test_history_range_queries_use_composite_indexes():
+    """Test ordered history range scans walk an index instead of sorting."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        
+        with Database(db_path) as db:
+            cursor = db._connection.cursor()
+            queries = [
+                ("SELECT * FROM entity_history WHERE tick >= ? ORDER BY tick ASC, timestamp ASC",
+                 (0,), 'idx_entity_history_tick_ts'),
+                ("SELECT * FROM job_history WHERE tick >= ? ORDER BY tick ASC, timestamp ASC",
+                 (0,), 'idx_job_history_tick_ts'),
+                ("SELECT * FROM resource_history WHERE resource_id = ? ORDER BY tick ASC, timestamp ASC",
+                 ('food',), 'idx_resource_history_rid_tick_ts'),
+                ("SELECT * FROM entity_history WHERE tick < ? ORDER BY tick DESC, timestamp DESC LIMIT ?",
+                 (100, 10), 'idx_entity_history_tick_ts'),
+            ]
+            
+            for query, params, index_name in queries:
+                cursor.execute("EXPLAIN QUERY PLAN " + query, params)
+                plan = " ".join(row[3] for row in cursor.fetchall())
+                assert index_name in plan
+                assert 'TEMP B-TREE' not in plan
+
+
+def test_history_query_variants_are_cached():
+    """Test history SQL is built once per filter combination."""
+    from src.persistence.database import _build_history_query
+    
+    query1, params1 = _build_history_query('entity_history', 5, None, None, '2024-02-01')
+    query2, params2 = _build_history_query('entity_history', 7, None, None, '2024-03-01')
+    
+    assert query1 is query2
+    assert query1 == (
+        "SELECT * FROM entity_history WHERE 1=1 AND tick >= ? AND timestamp <= ?"
+        " ORDER BY tick ASC, timestamp ASC"
+    )
+    assert params1 == [5, '2024-02-01']
+    assert params2 == [7, '2024-03-01']
+    
+    query, params = _build_history_query('resource_history', None, 10, None, None, resource_id='food')
+    assert query == (
+        "SELECT * FROM resource_history WHERE resource_id = ? AND tick <= ?"
+        " ORDER BY tick ASC, timestamp ASC"
+    )
+    assert params == ['food', 10]
+    
+    query, _ = _build_history_query('resource_history', None, None, None, None)
+    assert query.endswith("ORDER BY tick ASC, timestamp ASC, resource_id ASC")
+
+
+def test_history_saves_commit_on_flush():
+    """Test history saves are batched until flush() and rolled back on error."""
+    import sqlite3
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        
+        def count_rows():
+            conn = sqlite3.connect(db_path)
+            try:
+                return conn.execute("SELECT COUNT(*) FROM entity_history").fetchone()[0]
+            finally:
+                conn.close()
+        
+        with Database(db_path) as db:
+            for tick in range(3):
+                db.save_entity_history(
+                    timestamp=datetime(2024, 1, 1, tick).isoformat(),
+                    tick=tick,
+                    total_entities=1,
+                    component_counts='{}'
+                )
+            assert count_rows() == 0
+            
+            db.flush()
+            assert count_rows() == 3
+        
+        with pytest.raises(RuntimeError):
+            with Database(db_path) as db:
+                db.save_entity_history(
+                    timestamp=datetime(2024, 1, 2).isoformat(),
+                    tick=24,
+                    total_entities=1,
+                    component_counts='{}'
+                )
+                raise RuntimeError("boom")
+        
+        assert count_rows() == 3
+
+
+def test_unfiltered_history_query_skips_builder():
+    """Test unfiltered history queries use the precomputed full-scan SQL."""
+    from src.persistence.database import _build_history_query, _FULL_HISTORY_SQL
+    
+    for table, sql in _FULL_HISTORY_SQL.items():
+        query, params = _build_history_query(table, None, None, None, None)
+        assert query is sql
+        assert params == []
+        assert 'WHERE' not in query
+
+
+def test_database_rejects_unknown_mode():
+    """Test unknown connection modes are rejected."""
+    with pytest.raises(ValueError):
+        Database(Path("unused.db"), mode='turbo')
@@ -0,0 +1,32 @@
+"""Tests for effect type enum and helpers."""
+
+import pytest
+
+from src.systems.generics.effect_type import (
+    EffectType,
+    apply_effect,
+    get_effect_type_by_id
+)
+
+
+def test_apply_effect_dispatches_by_type():
+    """Test effects are applied according to their type and direction."""
+    assert apply_effect(100.0, EffectType.PERCENTAGE, 0.3, 'decrease') == pytest.approx(70.0)
+    assert apply_effect(100.0, EffectType.PERCENTAGE, 0.5, 'increase') == pytest.approx(150.0)
+    assert apply_effect(100.0, EffectType.DIRECT, 25.0, 'decrease') == pytest.approx(75.0)
+    assert apply_effect(100.0, EffectType.DIRECT, 25.0, 'increase') == pytest.approx(125.0)
+
+
+def test_apply_effect_invalid_arguments():
+    """Test unknown effect types and directions raise ValueError."""
+    with pytest.raises(ValueError):
+        apply_effect(100.0, 'percentage', 0.3, 'decrease')
+    with pytest.raises(ValueError):
+        apply_effect(100.0, EffectType.DIRECT, 25.0, 'sideways')
+
+
+def test_get_effect_type_by_id():
+    """Test getting effect type by label and enum name."""
+    assert get_effect_type_by_id('percentage') == EffectType.PERCENTAGE
+    assert get_effect_type_by_id('DIRECT') == EffectType.DIRECT
+    assert get_effect_type_by_id('invalid') is None
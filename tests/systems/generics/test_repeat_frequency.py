@@ -26,6 +26,8 @@ def test_repeat_frequency_to_timedelta():
     assert RepeatFrequency.WEEKLY.to_timedelta() == timedelta(weeks=1)
     assert RepeatFrequency.MONTHLY.to_timedelta() == timedelta(days=30)
     assert RepeatFrequency.YEARLY.to_timedelta() == timedelta(days=365)
+    assert RepeatFrequency.WEEKLY.to_timedelta(3) == timedelta(weeks=3)
+    assert RepeatFrequency.MONTHLY.to_timedelta(2) == timedelta(days=60)
 
 
 def test_get_repeat_frequency_by_id():
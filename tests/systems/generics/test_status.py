@@ -0,0 +1,50 @@
+"""Tests for status enum and helpers."""
+
+import pytest
+
+from src.systems.generics.status import (
+    StatusLevel,
+    get_status_by_id,
+    get_all_status_levels
+)
+
+
+def test_get_status_by_id():
+    """Test getting status by label and enum name, case-insensitively."""
+    assert get_status_by_id('depleted') == StatusLevel.DEPLETED
+    assert get_status_by_id('at_risk') == StatusLevel.AT_RISK
+    assert get_status_by_id('AT_RISK') == StatusLevel.AT_RISK
+    assert get_status_by_id('Abundant') == StatusLevel.ABUNDANT
+    assert get_status_by_id('invalid') is None
+    assert get_status_by_id('') is None
+
+
+def test_get_all_status_levels():
+    """Test all status levels are returned ordered by level."""
+    all_levels = get_all_status_levels()
+    
+    assert [status.level for status in all_levels] == [0, 1, 2, 3, 4]
+    assert [status.value for status in all_levels] == [0, 1, 2, 3, 4]
+    assert [status.color for status in all_levels] == ['black', 'red', 'yellow', 'blue', 'green']
+    
+    # Callers get their own list
+    all_levels.clear()
+    assert len(get_all_status_levels()) == 5
+
+
+def test_calculate_resource_status_thresholds():
+    """Test status buckets at and around each threshold."""
+    from src.systems.generics.status import calculate_resource_status
+    
+    assert calculate_resource_status(0.0, 1000.0) == StatusLevel.DEPLETED
+    assert calculate_resource_status(49.0, 1000.0) == StatusLevel.DEPLETED
+    assert calculate_resource_status(50.0, 1000.0) == StatusLevel.AT_RISK
+    assert calculate_resource_status(200.0, 1000.0) == StatusLevel.MODERATE
+    assert calculate_resource_status(799.0, 1000.0) == StatusLevel.SUFFICIENT
+    assert calculate_resource_status(800.0, 1000.0) == StatusLevel.ABUNDANT
+    
+    assert calculate_resource_status(-5.0) == StatusLevel.DEPLETED
+    assert calculate_resource_status(99.0) == StatusLevel.AT_RISK
+    assert calculate_resource_status(100.0) == StatusLevel.MODERATE
+    assert calculate_resource_status(1999.0) == StatusLevel.SUFFICIENT
+    assert calculate_resource_status(2000.0) == StatusLevel.ABUNDANT
@@ -112,3 +112,32 @@ def test_death_system_handles_no_wealth_component():
     
     # Entity should be removed
     assert world_state.get_entity(entity.entity_id) is None
+
+
+def test_death_system_returns_resources_of_all_deaths_in_a_tick():
+    """Test resources of every entity dying in a tick are returned together."""
+    system = DeathSystem()
+    
+    simulation_time = SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42)
+    world_state = WorldState(
+        simulation_time=simulation_time,
+        config_snapshot={},
+        rng_seed=42
+    )
+    
+    money_resource = Resource('money', 'Money', 1000.0, finite=True)
+    world_state.add_resource(money_resource)
+    food_resource = Resource('food', 'Food', 90.0, max_capacity=100.0)
+    world_state.add_resource(food_resource)
+    
+    for money, food in ((500.0, 5.0), (250.0, 0.0), (0.0, 20.0)):
+        entity = world_state.create_entity()
+        entity.add_component(HealthComponent(health=0.0))  # Dead
+        entity.add_component(WealthComponent(resources={'money': money, 'food': food}))
+    
+    system.init(world_state, {'enabled': True})
+    system.on_tick(world_state, datetime(2024, 1, 1, 0, 0, 0))
+    
+    assert world_state.get_entity_count() == 0
+    assert money_resource.current_amount == 1750.0
+    assert food_resource.current_amount == 100.0  # Capped at max capacity
@@ -198,3 +198,88 @@ def test_death_system_disabled():
     
     # Entity should still exist (not processed)
     assert world_state.get_entity(entity.entity_id) is not None
+
+
+def test_death_system_fetches_modifiers_once_per_tick():
+    """Test modifiers are looked up once per tick, not once per elderly entity."""
+    system = DeathSystem()
+    
+    simulation_time = SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42)
+    world_state = WorldState(
+        simulation_time=simulation_time,
+        config_snapshot={},
+        rng_seed=42
+    )
+    
+    for _ in range(5):
+        entity = world_state.create_entity()
+        entity.add_component(HealthComponent(health=1.0))
+        entity.add_component(AgeComponent(birth_date=datetime(1930, 1, 1)))
+    
+    system.init(world_state, {'enabled': True})
+    
+    with patch.object(
+        world_state, 'get_modifiers_for_system', wraps=world_state.get_modifiers_for_system
+    ) as get_modifiers:
+        system.on_tick(world_state, datetime(2024, 1, 1, 0, 0, 0))
+    
+    get_modifiers.assert_called_once_with('DeathSystem')
+
+
+def test_death_system_age_curve_reset_on_init():
+    """Test cached curve terms are rebuilt when the curve parameters change."""
+    system = DeathSystem()
+    system.init(None, {})
+    
+    assert system._age_death_chance(90.0, 0.0001, []) == pytest.approx(
+        (0.0001 + 0.00001 * 15) * 1.1 ** 5
+    )
+    assert 90.0 in system._age_curve
+    
+    system.init(None, {'age_mortality': {'chance_multiplier_per_year': 2.0}})
+    assert system._age_curve == {}
+    assert system._age_death_chance(90.0, 0.0001, []) == pytest.approx(
+        (0.0001 + 0.00001 * 15) * 2.0 ** 5
+    )
+
+
+def test_death_system_min_days_for_age():
+    """Test the birth-date cutoff matches AgeComponent's age in years."""
+    from src.systems.human.death import _min_days_for_age
+    
+    for age in (0.0, 70.0, 85.5, 100.0):
+        days = _min_days_for_age(age)
+        assert days / 365.25 >= age
+        assert (days - 1) / 365.25 < age
+    
+    current = datetime(2024, 1, 1, 0, 0, 0)
+    days = _min_days_for_age(70.0)
+    assert AgeComponent(birth_date=current - timedelta(days=days)).get_age_years(current) >= 70.0
+    assert AgeComponent(birth_date=current - timedelta(days=days - 1)).get_age_years(current) < 70.0
+
+
+def test_death_system_skips_roll_for_zero_chance():
+    """Test no death roll is drawn when the age death chance is zero."""
+    system = DeathSystem()
+    
+    simulation_time = SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42)
+    world_state = WorldState(
+        simulation_time=simulation_time,
+        config_snapshot={},
+        rng_seed=42
+    )
+    
+    for _ in range(3):
+        entity = world_state.create_entity()
+        entity.add_component(HealthComponent(health=1.0))
+        entity.add_component(AgeComponent(birth_date=datetime(1930, 1, 1)))
+    
+    system.init(world_state, {'enabled': True})
+    world_state.rng = Mock(wraps=world_state.rng)
+    
+    with patch.object(system, '_age_death_chance', return_value=0.0):
+        system.on_tick(world_state, datetime(2024, 1, 1, 0, 0, 0))
+    
+    # Only the base chance is drawn for each elderly entity
+    assert world_state.rng.random.call_count == 3
+    assert world_state.get_entity_count() == 3
@@ -188,6 +188,10 @@ def test_entity_history_system_no_entities():
         # Should not crash with no entities
         system.on_tick(world_state, datetime(2024, 1, 1, 0, 0, 0))
         
+        # Nothing to write, so no connection was opened
+        assert system._db is None
+        assert not db_path.exists()
+        
         # No history should be saved (no entities)
         from src.persistence.database import Database
         with Database(db_path) as db:
@@ -222,3 +226,115 @@ def test_entity_history_system_disabled():
         with Database(db_path) as db:
             history = db.get_entity_history()
             assert len(history) == 0
+
+
+def test_entity_history_system_background_writes():
+    """Test history rows are written by the background writer."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        
+        system = EntityHistorySystem()
+        
+        simulation_time = SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42)
+        world_state = WorldState(
+            simulation_time=simulation_time,
+            config_snapshot={'simulation': {'db_path': str(db_path)}},
+            rng_seed=42
+        )
+        
+        entity = world_state.create_entity(entity_id="entity-1")
+        entity.add_component(NeedsComponent(hunger=0.5))
+        entity.add_component(HealthComponent(health=0.4))
+        
+        config = {
+            'enabled': True,
+            'frequency': 'hourly',
+            'rate': 1,
+            'db_path': str(db_path),
+            'background_writes': True
+        }
+        system.init(world_state, config)
+        
+        system.on_tick(world_state, datetime(2024, 1, 1, 0, 0, 0))
+        system.on_tick(world_state, datetime(2024, 1, 1, 1, 0, 0))
+        system.shutdown(world_state)
+        
+        from src.persistence.database import Database
+        with Database(db_path) as db:
+            history = db.get_entity_history()
+            assert [record['tick'] for record in history] == [0, 0]
+            assert history[0]['avg_hunger'] == pytest.approx(0.5)
+            assert history[0]['entities_at_risk'] == 1
+            assert json.loads(history[0]['component_counts']) == {'Needs': 1, 'Health': 1}
+
+
+def test_entity_history_system_respects_component_types():
+    """Test untracked component types are skipped in saved metrics."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        
+        system = EntityHistorySystem()
+        
+        simulation_time = SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42)
+        world_state = WorldState(
+            simulation_time=simulation_time,
+            config_snapshot={'simulation': {'db_path': str(db_path)}},
+            rng_seed=42
+        )
+        
+        entity = world_state.create_entity(entity_id="entity-1")
+        entity.add_component(NeedsComponent(hunger=0.5))
+        entity.add_component(HealthComponent(health=0.4))
+        entity.add_component(EmploymentComponent(job_type="farmer"))
+        
+        config = {
+            'enabled': True,
+            'frequency': 'hourly',
+            'rate': 1,
+            'db_path': str(db_path),
+            'component_types': ['Needs']
+        }
+        system.init(world_state, config)
+        system.on_tick(world_state, datetime(2024, 1, 1, 0, 0, 0))
+        
+        from src.persistence.database import Database
+        with Database(db_path) as db:
+            record = db.get_entity_history()[0]
+            assert record['total_entities'] == 1
+            assert record['avg_hunger'] == pytest.approx(0.5)
+            assert record['avg_health'] is None
+            assert record['entities_at_risk'] == 0
+            assert record['employed_count'] == 0
+            assert json.loads(record['component_counts']) == {'Needs': 1}
+
+
+def test_entity_history_system_reuses_analytics_connection():
+    """Test synchronous saves keep one write-tuned connection across saves."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        
+        system = EntityHistorySystem()
+        
+        simulation_time = SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42)
+        world_state = WorldState(
+            simulation_time=simulation_time,
+            config_snapshot={},
+            rng_seed=42
+        )
+        world_state.create_entity().add_component(NeedsComponent())
+        
+        config = {'enabled': True, 'frequency': 'hourly', 'rate': 1, 'db_path': str(db_path)}
+        system.init(world_state, config)
+        
+        system.on_tick(world_state, datetime(2024, 1, 1, 0, 0, 0))
+        db = system._db
+        system.on_tick(world_state, datetime(2024, 1, 1, 1, 0, 0))
+        assert system._db is db
+        assert db.mode == 'analytics_append'
+        
+        from src.persistence.database import Database
+        with Database(db_path) as reader:
+            assert len(reader.get_entity_history()) == 2
+        
+        system.shutdown(world_state)
+        assert system._db is None
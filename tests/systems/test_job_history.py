@@ -1,5 +1,6 @@
 """Tests for job history system."""
 
+import json
 import pytest
 from datetime import datetime
 from pathlib import Path
@@ -130,3 +131,217 @@ def test_job_history_system_respects_frequency():
     finally:
         if db_path.exists():
             db_path.unlink()
+
+
+def test_job_history_records_decode_lazily():
+    """Test job history JSON fields are decoded only when accessed."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        
+        with Database(db_path) as db:
+            db.save_job_history(
+                timestamp=datetime(2024, 1, 1).isoformat(),
+                tick=0,
+                total_employed=2,
+                employment_rate=50.0,
+                job_distribution={'farmer': 2},
+                avg_salary_by_job={'farmer': 10.0},
+                total_salary_paid=20.0,
+                job_openings={'farmer': 1},
+                avg_payment_by_job={'farmer': {'money': 10.0, 'food': 2.0}},
+                total_payment_by_resource={'money': 20.0, 'food': 4.0}
+            )
+            
+            record = db.get_job_history(lazy=True)[0]
+            assert record['total_employed'] == 2
+            assert record._parsed == {}
+            
+            assert record['job_distribution'] == {'farmer': 2}
+            assert 'job_openings' not in record._parsed
+            
+            assert record['avg_salary_by_job'] == {'farmer': 10.0}
+            assert record['avg_payment_by_job'] == {'farmer': {'money': 10.0, 'food': 2.0}}
+            assert record['total_payment_by_resource'] == {'money': 20.0, 'food': 4.0}
+            
+            materialized = record.materialize_all()
+            assert isinstance(materialized, dict)
+            assert materialized['job_openings'] == {'farmer': 1}
+            assert set(materialized) == set(record)
+            
+            # Records are plain, fully decoded dicts unless lazy is requested
+            default = db.get_job_history()[0]
+            assert type(default) is dict
+            assert default == materialized
+            default['note'] = 'editable'
+            json.dumps(default)
+
+
+def test_job_history_employment_stats():
+    """Test employment stats aggregate workers by job type and resource."""
+    system = JobHistorySystem()
+    
+    world_state = WorldState(
+        simulation_time=SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42),
+        config_snapshot={},
+        rng_seed=42
+    )
+    
+    payments = [
+        ('farmer', {'money': 100.0, 'food': 2.0}),
+        ('farmer', {'money': 120.0}),
+        ('miner', {'money': 200.0}),
+        (None, {}),
+    ]
+    for job_type, payment_resources in payments:
+        entity = world_state.create_entity()
+        entity.add_component(EmploymentComponent(job_type=job_type, payment_resources=payment_resources))
+    world_state.create_entity()  # No Employment component
+    
+    stats = system._calculate_employment_stats(world_state, datetime(2024, 1, 1))
+    
+    assert stats['total_employed'] == 3
+    assert stats['employment_rate'] == pytest.approx(60.0)
+    assert stats['job_distribution'] == {'farmer': 2, 'miner': 1}
+    assert stats['avg_payment_by_job'] == {
+        'farmer': {'money': 110.0, 'food': 2.0},
+        'miner': {'money': 200.0},
+    }
+    assert stats['avg_salary_by_job'] == {'farmer': 110.0, 'miner': 200.0}
+    assert stats['total_payment_by_resource'] == {'money': 420.0, 'food': 2.0}
+    assert stats['total_salary_paid'] == pytest.approx(422.0)
+
+
+def test_job_history_job_openings():
+    """Test job openings follow the current job definitions."""
+    from unittest.mock import Mock
+    
+    system = JobHistorySystem()
+    
+    world_state = WorldState(
+        simulation_time=SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42),
+        config_snapshot={},
+        rng_seed=42
+    )
+    job_system = Mock()
+    job_system.system_id = 'JobSystem'
+    job_system.jobs = {'farmer': {'max_percentage': 50.0}, 'miner': {'max_percentage': 29.0}}
+    world_state.register_system(job_system)
+    
+    for _ in range(10):
+        entity = world_state.create_entity()
+        entity.add_component(EmploymentComponent(job_type='farmer', payment_resources={'money': 1.0}))
+    
+    stats = system._calculate_employment_stats(world_state, datetime(2024, 1, 1))
+    assert stats['job_openings'] == {'farmer': 0, 'miner': 2}
+    
+    job_system.jobs['guard'] = {'max_percentage': 10.0}
+    stats = system._calculate_employment_stats(world_state, datetime(2024, 1, 1))
+    assert stats['job_openings'] == {'farmer': 0, 'miner': 2, 'guard': 1}
+    
+    # In-place edits and same-sized replacement dicts are picked up too
+    job_system.jobs['guard']['max_percentage'] = 30.0
+    stats = system._calculate_employment_stats(world_state, datetime(2024, 1, 1))
+    assert stats['job_openings']['guard'] == 3
+    
+    job_system.jobs = {'farmer': {'max_percentage': 50.0}, 'miner': {'max_percentage': 40.0}, 'cook': {'max_percentage': 20.0}}
+    stats = system._calculate_employment_stats(world_state, datetime(2024, 1, 1))
+    assert stats['job_openings'] == {'farmer': 0, 'miner': 4, 'cook': 2}
+
+
+def test_job_history_reuses_employment_scan_until_versions_change():
+    """Test employment aggregates are rescanned only after hires/fires or population changes."""
+    from types import SimpleNamespace
+    
+    system = JobHistorySystem()
+    
+    world_state = WorldState(
+        simulation_time=SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42),
+        config_snapshot={},
+        rng_seed=42
+    )
+    job_system = SimpleNamespace(system_id='JobSystem', jobs={}, employment_version=0)
+    world_state.register_system(job_system)
+    
+    employments = []
+    for _ in range(4):
+        entity = world_state.create_entity()
+        employment = EmploymentComponent(job_type='farmer', payment_resources={'money': 10.0})
+        entity.add_component(employment)
+        employments.append(employment)
+    
+    stats = system._calculate_employment_stats(world_state, datetime(2024, 1, 1))
+    assert stats['total_employed'] == 4
+    
+    # Unreported change: the previous scan is reused
+    employments[0].job_type = None
+    stats = system._calculate_employment_stats(world_state, datetime(2024, 1, 1))
+    assert stats['total_employed'] == 4
+    
+    # JobSystem reports the change: rescanned
+    job_system.employment_version += 1
+    stats = system._calculate_employment_stats(world_state, datetime(2024, 1, 1))
+    assert stats['total_employed'] == 3
+    assert stats['employment_rate'] == pytest.approx(75.0)
+    
+    # Population change: rescanned
+    employments[1].payment_resources = {'money': 30.0}
+    world_state.create_entity()
+    stats = system._calculate_employment_stats(world_state, datetime(2024, 1, 1))
+    assert stats['total_employed'] == 3
+    assert stats['employment_rate'] == pytest.approx(60.0)
+    assert stats['avg_salary_by_job'] == {'farmer': pytest.approx(50.0 / 3)}
+
+
+def test_job_system_bumps_employment_version_on_hire():
+    """Test JobSystem reports hires through its employment version."""
+    from src.systems.human.job import JobSystem
+    
+    job_system = JobSystem()
+    world_state = WorldState(
+        simulation_time=SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42),
+        config_snapshot={},
+        rng_seed=42
+    )
+    entity = world_state.create_entity()
+    
+    job_system._hire_entity(
+        world_state, datetime(2024, 1, 1), entity, 'farmer',
+        {'name': 'Farmer', 'payment': {'money': 100.0}}
+    )
+    assert job_system.employment_version == 1
+    assert entity.get_component('Employment').job_type == 'farmer'
+
+
+def test_job_history_system_background_writes():
+    """Test job history records are written by the background writer."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        
+        system = JobHistorySystem()
+        
+        world_state = WorldState(
+            simulation_time=SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42),
+            config_snapshot={},
+            rng_seed=42
+        )
+        for _ in range(2):
+            entity = world_state.create_entity()
+            entity.add_component(EmploymentComponent(job_type='farmer', payment_resources={'money': 50.0}))
+        
+        config = {
+            'enabled': True,
+            'frequency': 'monthly',
+            'rate': 1,
+            'db_path': str(db_path),
+            'background_writes': True
+        }
+        system.init(world_state, config)
+        
+        system.on_tick(world_state, datetime(2024, 1, 1, 0, 0, 0))
+        system.on_tick(world_state, datetime(2024, 2, 1, 0, 0, 0))
+        system.shutdown(world_state)
+        
+        with Database(db_path) as db:
+            history = db.get_job_history()
+            assert [record['total_employed'] for record in history] == [2, 2]
+            assert history[0]['avg_salary_by_job'] == {'farmer': 50.0}
@@ -1,7 +1,7 @@
 """Tests for job system."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 import tempfile
 
@@ -409,6 +409,196 @@ def test_job_system_dynamic_limits():
     assert farmer_count <= 1  # 10% of 10 entities = 1 max
 
 
+def test_job_system_worker_counts_follow_changes():
+    """Test cached worker counts follow hires, job losses and outside changes."""
+    system = JobSystem()
+    world_state = WorldState(
+        simulation_time=SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42),
+        config_snapshot={},
+        rng_seed=42
+    )
+    
+    farmer = world_state.create_entity()
+    farmer.add_component(EmploymentComponent(job_type='farmer'))
+    assert system._count_workers(world_state, 'farmer') == 1
+    assert system._count_workers(world_state, 'teacher') == 0
+    
+    # Job changes made by the system update the counts in place
+    system._set_job(world_state, farmer.get_component('Employment'), 'teacher')
+    assert system._worker_counts_current(world_state)
+    assert system._get_worker_counts(world_state) == {'farmer': 0, 'teacher': 1}
+    
+    # Components added outside the system trigger a rescan
+    other = world_state.create_entity()
+    other.add_component(EmploymentComponent(job_type='farmer'))
+    assert system._count_workers(world_state, 'farmer') == 1
+    
+    world_state.remove_entity(farmer.entity_id)
+    assert system._count_workers(world_state, 'teacher') == 0
+
+
+def test_job_system_hiring_is_seeded():
+    """Test hiring draws come from the world state RNG only."""
+    import random
+    from src.systems.human.job import _hiring_score
+    
+    def hired_ids(global_seed):
+        random.seed(global_seed)
+        system = JobSystem()
+        world_state = WorldState(
+            simulation_time=SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=7),
+            config_snapshot={},
+            rng_seed=7
+        )
+        world_state.add_resource(Resource('money', 'Money', 10000.0, finite=True))
+        for i in range(20):
+            entity = world_state.create_entity(entity_id=f"e{i}")
+            entity.add_component(AgeComponent(
+                birth_date=datetime(2000, 1, 1, 0, 0, 0),
+                current_date=datetime(2024, 1, 1, 0, 0, 0)
+            ))
+        system.init(world_state, {
+            'enabled': True,
+            'base_hiring_chance': 1.0,
+            'jobs': {'teacher': {'name': 'Teacher', 'max_percentage': 25.0}}
+        })
+        system.on_tick(world_state, datetime(2024, 1, 1, 0, 0, 0))
+        return [
+            e.entity_id for e in world_state.get_all_entities().values()
+            if e.get_component('Employment') and e.get_component('Employment').is_employed()
+        ]
+    
+    assert hired_ids(1) == hired_ids(2)
+    
+    assert _hiring_score(None, 'farming', 0.7, 0.1) == 0.5
+    skills = SkillsComponent(charisma=0.5, job_skills={'farming': 1.0})
+    assert _hiring_score(skills, 'farming', 0.7, 0.1) == pytest.approx(0.75 / 0.8)
+    assert _hiring_score(skills, 'farming', 0.0, 0.0) == 0.5
+
+
+def test_job_system_frequency_masks():
+    """Test per-tick frequency bitmasks and parsed job payment masks."""
+    from src.systems.human.job import _active_frequencies, _frequency_mask, _should_run_on_frequency
+    
+    monday_new_year = _active_frequencies(datetime(2024, 1, 1, 0, 0, 0))
+    assert all(monday_new_year & _frequency_mask(f) for f in ('hourly', 'daily', 'weekly', 'monthly', 'yearly'))
+    assert _active_frequencies(datetime(2024, 2, 1, 5, 0, 0)) == _frequency_mask('hourly')
+    assert _active_frequencies(datetime(2024, 2, 1, 0, 0, 0)) == (
+        _frequency_mask('hourly') | _frequency_mask('daily') | _frequency_mask('monthly')
+    )
+    assert not _should_run_on_frequency('fortnightly', datetime(2024, 1, 1, 0, 0, 0))
+    
+    system = JobSystem()
+    system.production_frequency = 'monthly'
+    producer = system._parse_job_config('farmer', {'production': {'frequency': 'weekly'}})
+    assert producer['production']['frequency_mask'] == _frequency_mask('weekly')
+    assert producer['payment_frequency_mask'] == _frequency_mask('weekly')
+    assert system._parse_job_config('teacher', {})['payment_frequency_mask'] == _frequency_mask('monthly')
+
+def test_job_system_salary_review_eligibility():
+    """Test raise reviews honour the yearly and six-month boundaries."""
+    system = JobSystem()
+    world_state = WorldState(
+        simulation_time=SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42),
+        config_snapshot={},
+        rng_seed=42
+    )
+    system.init(world_state, {'yearly_raise_probability': 1.0, 'six_month_raise_probability': 1.0})
+    now = datetime(2025, 6, 1, 12, 0, 0)
+    
+    def review(hire_days_ago, raise_days_ago=None):
+        employment = EmploymentComponent(
+            job_type='teacher',
+            payment_resources={'money': 100.0},
+            hire_date=now - timedelta(days=hire_days_ago),
+            last_raise_date=None if raise_days_ago is None else now - timedelta(days=raise_days_ago)
+        )
+        system._review_salaries(world_state, now, [(Entity(), employment)])
+        return employment.payment_resources['money'] > 100.0
+    
+    assert not review(179)
+    assert review(180)  # Six months
+    assert review(366)  # A year (days / 365.25 >= 1)
+    assert not review(400, raise_days_ago=365)  # Raised within the year
+    assert review(400, raise_days_ago=366)
+    assert not review(200, raise_days_ago=179)
+
+
+def test_job_system_payment_terms():
+    """Test payment bounds are resolved once when a job is parsed."""
+    system = JobSystem()
+    parsed = system._parse_job_config('farmer', {
+        'payment': {'money': 100.0, 'food': 2.0},
+        'min_payment': {'money': 50.0},
+        'max_payment_cap': {'money': 130.0}
+    })
+    assert parsed['payment_terms'] == (('money', 100.0, 50.0, 130.0), ('food', 2.0, None, None))
+    
+    world_state = WorldState(
+        simulation_time=SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42),
+        config_snapshot={},
+        rng_seed=42
+    )
+    entity = world_state.create_entity()
+    entity.add_component(SkillsComponent(charisma=1.0, job_skills={'general': 1.0}))
+    system._hire_entity(world_state, datetime(2024, 1, 1), entity, 'farmer', parsed)
+    
+    employment = entity.get_component('Employment')
+    assert employment.payment_resources == {'money': 130.0, 'food': pytest.approx(2.6)}
+    assert employment.max_payment_cap == {'money': 130.0}
+
+
+def test_job_system_pays_in_bulk_or_in_order():
+    """Test salaries are paid together when covered, in order when not."""
+    def pay(money):
+        system = JobSystem()
+        world_state = WorldState(
+            simulation_time=SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42),
+            config_snapshot={},
+            rng_seed=42
+        )
+        world_state.add_resource(Resource('money', 'Money', money, finite=True))
+        system.init(world_state, {'jobs': {'teacher': {'name': 'Teacher', 'payment': {'money': 100.0}}}})
+        
+        employments = []
+        for amount in (100.0, 150.0, 50.0):
+            employment = EmploymentComponent(job_type='teacher', payment_resources={'money': amount})
+            world_state.create_entity().add_component(employment)
+            employments.append(employment)
+        
+        system._pay_salaries(world_state, datetime(2024, 2, 1, 0, 0, 0))
+        wealth = [
+            e.get_component('Wealth').get_amount('money') if e.get_component('Wealth') else 0.0
+            for e in world_state.get_all_entities().values()
+        ]
+        return world_state.get_resource('money').current_amount, wealth, [e.job_type for e in employments]
+    
+    assert pay(300.0) == (0.0, [100.0, 150.0, 50.0], ['teacher', 'teacher', 'teacher'])
+    assert pay(200.0) == (50.0, [100.0, 0.0, 50.0], ['teacher', None, 'teacher'])
+
+
+def test_job_system_skips_hiring_without_chance_or_candidates():
+    """Test job filling returns before drawing randomness when no one can be hired."""
+    system = JobSystem()
+    world_state = WorldState(
+        simulation_time=SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42),
+        config_snapshot={},
+        rng_seed=42
+    )
+    for _ in range(10):
+        world_state.create_entity()
+    job_config = system._parse_job_config('teacher', {'name': 'Teacher', 'min_age': 18})
+    state = world_state.rng.getstate()
+    
+    system.base_hiring_chance = 0.3
+    system._fill_job_positions(world_state, datetime(2024, 1, 1), 'teacher', job_config, [(Entity(), 16.0, None)])
+    system.base_hiring_chance = 0.0
+    system._fill_job_positions(world_state, datetime(2024, 1, 1), 'teacher', job_config, [(Entity(), 30.0, None)])
+    
+    assert world_state.rng.getstate() == state
+    assert system._count_workers(world_state, 'teacher') == 0
+
+
 # Mock class for testing
 class Mock:
     def __init__(self, **kwargs):
@@ -6,7 +6,7 @@ from pathlib import Path
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 
-from src.systems.analytics.history import ResourceHistorySystem, _should_save_history
+from src.systems.analytics.history import ResourceHistorySystem, _next_history_save_at, _should_save_history
 from src.core.world_state import WorldState
 from src.core.time import SimulationTime
 from src.models.resource import Resource
@@ -43,6 +43,7 @@ def test_history_system_init_with_config():
     assert system.frequency == 'weekly'
     assert system.rate == 2
     assert system.resources == ['food', 'water']
+    assert system._tracked == frozenset({'food', 'water'})
 
 
 def test_history_system_init_disabled():
@@ -267,3 +268,117 @@ def test_history_system_disabled():
         with Database(db_path) as db:
             history = db.get_all_resource_history()
             assert len(history) == 0
+
+
+def test_history_system_reuses_analytics_connection():
+    """Test system keeps one write-tuned connection across saves."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        
+        system = ResourceHistorySystem()
+        
+        simulation_time = SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42)
+        world_state = WorldState(
+            simulation_time=simulation_time,
+            config_snapshot={},
+            rng_seed=42
+        )
+        world_state.add_resource(Resource('food', 'Food', 1000.0))
+        
+        config = {'enabled': True, 'frequency': 'hourly', 'rate': 1, 'db_path': str(db_path)}
+        system.init(world_state, config)
+        
+        system.on_tick(world_state, datetime(2024, 1, 1, 0, 0, 0))
+        db = system._db
+        system.on_tick(world_state, datetime(2024, 1, 1, 1, 0, 0))
+        assert system._db is db
+        assert db.mode == 'analytics_append'
+        
+        journal_mode = db._connection.execute("PRAGMA journal_mode").fetchone()[0]
+        assert journal_mode == 'wal'
+        
+        # Rows are committed after each save and visible to other connections
+        from src.persistence.database import Database
+        with Database(db_path) as reader:
+            assert len(reader.get_all_resource_history()) == 2
+        
+        system.shutdown(world_state)
+        assert system._db is None
+
+
+def test_next_history_save_at():
+    """Test next-save lower bound for each frequency."""
+    last_save = datetime(2024, 11, 15, 0, 0, 0)
+    
+    assert _next_history_save_at('hourly', 3, last_save) == datetime(2024, 11, 15, 3, 0, 0)
+    assert _next_history_save_at('daily', 2, last_save) == datetime(2024, 11, 17, 0, 0, 0)
+    assert _next_history_save_at('weekly', 1, last_save) == datetime(2024, 11, 22, 0, 0, 0)
+    assert _next_history_save_at('monthly', 2, last_save) == datetime(2025, 1, 1, 0, 0, 0)
+    assert _next_history_save_at('yearly', 1, last_save) == datetime(2025, 1, 1, 0, 0, 0)
+    
+    # Never later than the first tick _should_save_history accepts
+    assert _should_save_history('monthly', 2, last_save, datetime(2025, 1, 1, 0, 0, 0)) == True
+    assert _should_save_history('daily', 2, last_save, datetime(2024, 11, 17, 0, 0, 0)) == True
+
+
+def test_next_history_save_at_is_a_save_time():
+    """Test the next-save bound is always itself a save time."""
+    last_saves = {
+        'hourly': [datetime(2024, 2, 28, 23, 0, 0), datetime(2024, 12, 31, 5, 0, 0)],
+        'daily': [datetime(2024, 2, 28, 0, 0, 0), datetime(2024, 12, 31, 0, 0, 0)],
+        'weekly': [datetime(2024, 1, 1, 0, 0, 0), datetime(2024, 12, 30, 0, 0, 0)],
+        'monthly': [datetime(2024, 1, 1, 0, 0, 0), datetime(2024, 12, 1, 0, 0, 0)],
+        'yearly': [datetime(2024, 1, 1, 0, 0, 0)],
+    }
+    
+    for frequency, saves in last_saves.items():
+        for last_save in saves:
+            for rate in (1, 2, 13):
+                next_save = _next_history_save_at(frequency, rate, last_save)
+                assert _should_save_history(frequency, rate, last_save, next_save), (frequency, rate, last_save)
+
+
+def test_should_save_history_across_year_and_day_boundaries():
+    """Test periods elapsed is counted correctly across calendar boundaries."""
+    assert _should_save_history('hourly', 2, datetime(2024, 12, 31, 23, 0, 0), datetime(2025, 1, 1, 1, 0, 0))
+    assert not _should_save_history('hourly', 3, datetime(2024, 12, 31, 23, 0, 0), datetime(2025, 1, 1, 1, 0, 0))
+    assert _should_save_history('weekly', 1, datetime(2024, 12, 30, 0, 0, 0), datetime(2025, 1, 6, 0, 0, 0))
+    assert not _should_save_history('weekly', 2, datetime(2024, 12, 30, 0, 0, 0), datetime(2025, 1, 6, 0, 0, 0))
+    assert _should_save_history('monthly', 2, datetime(2024, 12, 1, 0, 0, 0), datetime(2025, 2, 1, 0, 0, 0))
+    assert not _should_save_history('yearly', 2, datetime(2024, 1, 1, 0, 0, 0), datetime(2025, 1, 1, 0, 0, 0))
+
+
+def test_history_system_background_writes():
+    """Test resource history rows are written by the background writer."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        
+        system = ResourceHistorySystem()
+        
+        simulation_time = SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42)
+        world_state = WorldState(
+            simulation_time=simulation_time,
+            config_snapshot={},
+            rng_seed=42
+        )
+        world_state.add_resource(Resource('food', 'Food', 1000.0))
+        world_state.add_resource(Resource('water', 'Water', 500.0))
+        
+        config = {
+            'enabled': True,
+            'frequency': 'hourly',
+            'rate': 1,
+            'db_path': str(db_path),
+            'background_writes': True
+        }
+        system.init(world_state, config)
+        
+        system.on_tick(world_state, datetime(2024, 1, 1, 0, 0, 0))
+        system.on_tick(world_state, datetime(2024, 1, 1, 1, 0, 0))
+        system.shutdown(world_state)
+        assert system._db is None
+        
+        from src.persistence.database import Database
+        with Database(db_path) as db:
+            history = db.get_all_resource_history()
+            assert sorted(h['resource_id'] for h in history) == ['food', 'food', 'water', 'water']
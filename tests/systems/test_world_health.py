@@ -0,0 +1,190 @@
+"""Tests for world health system."""
+
+import pytest
+from datetime import datetime, timedelta
+
+from src.systems.analytics.world_health import WorldHealthSystem
+from src.core.world_state import WorldState
+from src.core.time import SimulationTime
+from src.models.components.health import HealthComponent
+from src.models.components.needs import NeedsComponent
+
+
+def _make_world_state() -> WorldState:
+    return WorldState(
+        simulation_time=SimulationTime(datetime(2024, 1, 1, 0, 0, 0), rng_seed=42),
+        config_snapshot={},
+        rng_seed=42
+    )
+
+
+def test_world_health_entity_health_average():
+    """Test entity health averages only entities with a Health component."""
+    system = WorldHealthSystem()
+    world_state = _make_world_state()
+    
+    assert system._calculate_entity_health(world_state) == 0.5
+    
+    world_state.create_entity().add_component(HealthComponent(health=0.2))
+    world_state.create_entity().add_component(HealthComponent(health=0.8))
+    world_state.create_entity().add_component(NeedsComponent())
+    
+    assert system._calculate_entity_health(world_state) == pytest.approx(0.5)
+    
+    world_state.create_entity().add_component(HealthComponent(health=1.0))
+    assert system._calculate_entity_health(world_state) == pytest.approx(2.0 / 3.0)
+
+
+def test_world_health_needs_fulfillment():
+    """Test needs fulfillment is the mean of per-entity average fulfillment."""
+    system = WorldHealthSystem()
+    world_state = _make_world_state()
+    
+    assert system._calculate_needs_fulfillment(world_state) == 0.5
+    
+    world_state.create_entity().add_component(NeedsComponent(hunger=0.3, thirst=0.6, rest=0.0))
+    world_state.create_entity().add_component(NeedsComponent(hunger=0.0, thirst=0.0, rest=0.9))
+    world_state.create_entity().add_component(HealthComponent())
+    
+    expected = ((1.0 - 0.9 / 3.0) + (1.0 - 0.9 / 3.0)) / 2.0
+    assert system._calculate_needs_fulfillment(world_state) == pytest.approx(expected)
+
+
+def test_world_health_resource_health_by_status():
+    """Test resource health averages per-status scores."""
+    from src.models.resource import Resource
+    
+    system = WorldHealthSystem()
+    world_state = _make_world_state()
+    
+    assert system._calculate_resource_health(world_state) == 0.5
+    
+    world_state.add_resource(Resource('food', 'Food', 0.0, max_capacity=100.0))  # depleted
+    world_state.add_resource(Resource('water', 'Water', 100.0, max_capacity=100.0))  # abundant
+    world_state.add_resource(Resource('wood', 'Wood', 300.0))  # moderate
+    
+    statuses = [r.status_id for r in world_state.get_all_resources().values()]
+    assert statuses == ['depleted', 'abundant', 'moderate']
+    assert system._calculate_resource_health(world_state) == pytest.approx((0.2 + 1.0 + 0.6) / 3.0)
+
+
+def test_world_health_history_is_bounded():
+    """Test health history keeps only the last max_history values."""
+    from src.systems.analytics.world_health import HealthTrend
+    
+    system = WorldHealthSystem()
+    world_state = _make_world_state()
+    system.init(world_state, {'frequency': 'hourly', 'max_history': 3})
+    
+    world_state.create_entity().add_component(HealthComponent(health=1.0))
+    for hour in range(5):
+        system.on_tick(world_state, datetime(2024, 1, 1, hour, 0, 0))
+    
+    assert len(system.health_history) == 3
+    assert world_state._world_health['trend'] == HealthTrend.STABLE.value
+    
+    system.health_history.extend([0.1, 0.1, 0.1])
+    assert system._calculate_trend(0.5) == HealthTrend.IMPROVING
+
+
+def test_world_health_should_calculate_frequency_and_rate():
+    """Test calculation timing follows period starts and rate."""
+    system = WorldHealthSystem()
+    world_state = _make_world_state()
+    system.init(world_state, {'frequency': 'weekly', 'rate': 2})
+    
+    assert system._should_calculate(datetime(2024, 1, 3, 5, 0, 0))  # First calculation
+    system.last_calculation = datetime(2024, 1, 1, 0, 0, 0)
+    assert not system._should_calculate(datetime(2024, 1, 8, 0, 0, 0))  # One week
+    assert not system._should_calculate(datetime(2024, 1, 15, 1, 0, 0))  # Not a period start
+    assert system._should_calculate(datetime(2024, 1, 15, 0, 0, 0))
+    assert system._calculate_periods_elapsed(
+        datetime(2024, 1, 1), datetime(2024, 3, 1), 'monthly'
+    ) == 2
+    assert system._calculate_periods_elapsed(
+        datetime(2024, 1, 1, 1), datetime(2024, 1, 3, 0), 'daily'
+    ) == 1  # 47 hours
+    
+    system.init(world_state, {'frequency': 'fortnightly'})
+    system.last_calculation = datetime(2024, 1, 1, 0, 0, 0)
+    assert not system._should_calculate(datetime(2024, 2, 1, 0, 0, 0))
+
+
+def test_world_health_next_calculation_bound():
+    """Test on_tick skips until the next possible calculation."""
+    from src.systems.analytics.world_health import _next_calculation_at
+    
+    assert _next_calculation_at('daily', 1, datetime(2024, 1, 3, 8, 0, 0)) == datetime(2024, 1, 4, 0, 0, 0)
+    assert _next_calculation_at('weekly', 1, datetime(2024, 1, 3, 8, 0, 0)) == datetime(2024, 1, 8, 0, 0, 0)
+    assert _next_calculation_at('monthly', 2, datetime(2024, 12, 1, 0, 0, 0)) == datetime(2025, 2, 1, 0, 0, 0)
+    assert _next_calculation_at('fortnightly', 1, datetime(2024, 1, 1)) is None
+    
+    system = WorldHealthSystem()
+    world_state = _make_world_state()
+    system.init(world_state, {'frequency': 'daily', 'rate': 1})
+    world_state.create_entity().add_component(HealthComponent(health=1.0))
+    
+    current = datetime(2024, 1, 1, 8, 0, 0)
+    calculations = []
+    while current < datetime(2024, 1, 4, 0, 0, 0):
+        system.on_tick(world_state, current)
+        calculations.append(system.last_calculation)
+        current += timedelta(hours=1)
+    
+    assert sorted(set(calculations)) == [
+        datetime(2024, 1, 1, 8, 0, 0), datetime(2024, 1, 2, 0, 0, 0), datetime(2024, 1, 3, 0, 0, 0)
+    ]
+    assert system._next_due == datetime(2024, 1, 4, 0, 0, 0)
+
+
+def test_world_health_score_math():
+    """Test composite and population trend scores."""
+    from src.systems.analytics.world_health import _composite_score, _population_trend_score
+    
+    weights = (0.4, 0.3, 0.2, 0.1)
+    assert _composite_score((1.0, 0.5, 0.5, 0.0), weights) == pytest.approx(0.65)
+    assert _composite_score((1.0, 1.0, 1.0, 1.0), (2.0, 2.0, 2.0, 2.0)) == 1.0
+    
+    assert _population_trend_score(100, 100) == 0.5
+    assert _population_trend_score(100, 105) == pytest.approx(0.75)
+    assert _population_trend_score(100, 50) == 0.0
+    assert _population_trend_score(100, 0) == 0.0
+    assert _population_trend_score(0, 10) == 1.0
+
+
+def test_world_health_population_trend_tracks_population():
+    """Test population trend compares against the previous calculation."""
+    system = WorldHealthSystem()
+    world_state = _make_world_state()
+    for _ in range(10):
+        world_state.create_entity()
+    
+    assert system._calculate_population_trend(world_state) == 0.5
+    world_state.create_entity()
+    assert system._calculate_population_trend(world_state) == pytest.approx(1.0)
+    assert system._calculate_population_trend(world_state, 11) == 0.5
+
+
+def test_world_health_stores_components():
+    """Test on_tick stores the score with its subscores."""
+    from src.systems.analytics.world_health import HealthComponents
+    
+    system = WorldHealthSystem()
+    world_state = _make_world_state()
+    system.init(world_state, {'frequency': 'hourly'})
+    world_state.create_entity().add_component(HealthComponent(health=0.8))
+    
+    system.on_tick(world_state, datetime(2024, 1, 1, 0, 0, 0))
+    
+    health = system.get_current_health(world_state)
+    assert isinstance(health['components'], HealthComponents)
+    assert health['components'].entity_health == pytest.approx(0.8)
+    assert health['components']._asdict()['resource_health'] == 0.5
+
+
+def test_world_health_weight_values_follow_config():
+    """Test configured weights are resolved in subscore order."""
+    system = WorldHealthSystem()
+    system.init(_make_world_state(), {'weights': {'resource_health': 0.5, 'needs_fulfillment': 0.0}})
+    
+    assert system._weight_values == (0.4, 0.5, 0.2, 0.0)